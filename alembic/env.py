@@ -35,6 +35,13 @@ import models.wage  # noqa: F401
 import models.law   # noqa: F401
 
 target_metadata = Base.metadata
+
+def include_object(obj, name, type_, reflected, compare_to):
+    # FTS5 검색 인덱스(database/search_index.py)와 테이블 버전 카운터(database/table_versions.py)는
+    # ORM 밖에서 관리 → autogenerate 대상 제외
+    if type_ == "table" and name and (name.startswith("search_index") or name == "table_versions"):
+        return False
+    return True
 # ============================================================
 
 def run_migrations_offline() -> None:
@@ -46,6 +53,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         compare_type=True,      # 컬럼 타입 변경 감지
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -67,6 +75,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
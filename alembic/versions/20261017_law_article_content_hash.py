@@ -0,0 +1,30 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "20261017_law_article_content_hash"
+down_revision = "20251109_knowledge_core"
+branch_labels = None
+depends_on = None
+
+def _has_column(conn, table: str, column: str) -> bool:
+    insp = inspect(conn)
+    if not insp.has_table(table):
+        return False
+    return any(c["name"] == column for c in insp.get_columns(table))
+
+def upgrade():
+    conn = op.get_bind()
+    # law_article는 create_all로 먼저 만들어졌을 수 있음 → 존재할 때만 컬럼 추가
+    # 기존 행은 NULL로 남고, 다음 적재 때 한 번 '변경'으로 잡혀 해시가 채워진다.
+    if inspect(conn).has_table("law_article") and not _has_column(conn, "law_article", "content_hash"):
+        with op.batch_alter_table("law_article") as batch:
+            batch.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    conn = op.get_bind()
+    if _has_column(conn, "law_article", "content_hash"):
+        with op.batch_alter_table("law_article") as batch:
+            batch.drop_column("content_hash")
@@ -0,0 +1,29 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "20261017_sync_jobs_items_skipped"
+down_revision = "20261017_law_article_content_hash"
+branch_labels = None
+depends_on = None
+
+def _has_column(conn, table: str, column: str) -> bool:
+    insp = inspect(conn)
+    if not insp.has_table(table):
+        return False
+    return any(c["name"] == column for c in insp.get_columns(table))
+
+def upgrade():
+    conn = op.get_bind()
+    # 증분 동기화: staging checksum이 같아 건너뛴 레코드 수
+    if inspect(conn).has_table("sync_jobs") and not _has_column(conn, "sync_jobs", "items_skipped"):
+        with op.batch_alter_table("sync_jobs") as batch:
+            batch.add_column(sa.Column("items_skipped", sa.Integer(), nullable=True, server_default="0"))
+
+
+def downgrade():
+    conn = op.get_bind()
+    if _has_column(conn, "sync_jobs", "items_skipped"):
+        with op.batch_alter_table("sync_jobs") as batch:
+            batch.drop_column("items_skipped")
@@ -0,0 +1,82 @@
+import json
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from database.types import get_codec
+
+# revision identifiers, used by Alembic.
+revision = "20261018_compressed_json"
+down_revision = "20261018_knowledge_iso_dates"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# (테이블, 기본키, 컬럼, 원래 타입, NULL 허용)
+# 평문 JSON(TEXT) → database.types.CompressedJSON 이 쓰는 압축 BLOB
+# 코덱/사전은 앱과 같은 환경변수(JSON_COMPRESSION, JSON_COMPRESSION_DICT ...)를 따른다
+_JSON_COLUMNS = [
+    ("law_article", "id", "current_json", sa.JSON(), True),
+    ("law_article_version", "id", "raw_json", sa.JSON(), True),
+    ("staging_raw", "id", "payload", sa.Text(), False),
+]
+
+CHUNK = 1000
+
+def _has_column(conn, table: str, column: str) -> bool:
+    insp = inspect(conn)
+    if not insp.has_table(table):
+        return False
+    return any(c["name"] == column for c in insp.get_columns(table))
+
+def _rewrite(conn, table: str, pk: str, col: str, convert) -> tuple[int, int]:
+    """pk 순서로 청크씩 읽어 convert(값) 결과로 갱신. (변환 전 바이트, 변환 후 바이트)"""
+    before = after = 0
+    last = None
+    while True:
+        where = "" if last is None else f"WHERE {pk} > :last "
+        rows = conn.execute(
+            sa.text(f"SELECT {pk} AS k, {col} AS v FROM {table} {where}ORDER BY {pk} LIMIT {CHUNK}"),
+            {"last": last},
+        ).all()
+        if not rows:
+            return before, after
+        updates = []
+        for k, v in rows:
+            if v is None:
+                continue
+            new = convert(v)
+            before += len(v.encode("utf-8") if isinstance(v, str) else v)
+            after += len(new.encode("utf-8") if isinstance(new, str) else new)
+            updates.append({"k": k, "v": new})
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET {col} = :v WHERE {pk} = :k"), updates)
+        last = rows[-1].k
+
+def upgrade():
+    conn = op.get_bind()
+    codec = get_codec()
+    for table, pk, col, old_type, nullable in _JSON_COLUMNS:
+        if not _has_column(conn, table, col):
+            continue
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(col, existing_type=old_type, type_=sa.LargeBinary(),
+                               existing_nullable=nullable)
+        # 이미 압축된 값(헤더 있음)은 decode→encode 해도 같은 결과라 재실행해도 안전
+        before, after = _rewrite(conn, table, pk, col, lambda v: codec.encode(codec.decode(v)))
+        logger.info("compressed %s.%s: %d -> %d bytes", table, col, before, after)
+
+
+def downgrade():
+    conn = op.get_bind()
+    codec = get_codec()
+    for table, pk, col, old_type, nullable in reversed(_JSON_COLUMNS):
+        if not _has_column(conn, table, col):
+            continue
+        _rewrite(conn, table, pk, col, lambda v: json.dumps(codec.decode(v), ensure_ascii=False))
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(col, existing_type=sa.LargeBinary(), type_=old_type,
+                               existing_nullable=nullable)
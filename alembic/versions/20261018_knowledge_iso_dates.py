@@ -0,0 +1,62 @@
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from utils.dates import iso_date
+
+# revision identifiers, used by Alembic.
+revision = "20261018_knowledge_iso_dates"
+down_revision = "20261017_sync_jobs_items_skipped"
+branch_labels = None
+depends_on = None
+
+# (테이블, 기본키, 원본 컬럼, 파생 컬럼, 인덱스 이름, 인덱스 컬럼)
+# 20251109_knowledge_core 의 문자열 날짜 컬럼은 그대로 두고 정규화(YYYY-MM-DD, 없으면 '') 컬럼을 추가
+_ISO_COLUMNS = [
+    ("holidays", "date", "date", "date_iso", "ix_holidays_date_iso", ["date_iso"]),
+    ("policy_bulletins", "id", "effective_date", "effective_date_iso",
+     "ix_policy_bulletins_effective_date_iso", ["effective_date_iso", "id"]),
+    ("admin_interpretations", "interp_id", "answered_at", "answered_at_iso",
+     "ix_admin_interpretations_answered_at_iso", ["answered_at_iso", "interp_id"]),
+    # 최저임금 이력은 year 순 조회뿐이라 인덱스 없이 컬럼만
+    ("minimum_wage_history", "year", "notice_date", "notice_date_iso", None, None),
+]
+
+def _columns(conn, table: str) -> set[str]:
+    insp = inspect(conn)
+    if not insp.has_table(table):
+        return set()
+    return {c["name"] for c in insp.get_columns(table)}
+
+def _indexes(conn, table: str) -> set[str]:
+    return {i["name"] for i in inspect(conn).get_indexes(table)}
+
+def upgrade():
+    conn = op.get_bind()
+    for table, pk, src, col, index, index_cols in _ISO_COLUMNS:
+        cols = _columns(conn, table)
+        if src not in cols:
+            continue
+        if col not in cols:
+            with op.batch_alter_table(table) as batch:
+                batch.add_column(sa.Column(col, sa.String(length=10), nullable=False, server_default=""))
+
+        # 기존 행 채우기 (앞으로의 쓰기는 ORM 이벤트/bulk_upsert가 채움)
+        rows = conn.execute(sa.text(f"SELECT {pk} AS k, {src} AS v FROM {table}")).all()
+        updates = [{"k": r.k, "v": iso_date(r.v)} for r in rows]
+        if updates:
+            conn.execute(sa.text(f"UPDATE {table} SET {col} = :v WHERE {pk} = :k"), updates)
+
+        if index and index not in _indexes(conn, table):
+            op.create_index(index, table, index_cols)
+
+
+def downgrade():
+    conn = op.get_bind()
+    for table, _pk, _src, col, index, _index_cols in reversed(_ISO_COLUMNS):
+        if col not in _columns(conn, table):
+            continue
+        if index and index in _indexes(conn, table):
+            op.drop_index(index, table_name=table)
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column(col)
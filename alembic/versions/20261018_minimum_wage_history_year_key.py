@@ -0,0 +1,75 @@
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision = "20261018_minimum_wage_history_year_key"
+down_revision = "20261018_compressed_json"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+TABLE = "minimum_wage_history"
+INDEX = "uq_minimum_wage_history_year"
+
+# minimum_wage_history 는 두 스키마가 섞여 있을 수 있음
+#  - 20251109_knowledge_core: year PK (연도별 고시 정보, /admin/sync/minwage 대상)
+#  - models.wage 의 create_all: id PK + year (관리자 변경 이력; action/changed_by/changed_at NOT NULL)
+# 연도 기준 upsert(ON CONFLICT (year))가 동작하도록
+#  - year 단독 PK/UNIQUE 가 없으면 UNIQUE 인덱스 생성 (연도 중복 행이 있으면 건너뜀 → ETL은 연도별 갱신으로 동작)
+#  - hourly 가 없으면 추가
+#  - 이력 스키마의 NOT NULL 컬럼에 서버 기본값 → 동기화 행(이력 컬럼 값 없음)도 넣을 수 있게
+_AUDIT_DEFAULTS = {
+    "action": (sa.String(length=20), sa.text("'SYNC'")),
+    "changed_by": (sa.String(length=100), sa.text("'minwage_sync'")),
+    "changed_at": (sa.DateTime(), sa.text("CURRENT_TIMESTAMP")),
+}
+
+def _year_is_key(insp) -> bool:
+    if insp.get_pk_constraint(TABLE).get("constrained_columns") == ["year"]:
+        return True
+    uniques = [u["column_names"] for u in insp.get_unique_constraints(TABLE)]
+    uniques += [i["column_names"] for i in insp.get_indexes(TABLE) if i.get("unique")]
+    return ["year"] in uniques
+
+def upgrade():
+    conn = op.get_bind()
+    insp = inspect(conn)
+    if not insp.has_table(TABLE):
+        return
+    cols = {c["name"]: c for c in insp.get_columns(TABLE)}
+    if "year" not in cols:
+        return
+
+    audit = {
+        name: spec for name, spec in _AUDIT_DEFAULTS.items()
+        if name in cols and not cols[name]["nullable"] and cols[name].get("default") is None
+    }
+    if "hourly" not in cols or audit:
+        with op.batch_alter_table(TABLE) as batch:
+            if "hourly" not in cols:
+                batch.add_column(sa.Column("hourly", sa.Integer(), nullable=True))
+            for name, (type_, default) in audit.items():
+                batch.alter_column(name, existing_type=type_, existing_nullable=False, server_default=default)
+
+    insp = inspect(conn)
+    if _year_is_key(insp):
+        return
+    dup = conn.execute(sa.text(f"SELECT year FROM {TABLE} GROUP BY year HAVING COUNT(*) > 1 LIMIT 1")).first()
+    if dup is not None:
+        logger.warning("%s has duplicate years (e.g. %s); %s not created", TABLE, dup.year, INDEX)
+        return
+    op.create_index(INDEX, TABLE, ["year"], unique=True)
+
+
+def downgrade():
+    conn = op.get_bind()
+    insp = inspect(conn)
+    if not insp.has_table(TABLE):
+        return
+    if INDEX in {i["name"] for i in insp.get_indexes(TABLE)}:
+        op.drop_index(INDEX, table_name=TABLE)
+    # hourly/서버 기본값은 데이터 보존을 위해 그대로 둠
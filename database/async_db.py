@@ -0,0 +1,118 @@
+# worklaw-backend/database/async_db.py
+"""
+공개 조회 API용 읽기 세션 실행기 (동기/비동기 선택: DB_ASYNC)
+
+- DB_ASYNC=false(기본): 동기 읽기 세션 + 스레드 풀 (기존 경로)
+- DB_ASYNC=true: sqlalchemy.ext.asyncio 엔진(aiosqlite / asyncpg) + AsyncSession
+  → 요청이 스레드 풀(기본 40) 슬롯을 잡지 않으므로 동시 요청 수가 스레드 수에 묶이지 않음
+- 핸들러는 async def 로 두고 조회 로직(동기 함수 fn(session, ...))을 await db.run(fn, ...)으로 실행
+  비동기 모드에서는 AsyncSession.run_sync 로 같은 코드를 그대로 재사용
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from database.connection import (
+    DATABASE_URL,
+    READ_DATABASE_URL,
+    ReadSessionLocal,
+    apply_sqlite_pragmas,
+    engine_options,
+    ensure_writer_opened,
+    read_pragmas,
+)
+
+T = TypeVar("T")
+
+def async_enabled() -> bool:
+    return os.getenv("DB_ASYNC", "false").lower() == "true"
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+def async_url(url: str) -> str:
+    """동기 URL → 비동기 드라이버 URL (이미 드라이버가 지정돼 있으면 그대로)"""
+    scheme, rest = url.split("://", 1)
+    if "+" in scheme:
+        return url
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+_async_engine = None
+_async_sessionmaker = None
+
+def get_async_read_engine():
+    """비동기 읽기 엔진 (첫 사용 시 생성; aiosqlite/asyncpg 미설치면 ImportError)"""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        url = async_url(READ_DATABASE_URL)
+        is_sqlite = READ_DATABASE_URL.startswith("sqlite")
+        pragmas = read_pragmas(DATABASE_URL) if is_sqlite and READ_DATABASE_URL != DATABASE_URL else None
+        kw, pragmas = engine_options(READ_DATABASE_URL, pragmas)
+        eng = create_async_engine(url, **kw)
+        apply_sqlite_pragmas(eng.sync_engine, pragmas)
+        if is_sqlite and READ_DATABASE_URL != DATABASE_URL:
+            event.listen(eng.sync_engine, "do_connect", ensure_writer_opened)
+        _async_engine = eng
+        _async_sessionmaker = async_sessionmaker(eng, expire_on_commit=False)
+    return _async_engine
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _async_sessionmaker = None
+
+class ReadDB:
+    """
+    await db.run(fn, *args) → fn(session, *args) 결과
+    run이 끝나면 세션을 닫아 커넥션을 바로 풀에 반납 (응답 직렬화/전송 동안 커넥션을 쥐지 않음)
+    """
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kw: Any) -> T:  # pragma: no cover
+        raise NotImplementedError
+
+class SyncReadDB(ReadDB):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _call(self, fn, *args, **kw):
+        try:
+            return fn(self.session, *args, **kw)
+        finally:
+            self.session.close()
+
+    async def run(self, fn, *args, **kw):
+        return await run_in_threadpool(self._call, fn, *args, **kw)
+
+class AsyncReadDB(ReadDB):
+    def __init__(self, session):
+        self.session = session
+
+    async def run(self, fn, *args, **kw):
+        try:
+            return await self.session.run_sync(fn, *args, **kw)
+        finally:
+            await self.session.close()
+
+async def get_read_runner() -> AsyncIterator[ReadDB]:
+    """공개 조회 라우터 의존성 (DB_ASYNC 로 동기/비동기 선택)"""
+    if async_enabled():
+        get_async_read_engine()
+        async with _async_sessionmaker() as session:
+            yield AsyncReadDB(session)
+    else:
+        session = ReadSessionLocal()
+        try:
+            yield SyncReadDB(session)
+        finally:
+            session.close()  # run()에서 이미 닫힘 → 반납할 커넥션 없음
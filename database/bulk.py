@@ -0,0 +1,109 @@
+# worklaw-backend/database/bulk.py
+"""
+집합 단위 upsert 헬퍼 (ETL 공용)
+
+- 청크마다 다중 행 INSERT ... ON CONFLICT (key) DO UPDATE 한 문장 (SQLite / PostgreSQL)
+- 실행 전에 같은 청크의 키만 한 번 조회해 inserted/updated 수를 정확히 집계
+  (RETURNING/rowcount는 방언마다 insert/update 구분이 안 되므로 사용하지 않음)
+- 청크 크기는 방언의 바인드 변수 한도 / 컬럼 수로 자동 결정
+- 모델의 *_iso 파생 컬럼(Column.info["iso_from"])은 원본 컬럼이 행에 있으면 여기서 채운다
+- commit은 호출 측 책임
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from utils.dates import iso_columns, iso_date
+
+# 방언별 바인드 변수 한도 (SQLite는 구버전 기본값 999 기준으로 보수적으로)
+_MAX_PARAMS = {"sqlite": 999, "postgresql": 32767}
+
+def dialect_insert(db: Session):
+    """INSERT ... ON CONFLICT 를 지원하는 방언별 insert()"""
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"bulk upsert not supported on {name}")
+    return insert
+
+def rows_per_statement(db: Session, n_cols: int) -> int:
+    """다중 VALUES 한 문장에 넣을 수 있는 최대 행 수 (방언의 바인드 변수 한도 / 컬럼 수)"""
+    return max(1, _MAX_PARAMS.get(db.get_bind().dialect.name, 999) // max(1, n_cols))
+
+def _table(model):
+    return getattr(model, "__table__", model)
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    key: Sequence[str] | None = None,
+    update: Sequence[str] | None = None,
+    chunk_size: int | None = None,
+) -> Dict[str, int]:
+    """
+    rows를 key(기본: 기본키) 기준으로 upsert. 반환: {"inserted": n, "updated": m}
+    - 모든 행은 같은 컬럼 집합이어야 함 (다중 VALUES 제약)
+    - update: 충돌 시 갱신할 컬럼 (기본: key를 뺀 나머지 전부, 비면 DO NOTHING)
+    - 같은 키가 여러 번 오면 마지막 행이 이긴다
+    - DO NOTHING일 때 updated는 '이미 있던 키 수'(실제 변경 없음)
+    """
+    table = _table(model)
+    key = list(key or [c.name for c in table.primary_key.columns])
+
+    iso_cols = iso_columns(table)
+    dedup: Dict[tuple, Dict[str, Any]] = {}
+    for r in rows:
+        if iso_cols:
+            r = dict(r)
+            for col, src in iso_cols.items():
+                if src in r:
+                    r[col] = iso_date(r[src])
+        dedup[tuple(r[k] for k in key)] = r
+    if not dedup:
+        return {"inserted": 0, "updated": 0}
+    data: List[Dict[str, Any]] = list(dedup.values())
+
+    cols = list(data[0])
+    colset = set(cols)
+    if any(set(r) != colset for r in data):
+        raise ValueError("bulk_upsert: all rows must have the same columns")
+    if update is None:
+        update = [c for c in cols if c not in key]
+
+    insert = dialect_insert(db)
+    if chunk_size is None:
+        chunk_size = rows_per_statement(db, len(cols))
+    key_cols = [table.c[k] for k in key]
+
+    inserted = updated = 0
+    for i in range(0, len(data), chunk_size):
+        chunk = data[i:i + chunk_size]
+        keys = [tuple(r[k] for k in key) for r in chunk]
+
+        # 이미 있는 키 수 = updated (청크당 SELECT 1회)
+        if len(key_cols) == 1:
+            pred = key_cols[0].in_([k[0] for k in keys])
+        else:
+            pred = tuple_(*key_cols).in_(keys)
+        n_existing = len(db.execute(select(*key_cols).where(pred)).all())
+
+        stmt = insert(table).values(chunk)
+        if update:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=key_cols,
+                set_={c: stmt.excluded[c] for c in update},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=key_cols)
+        db.execute(stmt)
+
+        updated += n_existing
+        inserted += len(chunk) - n_existing
+    return {"inserted": inserted, "updated": updated}
@@ -1,7 +1,9 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 
 # .env 로드
 load_dotenv()
@@ -9,18 +11,144 @@ load_dotenv()
 # ✅ Alembic과 공용으로 사용할 DB URL (기본: 현재 디렉터리 worklaw.db)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./worklaw.db")
 
-# ✅ SQLite 안전 옵션
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+# ✅ SQLite 성능 프로필 (SQLITE_PROFILE=off 로 끄면 드라이버 기본값)
+#   - WAL: 읽기와 쓰기가 서로를 막지 않음 (쓰기는 여전히 1개씩)
+#   - synchronous=NORMAL: WAL에서 안전한 수준으로 fsync 횟수 감소
+#   - busy_timeout: 쓰기 락 대기 (즉시 'database is locked' 대신)
+#   - mmap/cache_size/temp_store: 읽기 I/O, 정렬/임시 테이블 비용 감소
+def sqlite_pragmas(url: str = DATABASE_URL) -> dict:
+    if os.getenv("SQLITE_PROFILE", "tuned").lower() in ("off", "none", "default"):
+        return {}
+    pragmas = {
+        "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),      # 음수 = KiB (64MB)
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+    }
+    if _is_memory(url):
+        # 메모리 DB는 WAL/mmap 의미 없음
+        pragmas.pop("journal_mode")
+        pragmas.pop("mmap_size")
+    return pragmas
 
-engine = create_engine(DATABASE_URL, echo=False, future=True, connect_args=connect_args)
+def _is_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict) -> None:
+    """새 DBAPI 커넥션마다 PRAGMA 적용 (풀에서 재사용되는 커넥션은 한 번만)"""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        try:
+            for k, v in pragmas.items():
+                cur.execute(f"PRAGMA {k}={v}")
+        finally:
+            cur.close()
+
+def engine_options(url: str, pragmas: dict | None = None, **kw) -> tuple[dict, dict]:
+    """
+    create_engine / create_async_engine 공용 인자. 반환: (엔진 kwargs, 적용할 PRAGMA)
+    SQLite는 프로필 PRAGMA + 풀 설정, 그 외(PostgreSQL 등)는 풀 크기만 적용.
+    """
+    pool_size = int(os.getenv("DB_POOL_SIZE", "8"))
+    max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "16"))
+    if not url.startswith("sqlite"):
+        kw.setdefault("pool_size", pool_size)
+        kw.setdefault("max_overflow", max_overflow)
+        kw.setdefault("pool_pre_ping", True)
+        return kw, {}
+
+    if pragmas is None:
+        pragmas = sqlite_pragmas(url)
+    connect_args = kw.pop("connect_args", {})
+    connect_args.setdefault("check_same_thread", False)
+    # 드라이버(pysqlite) 쪽 준비된 문장 캐시 (기본 128)
+    connect_args.setdefault("cached_statements", int(os.getenv("SQLITE_STATEMENT_CACHE", "256")))
+    if "busy_timeout" in pragmas:
+        connect_args.setdefault("timeout", pragmas["busy_timeout"] / 1000)
+    kw["connect_args"] = connect_args
+    if _is_memory(url):
+        # 메모리 DB는 커넥션마다 별개 DB → 하나를 공유
+        kw.setdefault("poolclass", StaticPool)
+    else:
+        # 파일 DB: 커넥션을 재사용해 PRAGMA/mmap/페이지 캐시를 유지
+        kw.setdefault("pool_size", pool_size)
+        kw.setdefault("max_overflow", max_overflow)
+    return kw, pragmas
+
+def make_engine(url: str = DATABASE_URL, pragmas: dict | None = None, **kw) -> Engine:
+    kw, pragmas = engine_options(url, pragmas, **kw)
+    eng = create_engine(url, echo=False, future=True, **kw)
+    apply_sqlite_pragmas(eng, pragmas)
+    return eng
+
+# ✅ 읽기 전용 URL: DATABASE_READ_URL(예: PostgreSQL 복제본) > SQLite 파일은 mode=ro URI > 쓰기 URL 그대로
+def read_url_for(url: str = DATABASE_URL) -> str:
+    explicit = os.getenv("DATABASE_READ_URL")
+    if explicit:
+        return explicit
+    if url.startswith("sqlite") and not _is_memory(url) and "uri=true" not in url:
+        path = url.split(":///", 1)[1] if ":///" in url else ""
+        if path:
+            return f"sqlite:///file:{path}?mode=ro&uri=true"
+    return url
+
+def read_pragmas(url: str = DATABASE_URL) -> dict:
+    # 읽기 전용 커넥션은 journal_mode를 바꿀 수 없음(WAL은 쓰기 쪽에서 이미 지정) + 쓰기 차단
+    pragmas = {k: v for k, v in sqlite_pragmas(url).items() if k != "journal_mode"}
+    pragmas["query_only"] = "ON"
+    return pragmas
+
+engine = make_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+READ_DATABASE_URL = read_url_for(DATABASE_URL)
+if READ_DATABASE_URL == DATABASE_URL:
+    # 메모리 DB 등 분리할 수 없는 경우 같은 엔진 공유
+    read_engine = engine
+else:
+    read_engine = make_engine(
+        READ_DATABASE_URL,
+        pragmas=read_pragmas(DATABASE_URL) if READ_DATABASE_URL.startswith("sqlite") else None,
+    )
+
+def ensure_writer_opened(dialect, conn_rec, cargs, cparams):
+    """
+    읽기 엔진 do_connect 훅: mode=ro는 DB 파일/WAL 공유메모리(-shm)를 만들 수 없음
+    → 쓰기 엔진 커넥션을 한 번 열어 두면(풀에 유지) 파일과 -shm이 준비됨
+    """
+    with engine.connect():
+        pass
+
+if read_engine is not engine and READ_DATABASE_URL.startswith("sqlite"):
+    event.listen(read_engine, "do_connect", ensure_writer_opened)
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+WriteSessionLocal = SessionLocal
+
 # ✅ Alembic autogenerate 타겟
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+def get_write_db():
+    """쓰기 세션 (관리자/ETL/인증)"""
+    db = WriteSessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    """읽기 전용 세션 (공개 조회 API). 쓰기 시도는 DB 단에서 거부됨"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# 하위 호환: 기존 의존성 이름은 쓰기 세션
+get_db = get_write_db
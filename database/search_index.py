@@ -0,0 +1,188 @@
+# worklaw-backend/database/search_index.py
+"""
+SQLite FTS5 전문 검색 인덱스 (법령/조문/행정해석/정책공지 통합)
+
+- 가상 테이블 search_index(kind, ref_id, title, body), tokenize='trigram'
+  → 한국어 부분 문자열 검색(예: '연차휴가' 안의 '차휴가') 지원
+- 원본 테이블마다 INSERT/UPDATE/DELETE 트리거로 동기화
+- FTS rowid = 원본 rowid * 8 + kind 코드 → 트리거의 삭제가 rowid 조회 한 번
+  (정수 PK가 아닌 테이블은 VACUUM 시 rowid가 바뀔 수 있으므로 VACUUM 후 rebuild_search_index 실행)
+- SQLite 이외의 DB에서는 아무 것도 하지 않음
+"""
+from __future__ import annotations
+
+import html
+import logging
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from database.connection import Base
+
+logger = logging.getLogger("worklaw.search")
+
+SEARCH_TABLE = "search_index"
+_ROWID_STRIDE = 8
+
+# kind, 코드, 원본 테이블, 참조 키 컬럼, 제목 식, 본문 식 ({r} = new/old/원본 별칭)
+_SOURCES: list[tuple[str, int, str, str, str, str]] = [
+    ("law", 1, "law", "id", "{r}.name", "''"),
+    ("article", 2, "law_article", "id",
+     "{r}.article_no || ' ' || COALESCE({r}.title, '')", "COALESCE({r}.current_text, '')"),
+    ("core_article", 3, "law_articles", "id",
+     "{r}.article_no || ' ' || COALESCE({r}.title, '')", "COALESCE({r}.body_text, '')"),
+    ("interpretation", 4, "admin_interpretations", "interp_id",
+     "{r}.title", "COALESCE({r}.question, '') || char(10) || COALESCE({r}.answer, '')"),
+    ("bulletin", 5, "policy_bulletins", "id",
+     "{r}.title", "COALESCE({r}.summary_md, '')"),
+]
+
+KINDS = tuple(s[0] for s in _SOURCES)
+
+def _is_sqlite(bind) -> bool:
+    return bind.dialect.name == "sqlite"
+
+def _rowid(code: int, r: str) -> str:
+    return f"{r}.rowid * {_ROWID_STRIDE} + {code}"
+
+def _insert_sql(kind: str, code: int, table: str, key: str, title: str, body: str, r: str) -> str:
+    return (
+        f"INSERT INTO {SEARCH_TABLE}(rowid, kind, ref_id, title, body) "
+        f"SELECT {_rowid(code, r)}, '{kind}', CAST({r}.{key} AS TEXT), "
+        f"{title.format(r=r)}, {body.format(r=r)}"
+    )
+
+def _trigger_ddl(kind: str, code: int, table: str, key: str, title: str, body: str) -> list[str]:
+    ins_new = _insert_sql(kind, code, table, key, title, body, "new")
+    del_old = f"DELETE FROM {SEARCH_TABLE} WHERE rowid = {_rowid(code, 'old')}"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_ai AFTER INSERT ON {table} BEGIN {ins_new}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_ad AFTER DELETE ON {table} BEGIN {del_old}; END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_au AFTER UPDATE ON {table} BEGIN {del_old}; {ins_new}; END",
+    ]
+
+def ensure_search_index(conn: Connection) -> bool:
+    """
+    가상 테이블과 트리거를 (없으면) 만들고, 인덱스가 비어 있으면 원본에서 채운다.
+    반환: 인덱스 사용 가능 여부
+    """
+    if not _is_sqlite(conn):
+        return False
+    conn.exec_driver_sql(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+        f"USING fts5(kind UNINDEXED, ref_id UNINDEXED, title, body, tokenize='trigram')"
+    )
+    tables = set(inspect(conn).get_table_names())
+    for kind, code, table, key, title, body in _SOURCES:
+        if table in tables:
+            for ddl in _trigger_ddl(kind, code, table, key, title, body):
+                conn.exec_driver_sql(ddl)
+    empty = conn.exec_driver_sql(f"SELECT NOT EXISTS (SELECT 1 FROM {SEARCH_TABLE})").scalar()
+    if empty:
+        rebuild_search_index(conn, tables)
+    return True
+
+def rebuild_search_index(conn: Connection, tables: set[str] | None = None) -> int:
+    """인덱스를 비우고 원본 테이블 전체에서 다시 채운다. 반환: 색인 행 수"""
+    if not _is_sqlite(conn):
+        return 0
+    if tables is None:
+        tables = set(inspect(conn).get_table_names())
+    conn.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE}")
+    for kind, code, table, key, title, body in _SOURCES:
+        if table in tables:
+            conn.exec_driver_sql(_insert_sql(kind, code, table, key, title, body, table) + f" FROM {table}")
+    n = conn.exec_driver_sql(f"SELECT COUNT(*) FROM {SEARCH_TABLE}").scalar() or 0
+    logger.info("search index rebuilt: %d rows", n)
+    return n
+
+def init_search_index(engine: Engine) -> bool:
+    """앱 시작 시 호출 (트랜잭션 안에서 ensure_search_index)"""
+    with engine.begin() as conn:
+        return ensure_search_index(conn)
+
+# Base.metadata.create_all() 직후 자동 생성 (테스트/ingest 스크립트 포함)
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(target, connection, **kw):
+    ensure_search_index(connection)
+
+# --- 질의 ----------------------------------------------------------------------
+_TRIGRAM = 3
+
+# 2글자 이하 검색어만 있을 때 LIKE로 훑는 최대 일치 행 수 (인덱스를 못 타는 전체 스캔이므로 상한)
+SHORT_TERM_SCAN_LIMIT = 1000
+
+# snippet() 일치 구간 표시 (사용자 영역 문자 → HTML 이스케이프 후 <b>로 바꿈)
+_MARK_OPEN, _MARK_CLOSE = "\ue000", "\ue001"
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+def _marked_html(snippet: str) -> str:
+    # 본문은 이스케이프, 일치 구간 표시만 <b>…</b> 태그로
+    return html.escape(snippet).replace(_MARK_OPEN, "<b>").replace(_MARK_CLOSE, "</b>")
+
+def search(conn: Connection, q: str, kind: str | None = None, limit: int = 20) -> list[dict]:
+    """
+    bm25 순위 + 스니펫(HTML 이스케이프, 일치 구간만 <b>). 3글자 이상 검색어는 FTS MATCH(trigram),
+    2글자 이하(예: '연차')는 trigram으로 MATCH가 안 되므로 같은 인덱스의 LIKE로 거른다.
+    한계: 2글자 이하 검색어만 있으면 인덱스 없이 LIKE 스캔이므로 처음 SHORT_TERM_SCAN_LIMIT건의 일치 행만
+    후보로 보고(제목 일치 우선) 그 안에서 순위를 매긴다 → 일치가 그보다 많으면 결과가 완전하지 않을 수 있음.
+    3글자 이상 검색어가 함께 있으면 MATCH 결과 안에서만 거르므로 상한 없음.
+    """
+    terms = [t for t in q.split() if t]
+    long_terms = [t for t in terms if len(t) >= _TRIGRAM]
+    short_terms = [t for t in terms if len(t) < _TRIGRAM]
+    params: dict = {"limit": limit}
+    where: list[str] = []
+
+    if long_terms:
+        params["match"] = " AND ".join(_fts_phrase(t) for t in long_terms)
+        where.append(f"{SEARCH_TABLE} MATCH :match")
+    for i, t in enumerate(short_terms):
+        params[f"like{i}"] = "%" + t.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        where.append(f"(title LIKE :like{i} ESCAPE '\\' OR body LIKE :like{i} ESCAPE '\\')")
+    if not where:
+        return []
+    if kind:
+        params["kind"] = kind
+        where.append("kind = :kind")
+
+    if long_terms:
+        # 컬럼 가중치: kind/ref_id 0, title 10, body 1 (bm25는 작을수록 관련도 높음)
+        score = f"bm25({SEARCH_TABLE}, 0.0, 0.0, 10.0, 1.0)"
+        snippet = f"snippet({SEARCH_TABLE}, 3, '{_MARK_OPEN}', '{_MARK_CLOSE}', '…', 16)"
+        source = f"{SEARCH_TABLE} WHERE {' AND '.join(where)}"
+    else:
+        score = "(CASE WHEN title LIKE :like0 ESCAPE '\\' THEN -10.0 ELSE -1.0 END)"
+        snippet = "NULL"
+        # 전체 스캔 상한: 일치 행을 SHORT_TERM_SCAN_LIMIT건 찾으면 스캔을 멈추고 그 안에서만 순위
+        params["scan"] = SHORT_TERM_SCAN_LIMIT
+        source = (
+            f"{SEARCH_TABLE} WHERE rowid IN (SELECT rowid FROM {SEARCH_TABLE} "
+            f"WHERE {' AND '.join(where)} LIMIT :scan)"
+        )
+
+    sql = (
+        f"SELECT kind, ref_id, title, {snippet} AS snippet, {score} AS score, body "
+        f"FROM {source} ORDER BY score LIMIT :limit"
+    )
+    out = []
+    for r in conn.execute(text(sql), params):
+        snip = _marked_html(r.snippet) if r.snippet is not None else _like_snippet(r.body, terms[0])
+        out.append({"kind": r.kind, "id": r.ref_id, "title": r.title, "snippet": snip, "score": -float(r.score)})
+    return out
+
+def _like_snippet(body: str | None, term: str, width: int = 40) -> str:
+    # FTS snippet()과 같은 형식: 본문은 HTML 이스케이프, 일치 구간만 <b>…</b>
+    if not body:
+        return ""
+    pos = body.find(term)
+    if pos < 0:
+        return html.escape(body[:width * 2])
+    start, end = max(0, pos - width), min(len(body), pos + len(term) + width)
+    return (
+        ("…" if start > 0 else "")
+        + html.escape(body[start:pos]) + "<b>" + html.escape(term) + "</b>" + html.escape(body[pos + len(term):end])
+        + ("…" if end < len(body) else "")
+    )
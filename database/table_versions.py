@@ -0,0 +1,91 @@
+# worklaw-backend/database/table_versions.py
+"""
+테이블 콘텐츠 버전 카운터 (/knowledge ETag·Last-Modified 재료)
+
+- table_versions(table_name, version, changed_at): 추적 테이블마다 1행
+- 추적 테이블의 INSERT/UPDATE/DELETE 트리거가 version + 1, changed_at = 현재 시각(UTC)
+  → /admin/sync 밖에서 일어난 직접 UPDATE(관리 화면, 수동 SQL 수정)도 버전이 바뀜
+- SQLite는 행 단위 트리거, PostgreSQL은 문장 단위 트리거(+ TRUNCATE)
+- 그 외 DB에서는 아무 것도 하지 않음 (읽는 쪽은 카운터 없이 행 수/동기화 기록만 사용)
+"""
+from __future__ import annotations
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Connection, Engine
+
+from database.connection import Base
+
+VERSION_TABLE = "table_versions"
+
+# routers/knowledge_public._RESOURCES 의 후보 테이블
+TRACKED = (
+    "minimum_wage_history",
+    "holidays", "holiday",
+    "policy_bulletins", "policy_bulletin",
+    "admin_interpretations", "admin_interpretation",
+)
+
+_PG_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION {VERSION_TABLE}_bump() RETURNS trigger AS $$
+BEGIN
+    UPDATE {VERSION_TABLE} SET version = version + 1, changed_at = (now() AT TIME ZONE 'utc')
+    WHERE table_name = TG_TABLE_NAME;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+def _supported(bind) -> bool:
+    return bind.dialect.name in ("sqlite", "postgresql")
+
+def _trigger_ddl(dialect: str, table: str) -> list[str]:
+    if dialect == "postgresql":
+        return [
+            f"DROP TRIGGER IF EXISTS trg_{table}_version ON {table}",
+            f"CREATE TRIGGER trg_{table}_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {VERSION_TABLE}_bump()",
+        ]
+    bump = (
+        f"UPDATE {VERSION_TABLE} SET version = version + 1, changed_at = CURRENT_TIMESTAMP "
+        f"WHERE table_name = '{table}'"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS trg_{table}_ver_{suffix} AFTER {op} ON {table} BEGIN {bump}; END"
+        for suffix, op in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+    ]
+
+def ensure_table_versions(conn: Connection) -> bool:
+    """
+    카운터 테이블과 (있는) 추적 테이블의 트리거를 없으면 만든다.
+    반환: 카운터 사용 가능 여부
+    """
+    if not _supported(conn):
+        return False
+    dialect = conn.dialect.name
+    conn.exec_driver_sql(
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+        f"table_name VARCHAR(64) PRIMARY KEY, version BIGINT NOT NULL DEFAULT 0, changed_at TIMESTAMP NULL)"
+    )
+    if dialect == "postgresql":
+        conn.exec_driver_sql(_PG_FUNCTION)
+    tables = set(inspect(conn).get_table_names())
+    for table in TRACKED:
+        if table not in tables:
+            continue
+        conn.exec_driver_sql(
+            f"INSERT INTO {VERSION_TABLE} (table_name, version) VALUES ('{table}', 0) "
+            f"ON CONFLICT (table_name) DO NOTHING"
+        )
+        for ddl in _trigger_ddl(dialect, table):
+            conn.exec_driver_sql(ddl)
+    return True
+
+def init_table_versions(engine: Engine) -> bool:
+    """앱 시작 시 호출 (트랜잭션 안에서 ensure_table_versions)"""
+    with engine.begin() as conn:
+        return ensure_table_versions(conn)
+
+# Base.metadata.create_all() 직후 자동 생성 (테스트/ingest 스크립트 포함)
+@event.listens_for(Base.metadata, "after_create")
+def _create_table_versions(target, connection, **kw):
+    ensure_table_versions(connection)
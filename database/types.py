@@ -0,0 +1,191 @@
+# worklaw-backend/database/types.py
+"""
+압축 JSON 컬럼 타입 (LawArticle.current_json / LawArticleVersion.raw_json / StagingRaw.payload)
+
+- 저장: JSON(UTF-8) → zlib(기본) 또는 zstd 압축 BLOB, 앞에 3바이트 헤더 (+ 사전 id 4바이트)
+    b"\\xc7J" + 코덱 1바이트   N: 압축 안 함(작은 값)  Z: zlib  z: zlib+사전  S: zstd  s: zstd+사전
+- 읽기: 헤더로 코덱 판별. 헤더가 없으면 예전 평문 JSON(TEXT/bytes)으로 보고 그대로 파싱
+  → 마이그레이션 전/도중의 행도 문제없이 읽힘
+- 공유 사전(선택): 법령 JSON은 키·구조가 거의 같아 사전을 쓰면 작은 조문도 잘 압축됨
+  scripts/train_json_dict.py 로 만든 파일을 JSON_COMPRESSION_DICT 로 지정
+  사전 id(sha256 앞 4바이트)를 값마다 기록 → 다른 사전으로 읽으려 하면 명확한 오류
+- zstd는 선택 의존성(zstandard). 없으면 JSON_COMPRESSION=zstd 여도 zlib으로 저장
+
+환경변수:
+  JSON_COMPRESSION=zlib|zstd|none   JSON_COMPRESSION_LEVEL (zlib 6 / zstd 3)
+  JSON_COMPRESSION_DICT=<사전 파일>  JSON_COMPRESSION_MIN_BYTES=64
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+try:
+    import zstandard  # 선택 의존성
+except ImportError:  # pragma: no cover - 설치 여부에 따라
+    zstandard = None
+
+logger = logging.getLogger("worklaw.db")
+
+MAGIC = b"\xc7J"
+RAW, ZLIB, ZLIB_DICT, ZSTD, ZSTD_DICT = b"N", b"Z", b"z", b"S", b"s"
+
+# 원시 사전용 조각: "키":, 짧은 문자열/숫자 값(+구분자), 본문 속 단어 두 개(+공백)
+_FRAGMENT = re.compile(
+    rb'"[^"\\]{1,40}":|"[^"\\]{1,24}"[,}\]]|-?\d{1,12}[,}\]]|(?:[^\s"\\,:{}\[\]]{1,24} ){2}'
+)
+
+def dict_id(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()[:4]
+
+class JSONCodec:
+    """JSON 값 ↔ 압축 바이트. 스레드 안전 (zstd 압축기는 스레드별로 생성)"""
+
+    def __init__(self, method: str = "zlib", level: Optional[int] = None,
+                 dictionary: Optional[bytes] = None, min_bytes: int = 64):
+        method = (method or "zlib").lower()
+        if method == "zstd" and zstandard is None:
+            logger.warning("JSON_COMPRESSION=zstd but 'zstandard' is not installed; using zlib")
+            method = "zlib"
+        if method not in ("zlib", "zstd", "none"):
+            raise ValueError(f"unknown JSON compression: {method}")
+        self.method = method
+        self.level = level if level is not None else (3 if method == "zstd" else 6)
+        self.dictionary = dictionary or None
+        self.dict_id = dict_id(dictionary) if dictionary else None
+        self.min_bytes = min_bytes
+        self._local = threading.local()
+        self._zstd_dict = None
+        if zstandard is not None and self.dictionary:
+            self._zstd_dict = zstandard.ZstdCompressionDict(self.dictionary)
+
+    # --- 인코딩 ---
+    def encode(self, value: Any) -> bytes:
+        raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        if self.method == "none" or len(raw) < self.min_bytes:
+            return MAGIC + RAW + raw
+        if self.method == "zstd":
+            c = getattr(self._local, "zstd", None)
+            if c is None:
+                c = zstandard.ZstdCompressor(level=self.level, dict_data=self._zstd_dict)
+                self._local.zstd = c
+            if self._zstd_dict is not None:
+                return MAGIC + ZSTD_DICT + self.dict_id + c.compress(raw)
+            return MAGIC + ZSTD + c.compress(raw)
+        if self.dictionary:
+            c = zlib.compressobj(self.level, zdict=self.dictionary)
+            return MAGIC + ZLIB_DICT + self.dict_id + c.compress(raw) + c.flush()
+        return MAGIC + ZLIB + zlib.compress(raw, self.level)
+
+    # --- 디코딩 ---
+    def _check_dict(self, blob: bytes) -> None:
+        if self.dictionary is None or blob[3:7] != self.dict_id:
+            raise ValueError(
+                f"compressed JSON needs dictionary {blob[3:7].hex()} "
+                f"(loaded: {self.dict_id.hex() if self.dict_id else 'none'}); set JSON_COMPRESSION_DICT"
+            )
+
+    def decode(self, blob: Any) -> Any:
+        if blob is None:
+            return None
+        if isinstance(blob, str):            # 예전 TEXT JSON
+            return json.loads(blob)
+        blob = bytes(blob)
+        if not blob.startswith(MAGIC):        # 예전 평문 JSON을 BLOB으로 읽은 경우
+            return json.loads(blob.decode("utf-8"))
+        codec = blob[2:3]
+        if codec == RAW:
+            raw = blob[3:]
+        elif codec == ZLIB:
+            raw = zlib.decompress(blob[3:])
+        elif codec == ZLIB_DICT:
+            self._check_dict(blob)
+            d = zlib.decompressobj(zdict=self.dictionary)
+            raw = d.decompress(blob[7:]) + d.flush()
+        elif codec in (ZSTD, ZSTD_DICT):
+            if zstandard is None:
+                raise ValueError("compressed JSON uses zstd; install 'zstandard' to read it")
+            if codec == ZSTD_DICT:
+                self._check_dict(blob)
+                raw = zstandard.ZstdDecompressor(dict_data=self._zstd_dict).decompress(blob[7:])
+            else:
+                raw = zstandard.ZstdDecompressor().decompress(blob[3:])
+        else:
+            raise ValueError(f"unknown compressed JSON codec: {codec!r}")
+        return json.loads(raw.decode("utf-8"))
+
+def train_dictionary(samples: Iterable[Any], size: int = 16 * 1024) -> bytes:
+    """
+    JSON 값 샘플 → 공유 압축 사전
+    - zstandard가 있으면 zstd 학습기(train_dictionary), 없으면 자주 나오는 JSON 조각(키/짧은 값)을
+      빈도×길이 순으로 모은 원시 사전 (zlib zdict는 끝쪽 바이트가 가까워 유리 → 중요한 조각을 뒤에)
+    - zlib 창 크기(32KB)를 넘는 사전은 앞부분이 쓰이지 않으므로 size는 32KB 이하 권장
+    """
+    encoded = [json.dumps(v, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for v in samples]
+    if not encoded:
+        raise ValueError("no samples to train a dictionary")
+    if zstandard is not None and len(encoded) >= 8:
+        try:
+            return zstandard.train_dictionary(size, encoded).as_bytes()
+        except zstandard.ZstdError:  # 샘플이 너무 적거나 작으면 원시 사전으로
+            pass
+    counts: Counter = Counter()
+    for raw in encoded:
+        counts.update(_FRAGMENT.findall(raw))
+    ranked = sorted((c * len(f), f) for f, c in counts.items() if c > 1)
+    out = bytearray()
+    for _score, frag in reversed(ranked):
+        if len(out) + len(frag) > size:
+            continue
+        out[:0] = frag  # 점수 높은 조각이 끝에 오도록 앞에 붙임
+    return bytes(out)
+
+def _load_dictionary(path: Optional[str]) -> Optional[bytes]:
+    if not path:
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+def codec_from_env() -> JSONCodec:
+    level = os.getenv("JSON_COMPRESSION_LEVEL")
+    return JSONCodec(
+        method=os.getenv("JSON_COMPRESSION", "zlib"),
+        level=int(level) if level else None,
+        dictionary=_load_dictionary(os.getenv("JSON_COMPRESSION_DICT")),
+        min_bytes=int(os.getenv("JSON_COMPRESSION_MIN_BYTES", "64")),
+    )
+
+_codec: Optional[JSONCodec] = None
+
+def get_codec() -> JSONCodec:
+    global _codec
+    if _codec is None:
+        _codec = codec_from_env()
+    return _codec
+
+def set_codec(codec: Optional[JSONCodec]) -> None:
+    """코덱 교체 (None이면 다음 사용 시 환경변수에서 다시 생성) - 스크립트/테스트용"""
+    global _codec
+    _codec = codec
+
+class CompressedJSON(TypeDecorator):
+    """JSON 값을 압축 BLOB으로 저장하는 컬럼 타입 (예전 평문 JSON 행도 읽음)"""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return get_codec().encode(value)
+
+    def process_result_value(self, value, dialect):
+        return get_codec().decode(value)
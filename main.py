@@ -2,11 +2,14 @@
 
 import os
 import logging
+import queue
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from utils.config import settings
 
@@ -19,24 +22,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger("worklaw")
 
-# ─────────────────────────────────────────────────────────────
-# 미들웨어
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start = time.perf_counter()
-        response = await call_next(request)
-        dur_ms = int((time.perf_counter() - start) * 1000)
-
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "no-referrer"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+# 접근 로그: 요청 경로에서는 큐에 넣기만 하고, 출력(I/O)은 리스너 스레드가 담당
+access_logger = logging.getLogger("worklaw.access")
+access_logger.propagate = False
+_access_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+access_logger.addHandler(QueueHandler(_access_queue))
+_access_handlers = logging.getLogger().handlers or [logging.StreamHandler()]
+for _h in _access_handlers:
+    if _h.formatter is None:
+        _h.setFormatter(logging.Formatter(LOG_FORMAT))
+access_listener = QueueListener(_access_queue, *_access_handlers, respect_handler_level=True)
+# 실행 여부는 QueueListener 내부 속성(_thread) 대신 직접 관리
+_access_log_started = False
+_access_log_lock = threading.Lock()
+
+def start_access_log() -> None:
+    """리스너 스레드 시작 (이미 실행 중이면 무시). 멈춰 있는 동안 큐에 쌓인 기록은 시작 후 출력"""
+    global _access_log_started
+    with _access_log_lock:
+        if not _access_log_started:
+            access_listener.start()
+            _access_log_started = True
+
+def stop_access_log() -> None:
+    """큐를 비우고 리스너 스레드 종료 (여러 번 불러도 안전)"""
+    global _access_log_started
+    with _access_log_lock:
+        if _access_log_started:
+            access_listener.stop()
+            _access_log_started = False
 
+# ─────────────────────────────────────────────────────────────
+# 미들웨어 (순수 ASGI: 응답 본문을 감싸거나 버퍼링하지 않음 → 스트리밍 응답 그대로 통과)
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        headers = [
+            (b"x-content-type-options", b"nosniff"),
+            (b"x-frame-options", b"DENY"),
+            (b"referrer-policy", b"no-referrer"),
+            (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+        ]
         if getattr(settings, "ENABLE_HSTS", False) and settings.ENV == "prod":
-            response.headers["Strict-Transport-Security"] = "max-age=15552000; includeSubDomains"
+            headers.append((b"strict-transport-security", b"max-age=15552000; includeSubDomains"))
+        self.headers = headers
+        self._names = {k for k, _ in headers}
 
-        logger.info("%s %s -> %s (%d ms)", request.method, request.url.path, response.status_code, dur_ms)
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 같은 이름의 헤더는 덮어씀
+                raw = [(k, v) for k, v in message.get("headers", ()) if k.lower() not in self._names]
+                raw.extend(self.headers)
+                message["headers"] = raw
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            dur_ms = int((time.perf_counter() - start) * 1000)
+            access_logger.info("%s %s -> %s (%d ms)", scope["method"], scope["path"], status_code, dur_ms)
 
 async def unhandled_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled error: %s %s", request.method, str(request.url))
@@ -47,12 +101,17 @@ async def unhandled_exception_handler(request: Request, exc: Exception):
 app = FastAPI(title="WorkLaw API", version="0.1.0")
 
 # CORS
+# 브라우저 JS가 읽어야 하는 응답 헤더 (CORS 기본 허용 목록 밖이라 명시적으로 노출)
+#  - X-Next-Cursor: /knowledge 목록 다음 페이지 커서
+#  - X-Rows / X-Violations / X-Errors: /calc/minimum-wage-check 요약
+CORS_EXPOSE_HEADERS = ["X-Next-Cursor", "X-Rows", "X-Violations", "X-Errors"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=getattr(settings, "CORS_ORIGINS", ["http://localhost:3000"]),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=CORS_EXPOSE_HEADERS,
 )
 
 app.add_middleware(SecurityHeadersMiddleware)
@@ -79,7 +138,8 @@ if os.getenv("ENV") == "staging":
 
 # ─────────────────────────────────────────────────────────────
 # 기본 라우터(실 구현)
-from routers import metadata, metadata_admin, law, auth
+from routers import metadata, metadata_admin, law, auth, search, calc, business_days
+from routers import knowledge_public
 from routers.knowledge_public import router as knowledge_public_router
 from routers.knowledge_admin_sync import router as knowledge_admin_sync_router
 
@@ -89,9 +149,80 @@ app.include_router(law.router)
 app.include_router(auth.router)
 app.include_router(knowledge_public_router)
 app.include_router(knowledge_admin_sync_router)
+app.include_router(search.router)
+app.include_router(calc.router)
+app.include_router(business_days.router)
+
+# ─────────────────────────────────────────────────────────────
+# 스타트업: 접근 로그 리스너 (import 시점이 아니라 앱 수명 주기마다 시작/종료)
+@app.on_event("startup")
+def _start_access_log():
+    start_access_log()
+
+# 스타트업: /knowledge ETag용 테이블 버전 카운터 (스키마 해석보다 먼저 → 버전 문장에 포함)
+@app.on_event("startup")
+def _init_table_versions():
+    from database.connection import engine
+    from database.table_versions import init_table_versions
+    try:
+        init_table_versions(engine)
+    except Exception as e:
+        logger.warning("table version counters init failed: %r", e)
+
+# 스타트업: /knowledge 스키마 매핑을 한 번만 해석
+@app.on_event("startup")
+def _resolve_knowledge_schema():
+    from database.connection import read_engine
+    try:
+        knowledge_public.resolve_schema(read_engine)
+    except Exception as e:
+        # 실패해도 첫 요청 시 다시 해석하므로 기동은 계속
+        logger.warning("knowledge schema resolution failed at startup: %r", e)
+
+@app.on_event("startup")
+def _init_search_index():
+    from database.connection import engine
+    from database.search_index import init_search_index
+    try:
+        init_search_index(engine)
+    except Exception as e:
+        logger.warning("search index init failed: %r", e)
+
+@app.on_event("startup")
+def _load_minimum_wage_table():
+    from utils import wage_table
+    try:
+        wage_table.reload()
+    except Exception as e:
+        # 실패해도 첫 조회 시 다시 로드
+        logger.warning("minimum wage table load failed: %r", e)
+
+@app.on_event("startup")
+def _build_business_calendar():
+    from utils import business_calendar
+    try:
+        business_calendar.reload()
+    except Exception as e:
+        # 실패해도 첫 조회 시 다시 빌드
+        logger.warning("business calendar build failed: %r", e)
+
+@app.on_event("shutdown")
+def _stop_sync_jobs():
+    from utils.sync_jobs import sync_runner
+    sync_runner.shutdown(wait=False)
+
+@app.on_event("shutdown")
+def _stop_access_log():
+    # 큐에 남은 접근 로그를 비우고 리스너 스레드 종료 (다음 startup에서 다시 시작)
+    stop_access_log()
+
+@app.on_event("shutdown")
+async def _dispose_async_engine():
+    from database.async_db import dispose_async_engine
+    await dispose_async_engine()
 
 # ─────────────────────────────────────────────────────────────
 # 헬스
 @app.get("/health")
 def health():
-    return {"status": "ok", "env": settings.ENV}
+    return {"status": "ok", "env": settings.ENV, "knowledge_schema": knowledge_public.schema_summary()}
@@ -1,8 +1,15 @@
-from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, UniqueConstraint
+from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, UniqueConstraint, Index, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
 from datetime import datetime
 from database.connection import Base  # 기존 Base 사용
+from database.types import CompressedJSON
+from utils.dates import iso_columns, iso_date
+
+def _iso_column(source: str) -> Column:
+    # source(자유 형식 날짜 문자열)를 정규화한 YYYY-MM-DD ('' = 없음/해석 불가)
+    # 범위 조건·정렬용 인덱스 대상. 값은 쓰기 시점에 채운다(아래 _fill_iso, database.bulk).
+    return Column(String(10), nullable=False, default="", server_default="", info={"iso_from": source})
 
 # --- Source & Job (수집원/작업 추적) ---
 class Source(Base):
@@ -21,6 +28,7 @@ class SyncJob(Base):
     finished_at = Column(DateTime, nullable=True)
     status = Column(String, default="running")          # running/success/fail
     items_upserted = Column(Integer, default=0)
+    items_skipped = Column(Integer, default=0)           # staging checksum 동일 → 건너뜀
     checksum = Column(String, nullable=True)
     log = Column(Text, nullable=True)
 
@@ -30,7 +38,7 @@ class StagingRaw(Base):
     id = Column(String, primary_key=True)
     source_key = Column(String, nullable=False)
     natural_id = Column(String, nullable=False)         # 외부 원천의 natural key (예: notice_no, interpretation_id)
-    payload = Column(Text, nullable=False)              # JSON 문자열
+    payload = Column(CompressedJSON, nullable=False)    # 원천 레코드 (압축 JSON BLOB)
     checksum = Column(String, nullable=False)
     fetched_at = Column(DateTime, default=datetime.utcnow)
     __table_args__ = (UniqueConstraint("source_key", "natural_id", name="uq_staging_source_natural"),)
@@ -74,6 +82,7 @@ class MinimumWageHistory(Base):
     monthly_209h = Column(Integer, nullable=True)       # 209시간 환산
     notice_no = Column(String, nullable=True)
     notice_date = Column(String, nullable=True)         # YYYY-MM-DD
+    notice_date_iso = _iso_column("notice_date")
     source_url = Column(String, nullable=True)
 
 # --- Must 3: 법령해석(행정해석) ---
@@ -83,21 +92,27 @@ class AdminInterpretation(Base):
     title = Column(String, nullable=False)
     asked_at = Column(String, nullable=True)
     answered_at = Column(String, nullable=True)
+    answered_at_iso = _iso_column("answered_at")
     question = Column(Text, nullable=True)
     answer = Column(Text, nullable=True)
     law_id = Column(String, nullable=True)
     article_no = Column(String, nullable=True)
     source_url = Column(String, nullable=True)
     tags = Column(String, nullable=True)
+    # /knowledge/interpretations keyset 페이지 (answered_at_iso, interp_id) DESC
+    __table_args__ = (Index("ix_admin_interpretations_answered_at_iso", "answered_at_iso", "interp_id"),)
 
 # --- Must 4: 공휴일 ---
 class Holiday(Base):
     __tablename__ = "holidays"
     date = Column(String, primary_key=True)             # YYYY-MM-DD
+    date_iso = _iso_column("date")
     name = Column(String, nullable=False)
     type = Column(String, nullable=True)                # public/anniversary
     is_public = Column(Boolean, default=True)
     source_ref = Column(String, nullable=True)
+    # /knowledge/holidays/{year}: date_iso >= 'YYYY-01-01' AND date_iso < 'YYYY+1-01-01'
+    __table_args__ = (Index("ix_holidays_date_iso", "date_iso"),)
 
 # --- Must 5: 정책 공지/고시 메타(관리 공지) ---
 class PolicyBulletin(Base):
@@ -105,6 +120,7 @@ class PolicyBulletin(Base):
     id = Column(String, primary_key=True)
     title = Column(String, nullable=False)
     effective_date = Column(String, nullable=True)
+    effective_date_iso = _iso_column("effective_date")
     audience = Column(String, nullable=True)            # worker/employer/both
     category = Column(String, nullable=True)
     summary_md = Column(Text, nullable=True)
@@ -112,3 +128,14 @@ class PolicyBulletin(Base):
     article_no = Column(String, nullable=True)
     source_url = Column(String, nullable=True)
     tags = Column(String, nullable=True)
+    # /knowledge/policy_bulletins keyset 페이지 (effective_date_iso, id) DESC
+    __table_args__ = (Index("ix_policy_bulletins_effective_date_iso", "effective_date_iso", "id"),)
+
+# ORM 쓰기(관리자 화면/테스트 등)에서도 *_iso 파생 컬럼을 원본과 맞춘다
+def _fill_iso(mapper, connection, target):
+    for col, src in iso_columns(mapper.local_table).items():
+        setattr(target, col, iso_date(getattr(target, src)))
+
+for _model in (MinimumWageHistory, AdminInterpretation, Holiday, PolicyBulletin):
+    event.listen(_model, "before_insert", _fill_iso)
+    event.listen(_model, "before_update", _fill_iso)
@@ -1,8 +1,9 @@
 # worklaw-backend/models/law.py
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text, ForeignKey, DateTime, UniqueConstraint, JSON
+from sqlalchemy import Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
 from datetime import datetime
 from database.connection import Base
+from database.types import CompressedJSON
 
 class Law(Base):
     __tablename__ = "law"
@@ -14,7 +15,7 @@ class Law(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
-    articles: Mapped[list["LawArticle"]] = relationship("LawArticle", back_populates="law", cascade="all, delete-orphan")
+    articles: Mapped[list["LawArticle"]] = relationship("models.law.LawArticle", back_populates="law", cascade="all, delete-orphan")
 
 class LawArticle(Base):
     __tablename__ = "law_article"
@@ -23,11 +24,12 @@ class LawArticle(Base):
     article_no: Mapped[str] = mapped_column(String(50), index=True)  # 제1조, 제2조 등 조문 번호 문자열
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)  # 조문 표제
     current_text: Mapped[str | None] = mapped_column(Text, nullable=True)  # 현행 조문 본문 (가공 텍스트)
-    current_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # 원본 JSON 보존
+    current_json: Mapped[dict | None] = mapped_column(CompressedJSON, nullable=True)  # 원본 JSON 보존 (압축 BLOB)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)  # 정규화 본문+시행일 SHA-256 (변경 감지)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
-    law: Mapped["Law"] = relationship("Law", back_populates="articles")
-    versions: Mapped[list["LawArticleVersion"]] = relationship("LawArticleVersion", back_populates="article", cascade="all, delete-orphan")
+    law: Mapped["Law"] = relationship("models.law.Law", back_populates="articles")
+    versions: Mapped[list["LawArticleVersion"]] = relationship("models.law.LawArticleVersion", back_populates="article", cascade="all, delete-orphan")
 
     __table_args__ = (
         UniqueConstraint("law_id_fk", "article_no", name="uq_law_article_unique"),
@@ -39,7 +41,7 @@ class LawArticleVersion(Base):
     article_id_fk: Mapped[int] = mapped_column(Integer, ForeignKey("law_article.id"), index=True)
     effective_date: Mapped[str | None] = mapped_column(String(20), nullable=True)  # 시행일(YYYYMMDD)
     text: Mapped[str | None] = mapped_column(Text, nullable=True)
-    raw_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    raw_json: Mapped[dict | None] = mapped_column(CompressedJSON, nullable=True)  # 압축 BLOB
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
-    article: Mapped["LawArticle"] = relationship("LawArticle", back_populates="versions")
+    article: Mapped["LawArticle"] = relationship("models.law.LawArticle", back_populates="versions")
@@ -0,0 +1,83 @@
+# worklaw-backend/routers/business_days.py
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from utils import business_calendar
+from utils.business_calendar import CalendarRangeError
+
+router = APIRouter(prefix="/calendar", tags=["calendar"])
+
+class BusinessDayCount(BaseModel):
+    start: date
+    end: date
+    days: int
+    business_days: int
+    non_working_days: int
+    missing_holiday_years: List[int]     # holidays 데이터가 없어 주말만 반영된 연도
+
+class BusinessDayShift(BaseModel):
+    start: date
+    days: int
+    result: date
+    missing_holiday_years: List[int]
+
+class DayInfo(BaseModel):
+    date: date
+    is_business_day: bool
+    is_weekend: bool
+    is_holiday: bool
+    is_substitute: bool
+    holiday_name: Optional[str] = None
+
+async def _calendar() -> business_calendar.BusinessCalendar:
+    # 모듈 전역은 한 번만 읽음 → 그 사이 다른 요청의 reload/invalidate와 섞이지 않고,
+    # 다시 빌드해야 하면 항상 스레드풀에서 (이벤트 루프에서 동기 빌드하지 않음)
+    cal = business_calendar.current()
+    if cal is None:
+        cal = await run_in_threadpool(business_calendar.reload)
+    return cal
+
+@router.get("/business-days", response_model=BusinessDayCount, summary="Count business days between two dates (inclusive)")
+async def count_business_days(
+    start: date = Query(..., description="시작일 (포함, YYYY-MM-DD)"),
+    end: date = Query(..., description="종료일 (포함, YYYY-MM-DD)"),
+):
+    cal = await _calendar()
+    try:
+        n = cal.count_business_days(start, end)
+    except CalendarRangeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    days = (end - start).days + 1
+    return {
+        "start": start,
+        "end": end,
+        "days": days,
+        "business_days": n,
+        "non_working_days": days - n,
+        "missing_holiday_years": cal.missing_years(start, end),
+    }
+
+@router.get("/add-business-days", response_model=BusinessDayShift, summary="Add (or subtract) N business days to a date")
+async def add_business_days(
+    start: date = Query(..., description="기준일 (YYYY-MM-DD)"),
+    days: int = Query(..., ge=-100_000, le=100_000, description="양수: 이후 N번째 근무일, 음수: 이전, 0: 기준일 또는 다음 근무일"),
+):
+    cal = await _calendar()
+    try:
+        result = cal.add_business_days(start, days)
+    except CalendarRangeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    lo, hi = min(start, result), max(start, result)
+    return {"start": start, "days": days, "result": result, "missing_holiday_years": cal.missing_years(lo, hi)}
+
+@router.get("/days/{day}", response_model=DayInfo, summary="Is the date a holiday / business day")
+async def day_info(day: date):
+    cal = await _calendar()
+    try:
+        return cal.describe(day)
+    except CalendarRangeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
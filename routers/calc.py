@@ -0,0 +1,59 @@
+# worklaw-backend/routers/calc.py
+import json
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from utils import wage_check, wage_table
+
+router = APIRouter(prefix="/calc", tags=["calc"])
+
+async def _read_arrays(request: Request):
+    ctype = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if ctype == "multipart/form-data":
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or not hasattr(upload, "read"):
+            raise HTTPException(status_code=400, detail="multipart upload needs a 'file' field (CSV)")
+        data = await upload.read()
+        return await run_in_threadpool(wage_check.arrays_from_csv, data)
+    body = await request.body()
+    if ctype in ("text/csv", "application/csv"):
+        return await run_in_threadpool(wage_check.arrays_from_csv, body)
+    try:
+        payload = json.loads(body or b"null")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="body must be JSON or CSV")
+    rows = payload.get("rows") if isinstance(payload, dict) else payload
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail='JSON body must be {"rows": [...]} or a list of rows')
+    return await run_in_threadpool(wage_check.arrays_from_rows, rows)
+
+@router.post("/minimum-wage-check", summary="Check monthly pay rows against the minimum wage (batch)")
+async def minimum_wage_check(
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$", description="응답 형식 (기본 ndjson)"),
+):
+    """
+    입력: JSON {"rows": [{year, monthly_pay, contracted_hours?, allowances?}, ...]}
+          또는 CSV (text/csv 본문 / multipart 'file' 업로드, 헤더 필수)
+    출력: 행별 결과를 NDJSON(기본) 또는 CSV로 스트리밍. 요약은 X-Rows / X-Violations / X-Errors 헤더.
+    """
+    try:
+        arrays = await _read_arrays(request)
+    except wage_check.InputError as e:
+        status = 413 if "too many rows" in str(e) else 422
+        raise HTTPException(status_code=status, detail=str(e))
+
+    table = await wage_table.get_table_async()
+    result = await run_in_threadpool(wage_check.compute, table, arrays)
+    stats = wage_check.summary(result)
+
+    if format is None and "text/csv" in request.headers.get("accept", ""):
+        format = "csv"
+    headers = {"X-Rows": str(stats["rows"]), "X-Violations": str(stats["violations"]), "X-Errors": str(stats["errors"])}
+    if format == "csv":
+        return StreamingResponse(wage_check.iter_csv(result), media_type="text/csv; charset=utf-8", headers=headers)
+    return StreamingResponse(wage_check.iter_ndjson(result), media_type="application/x-ndjson", headers=headers)
@@ -1,54 +1,57 @@
-from datetime import datetime
-from typing import Optional
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.orm import Session
 
-from fastapi import APIRouter, Header, HTTPException, status, Depends
+from database.connection import get_read_db
+from routers.auth import get_current_admin
+from routers.knowledge_public import reset_schema
+from utils import business_calendar
+from utils.sync_jobs import sync_runner
 
 router = APIRouter(prefix="/admin/sync", tags=["admin:sync"])
 
-# --- 간단 관리자 인증 (헤더만 확인; 프로젝트 보안 규칙에 맞게 강화 가능) ----
-def require_admin(authorization: Optional[str] = Header(None)):
-    # FastAPI가 호출 시점에 문자열로 주입해줍니다.
-    if not authorization or not isinstance(authorization, str) or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Unauthorized: missing or invalid Authorization header",
-        )
-    # TODO: JWT 서명/만료 검증 등 실제 로직 연결
-    return True
-
 # --- 공통 응답 포맷 -----------------------------------------------------------
-def ok(job: str, items_upserted: int = 0, note: str = "noop"):
+# 작업 종료 시 스키마 재해석 (캐시 무효화는 실행기가 source_key 기준으로 수행)
+sync_runner.on_finished.append(lambda source_key: reset_schema())
+sync_runner.on_finished.append(
+    lambda source_key: business_calendar.invalidate() if source_key == "holiday_api" else None
+)
+
+def enqueue(job: str):
+    # ETL은 백그라운드 스레드에서 실행, 요청은 job_id만 받고 즉시 반환
+    job_id, created = sync_runner.submit(job)
     return {
         "job": job,
-        "status": "ok",
-        "items_upserted": items_upserted,
-        "finished_at": datetime.utcnow().isoformat() + "Z",
-        "note": note,
+        "job_id": job_id,
+        "status": "queued" if created else "already_running",
+        "poll": f"/admin/sync/jobs/{job_id}",
     }
 
-# --- 동기화 엔드포인트 (스텁 / 이후 실제 ETL로 교체) -------------------------
-# 의존성은 반드시 Depends(require_admin) 로 주입하세요.
-@router.post("/minwage", summary="Sync minimum wage (stub)")
-def sync_minwage(_: bool = Depends(require_admin)):
-    # TODO: 실제 ETL 로직으로 교체
-    return ok("minwage", items_upserted=0, note="stub")
-
-@router.post("/holiday_api", summary="Sync holidays (stub)")
-def sync_holiday(_: bool = Depends(require_admin)):
-    # TODO: 실제 공휴일 API 연동
-    return ok("holiday_api", items_upserted=0, note="stub")
-
-@router.post("/law_api", summary="Sync laws (stub)")
-def sync_law(_: bool = Depends(require_admin)):
-    # TODO: 국가법령정보센터 OpenAPI 연동
-    return ok("law_api", items_upserted=0, note="stub")
-
-@router.post("/interpretation_api", summary="Sync admin interpretations (stub)")
-def sync_interpretation(_: bool = Depends(require_admin)):
-    # TODO: 행정해석 수집 연동
-    return ok("interpretation_api", items_upserted=0, note="stub")
-
-@router.post("/moel_notice", summary="Sync MOEL notices (stub)")
-def sync_moel_notice(_: bool = Depends(require_admin)):
-    # TODO: 고용노동부 공지/보도자료 수집
-    return ok("moel_notice", items_upserted=0, note="stub")
+# --- 동기화 엔드포인트 ----------------------------------------------------------
+# 실제 ETL 쓰기를 시작하므로 관리자 JWT(role=admin) 필수: Depends(get_current_admin)
+@router.post("/minwage", summary="Sync minimum wage", status_code=status.HTTP_202_ACCEPTED)
+def sync_minwage(_: dict = Depends(get_current_admin)):
+    return enqueue("minwage")
+
+@router.post("/holiday_api", summary="Sync holidays", status_code=status.HTTP_202_ACCEPTED)
+def sync_holiday(_: dict = Depends(get_current_admin)):
+    return enqueue("holiday_api")
+
+@router.post("/law_api", summary="Sync laws", status_code=status.HTTP_202_ACCEPTED)
+def sync_law(_: dict = Depends(get_current_admin)):
+    return enqueue("law_api")
+
+@router.post("/interpretation_api", summary="Sync admin interpretations", status_code=status.HTTP_202_ACCEPTED)
+def sync_interpretation(_: dict = Depends(get_current_admin)):
+    return enqueue("interpretation_api")
+
+@router.post("/moel_notice", summary="Sync MOEL notices", status_code=status.HTTP_202_ACCEPTED)
+def sync_moel_notice(_: dict = Depends(get_current_admin)):
+    return enqueue("moel_notice")
+
+# --- 진행 상황 조회 -------------------------------------------------------------
+@router.get("/jobs/{job_id}", summary="Sync job progress")
+def get_sync_job(job_id: str, _: dict = Depends(get_current_admin), db: Session = Depends(get_read_db)):
+    job = sync_runner.status(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="job not found")
+    return job
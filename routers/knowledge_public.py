@@ -1,23 +1,24 @@
-from typing import List, Optional, Any, Iterable
-from fastapi import APIRouter, Depends
+import base64
+import json
+import logging
+import threading
+from typing import List, Optional, Any
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import select, text, desc
+from sqlalchemy import text, inspect
+from sqlalchemy.engine import Connectable
 
-# --- DB 세션 의존성 ---------------------------------------------------------
-try:
-    from database.connection import SessionLocal
-except Exception as e:  # pragma: no cover
-    raise RuntimeError("Cannot import SessionLocal from database.connection") from e
+from utils.cache import knowledge_cache
+from utils.http_cache import conditional_response, latest_datetime, make_etag, parse_datetime
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+from database.async_db import ReadDB, get_read_runner
+from database.table_versions import VERSION_TABLE
+
+logger = logging.getLogger("worklaw.knowledge")
 
-# --- 모델 import (있으면 사용, 없으면 원시 SQL로 폴백) ------------------------
+# --- 모델 import (있으면 테이블명을 1순위 후보로 사용) ---------------------------
 try:
     from models.knowledge_core import (
         MinimumWageHistory,
@@ -26,7 +27,7 @@ try:
         AdminInterpretation,
     )
 except Exception:
-    # 프로젝트 구조에 따라 존재하지 않을 수 있음 → None으로 두고 SQL fallback 사용
+    # 프로젝트 구조에 따라 존재하지 않을 수 있음 → 후보 테이블명만으로 해석
     MinimumWageHistory = None  # type: ignore
     PolicyBulletin = None      # type: ignore
     Holiday = None             # type: ignore
@@ -74,221 +75,450 @@ class InterpretationItem(BaseModel):
     source_url: Optional[str] = None
     tags: Optional[str] = None
 
-# --- 유틸: 안전 질의(fail-soft) ----------------------------------------------
-def _rows_to_list(rows: Iterable[Any]) -> list[dict]:
-    out = []
-    for r in rows:
-        if isinstance(r, dict):
-            out.append(r)
-        else:
-            # SQLAlchemy ORM 객체 혹은 Row → dict로 추정 변환
-            try:
-                out.append({k: getattr(r, k) for k in dir(r) if not k.startswith("_") and not callable(getattr(r, k))})
-            except Exception:
-                try:
-                    out.append(dict(r._mapping))  # Row
-                except Exception:
-                    pass
+# --- 스키마 해석 (startup 1회) -------------------------------------------------
+# 리소스별로 후보 테이블/컬럼을 정의해 두고, 앱 시작 시 Inspector로 실제 스키마를
+# 확인한 뒤 엔드포인트당 SELECT 문 하나를 미리 만들어 둔다.
+# 요청 경로에서는 그 문장 하나만 실행한다(폴백 SQL 반복 시도 없음).
+def _tablename(model: Any, default: str) -> str:
+    return getattr(model, "__tablename__", None) or default
+
+# 출력 컬럼 → 실제 컬럼 후보(앞쪽 우선). 후보가 하나도 없으면 NULL로 채움.
+_RESOURCES: dict[str, dict] = {
+    "minimum_wage": {
+        "source_key": "minwage",
+        "cache_prefix": "minimum_wage",
+        "tables": [_tablename(MinimumWageHistory, "minimum_wage_history")],
+        "columns": {
+            "year": ["year"],
+            "hourly": ["hourly", "amount"],
+            "monthly_209h": ["monthly_209h"],
+            "notice_no": ["notice_no"],
+            "notice_date": ["notice_date"],
+            "source_url": ["source_url"],
+        },
+        "required": ["year", "hourly"],
+        "where": "",
+        "order_by": "year DESC",
+    },
+    "holidays": {
+        "source_key": "holiday_api",
+        "cache_prefix": "holidays:",
+        "tables": [_tablename(Holiday, "holidays"), "holiday"],
+        "columns": {
+            "date": ["date"],
+            "name": ["name"],
+            "type": ["type"],
+            "is_public": ["is_public"],
+            "source_ref": ["source_ref"],
+        },
+        "required": ["date", "name"],
+        "where": "date LIKE :prefix",
+        "order_by": "date ASC",
+        # 정규화 컬럼이 있으면(마이그레이션 20261018_knowledge_iso_dates) 인덱스 범위 조건으로
+        "indexed": {
+            "column": "date_iso",
+            "where": "date_iso >= :start AND date_iso < :end",
+            "order_by": "date_iso ASC",
+        },
+    },
+    "policy_bulletins": {
+        "source_key": "moel_notice",
+        "cache_prefix": "policy_bulletins",
+        "tables": [_tablename(PolicyBulletin, "policy_bulletins"), "policy_bulletin"],
+        "columns": {
+            "id": ["id"],
+            "title": ["title"],
+            "effective_date": ["effective_date"],
+            "audience": ["audience"],
+            "category": ["category"],
+            "summary_md": ["summary_md"],
+            "law_id": ["law_id"],
+            "article_no": ["article_no"],
+            "source_url": ["source_url"],
+            "tags": ["tags"],
+        },
+        "required": ["id", "title"],
+        "where": "",
+        "order_by": "COALESCE(effective_date, '') DESC, id DESC",
+        # 커서 페이지네이션: (sort, key) 내림차순 keyset
+        "key": "id",
+        "sort": "effective_date",
+        "indexed": {"column": "effective_date_iso", "order_by": "effective_date_iso DESC, id DESC"},
+    },
+    "interpretations": {
+        "source_key": "interpretation_api",
+        "cache_prefix": "interpretations",
+        "tables": [_tablename(AdminInterpretation, "admin_interpretations"), "admin_interpretation"],
+        "columns": {
+            "interp_id": ["interp_id"],
+            "title": ["title"],
+            "asked_at": ["asked_at"],
+            "answered_at": ["answered_at"],
+            "question": ["question"],
+            "answer": ["answer"],
+            "law_id": ["law_id"],
+            "article_no": ["article_no"],
+            "source_url": ["source_url"],
+            "tags": ["tags"],
+        },
+        "required": ["interp_id", "title"],
+        "where": "",
+        "order_by": "COALESCE(answered_at, asked_at) DESC",
+        "key": "interp_id",
+        "sort": "answered_at",
+        "indexed": {"column": "answered_at_iso", "order_by": "answered_at_iso DESC, interp_id DESC"},
+    },
+}
+
+_schema_lock = threading.Lock()
+_PLANS: dict[str, dict | None] | None = None
+
+def _build_plan(spec: dict, table: str, existing: set[str]) -> dict | None:
+    mapping: dict[str, str | None] = {}
+    for out_col, candidates in spec["columns"].items():
+        mapping[out_col] = next((c for c in candidates if c in existing), None)
+    if any(mapping[c] is None for c in spec["required"]):
+        return None
+    select_list = ", ".join(
+        (f"{src} AS {out}" if src != out else src) if src else f"NULL AS {out}"
+        for out, src in mapping.items()
+    )
+    # 정규화(*_iso) 컬럼이 있으면 인덱스를 타는 범위 조건/정렬, 없으면 기존 LIKE/COALESCE
+    indexed = spec.get("indexed")
+    sort_src = None
+    if indexed and indexed["column"] in existing:
+        where, order_by, sort_src = indexed.get("where", spec["where"]), indexed["order_by"], indexed["column"]
+    else:
+        where, order_by = spec["where"], spec["order_by"]
+    sql = f"SELECT {select_list} FROM {table}"
+    if where:
+        sql += f" WHERE {where}"
+    sql += f" ORDER BY {order_by}"
+    plan = {"table": table, "columns": mapping, "sql": sql, "stmt": text(sql), "sort_src": sort_src}
+    if spec.get("key"):
+        key_src = mapping[spec["key"]]
+        plan["detail_stmt"] = text(f"SELECT {select_list} FROM {table} WHERE {key_src} = :key")
+        plan["page_stmts"] = {}
+    return plan
+
+def _page_stmt(plan: dict, spec: dict, fields: tuple[str, ...], with_cursor: bool):
+    """
+    keyset 페이지 SELECT (필드 조합/커서 유무별로 한 번만 컴파일해 plan에 보관).
+    정렬키는 *_iso 컬럼(빈 값 '')이 있으면 그대로 써서 (sort, key) 인덱스를 타고,
+    없으면 COALESCE(sort, '')로 NULL을 가장 뒤로 보낸다.
+    """
+    cache_key = (fields, with_cursor)
+    stmt = plan["page_stmts"].get(cache_key)
+    if stmt is not None:
+        return stmt
+    mapping = plan["columns"]
+    key_src = mapping[spec["key"]]
+    if plan.get("sort_src"):
+        sort_expr = plan["sort_src"]
+    else:
+        sort_src = mapping[spec["sort"]]
+        sort_expr = f"COALESCE({sort_src}, '')" if sort_src else "''"
+    cols = [f"{sort_expr} AS _sort", f"{key_src} AS _key"]
+    for out in fields:
+        src = mapping[out]
+        cols.append((f"{src} AS {out}" if src != out else src) if src else f"NULL AS {out}")
+    sql = f"SELECT {', '.join(cols)} FROM {plan['table']}"
+    if with_cursor:
+        sql += f" WHERE ({sort_expr}, {key_src}) < (:c_sort, :c_key)"
+    sql += f" ORDER BY {sort_expr} DESC, {key_src} DESC LIMIT :limit"
+    stmt = text(sql)
+    plan["page_stmts"][cache_key] = stmt
+    return stmt
+
+def _build_version_stmt(table: str, has_sync_jobs: bool, has_versions: bool = False):
+    # 테이블 콘텐츠 버전: 행 수 + 마지막 성공 동기화(SyncJob)의 checksum/완료시각
+    # + 트리거 카운터(database/table_versions.py) → 동기화 밖의 제자리 UPDATE도 버전이 바뀜
+    if has_versions:
+        version_cols = f"""(SELECT version FROM {VERSION_TABLE} WHERE table_name = '{table}') AS version,
+                  (SELECT changed_at FROM {VERSION_TABLE} WHERE table_name = '{table}') AS changed_at"""
+    else:
+        version_cols = "NULL AS version, NULL AS changed_at"
+    if has_sync_jobs:
+        sync_cols = """(SELECT checksum FROM sync_jobs
+                   WHERE source_key = :source_key AND status = 'success'
+                   ORDER BY finished_at DESC LIMIT 1) AS checksum,
+                  (SELECT MAX(finished_at) FROM sync_jobs
+                   WHERE source_key = :source_key AND status = 'success') AS finished_at"""
+    else:
+        sync_cols = "NULL AS checksum, NULL AS finished_at"
+    return text(f"SELECT (SELECT COUNT(*) FROM {table}) AS n, {sync_cols}, {version_cols}")
+
+def resolve_schema(bind: Connectable) -> dict[str, dict | None]:
+    """
+    sqlite_master/Inspector를 한 번 조회해 리소스별 테이블·컬럼 매핑을 고르고
+    SELECT 문을 컴파일해 둔다. 테이블이 없으면 해당 리소스는 None(빈 배열 응답).
+    """
+    global _PLANS
+    insp = inspect(bind)
+    tables = set(insp.get_table_names())
+    plans: dict[str, dict | None] = {}
+    for name, spec in _RESOURCES.items():
+        plan = None
+        for table in spec["tables"]:
+            if table not in tables:
+                continue
+            existing = {c["name"] for c in insp.get_columns(table)}
+            plan = _build_plan(spec, table, existing)
+            if plan:
+                plan["version_stmt"] = _build_version_stmt(table, "sync_jobs" in tables, VERSION_TABLE in tables)
+                break
+        plans[name] = plan
+    with _schema_lock:
+        _PLANS = plans
+    logger.info("knowledge schema resolved: %s", schema_summary())
+    return plans
+
+def reset_schema() -> None:
+    """다음 요청에서 스키마를 다시 해석하도록 초기화 (동기화로 테이블이 생긴 경우 등)"""
+    global _PLANS
+    with _schema_lock:
+        _PLANS = None
+
+def schema_summary() -> dict[str, str | None]:
+    """헬스 체크/로그용: 리소스 → '테이블(출력컬럼<-원본컬럼, ...)'"""
+    plans = _PLANS
+    if plans is None:
+        return {}
+    out: dict[str, str | None] = {}
+    for name, plan in plans.items():
+        if plan is None:
+            out[name] = None
+            continue
+        renamed = [f"{o}<-{src}" if src else f"{o}<-NULL" for o, src in plan["columns"].items() if src != o]
+        out[name] = plan["table"] + (f"({', '.join(renamed)})" if renamed else "")
     return out
 
-def _safe_query(db: Session, sql: str, params: dict | None = None) -> list[dict]:
+def _run(db: Session, name: str, params: dict | None = None) -> list[dict]:
+    # startup 이벤트가 돌지 않은 환경(테스트 클라이언트 등)에서는 첫 요청 시 해석
+    plan = _plans_for(db).get(name)
+    if plan is None:
+        return []
+    return [dict(row._mapping) for row in db.execute(plan["stmt"], params or {})]
+
+def _plans_for(db: Session) -> dict[str, dict | None]:
+    plans = _PLANS
+    if plans is None:
+        plans = resolve_schema(db.get_bind())
+    return plans
+
+def _content_version(db: Session, name: str) -> tuple[str, datetime | None]:
+    """
+    리소스의 (ETag 재료, Last-Modified). 캐시 prefix 아래에 보관하므로
+    invalidate_source()가 응답과 함께 버전도 지운다.
+    """
+    spec = _RESOURCES[name]
+    key = spec["cache_prefix"] + "#version"
+
+    def compute() -> tuple:
+        plan = _plans_for(db).get(name)
+        if plan is None:
+            return ("missing", None, None, None, None)
+        row = db.execute(plan["version_stmt"], {"source_key": spec["source_key"]}).one()
+        return (row.n, row.checksum, parse_datetime(row.finished_at), row.version, parse_datetime(row.changed_at))
+
+    n, checksum, finished_at, version, changed_at = knowledge_cache.get_or_set(key, compute)
+    return make_etag(name, n, checksum, finished_at, version), latest_datetime(finished_at, changed_at)
+
+def _not_modified(request: Request, response: Response, db: Session, name: str, key: str) -> Response | None:
+    # 같은 테이블이라도 URL(키)별로 본문이 다르므로 키를 ETag에 섞는다
+    etag, last_modified = _content_version(db, name)
+    return conditional_response(request, response, make_etag(etag, key), last_modified)
+
+# --- 커서/필드 프로젝션 --------------------------------------------------------
+def _encode_cursor(sort_value: Any, key: Any) -> str:
+    raw = json.dumps([sort_value, key], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
     try:
-        res = db.execute(text(sql), params or {})
-        # sqlite일 때 Row → dict 변환
-        return [dict(row._mapping) for row in res]
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return str(sort_value), str(key)
     except Exception:
-        return []
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _parse_fields(name: str, fields: Optional[str]) -> tuple[str, ...]:
+    """fields=answered_at,tags → 출력 필드 튜플(키/title은 항상 포함, 선언 순서 유지)"""
+    spec = _RESOURCES[name]
+    allowed = list(spec["columns"])
+    if not fields:
+        return tuple(allowed)
+    wanted = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = wanted - set(allowed)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    wanted.update((spec["key"], "title"))
+    return tuple(f for f in allowed if f in wanted)
+
+def _page(db: Session, name: str, limit: int, cursor: Optional[str], fields: tuple[str, ...]) -> dict:
+    """한 페이지 조회: limit+1건을 읽어 다음 커서 존재 여부를 판단"""
+    plan = _plans_for(db).get(name)
+    if plan is None:
+        return {"items": [], "next": None}
+    spec = _RESOURCES[name]
+    params: dict[str, Any] = {"limit": limit + 1}
+    if cursor:
+        params["c_sort"], params["c_key"] = _decode_cursor(cursor)
+    rows = [dict(r._mapping) for r in db.execute(_page_stmt(plan, spec, fields, bool(cursor)), params)]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["_sort"], rows[-1]["_key"])
+    return {"items": [{f: r[f] for f in fields} for r in rows], "next": next_cursor}
+
+def _detail(db: Session, name: str, key: str) -> dict | None:
+    plan = _plans_for(db).get(name)
+    if plan is None:
+        return None
+    row = db.execute(plan["detail_stmt"], {"key": key}).first()
+    return dict(row._mapping) if row else None
+
+def _dump(items: list[BaseModel]) -> list[dict]:
+    # 캐시에는 직렬화가 끝난 dict 목록을 보관 (요청마다 모델 재구성 방지)
+    return [i.model_dump() for i in items]
 
 # --- Endpoints ----------------------------------------------------------------
+# 응답은 utils.cache.knowledge_cache에 키별(예: holidays:2025)로 보관되고,
+# /admin/sync/* 및 ETL run()이 커밋 후 invalidate_source()로 무효화한다.
+# If-None-Match / If-Modified-Since가 현재 버전과 맞으면 본문 없이 304.
 
 @router.get("/minimum_wage", response_model=List[MinimumWageItem], summary="List minimum wage rows")
-def list_minimum_wage(db: Session = Depends(get_db)):
-    # 1) ORM 경로(모델이 있으면)
-    if MinimumWageHistory is not None:
-        try:
-            stmt = select(MinimumWageHistory).order_by(desc(MinimumWageHistory.year))
-            rows = db.execute(stmt).scalars().all()
-            return [
-                MinimumWageItem(
-                    year=getattr(r, "year"),
-                    hourly=getattr(r, "hourly", getattr(r, "amount", 0)),
-                    monthly_209h=getattr(r, "monthly_209h", None),
-                    notice_no=getattr(r, "notice_no", None),
-                    notice_date=getattr(r, "notice_date", None),
-                    source_url=getattr(r, "source_url", None),
-                ) for r in rows
-            ]
-        except Exception:
-            pass  # 폴백으로 진행
-
-    # 2) SQL 폴백 (테이블명/컬럼명은 기존 로그 기준으로 우선 시도)
-    sql_try = [
-        # knowledge_core 마이그레이션 기준
-        """SELECT year, hourly, monthly_209h, notice_no, notice_date, source_url
-           FROM minimum_wage_history ORDER BY year DESC""",
-        # 과거 스키마(혹시 amount, unit만 있을 경우)
-        """SELECT year,
-                  COALESCE(hourly, amount) AS hourly,
-                  monthly_209h, notice_no, notice_date, source_url
-           FROM minimum_wage_history ORDER BY year DESC""",
+async def list_minimum_wage(request: Request, response: Response, db: ReadDB = Depends(get_read_runner)):
+    return await db.run(_list_minimum_wage, request, response)
+
+def _list_minimum_wage(db: Session, request: Request, response: Response):
+    nm = _not_modified(request, response, db, "minimum_wage", "minimum_wage")
+    if nm:
+        return nm
+    return knowledge_cache.get_or_set("minimum_wage", lambda: _dump(_load_minimum_wage(db)))
+
+def _load_minimum_wage(db: Session) -> list[MinimumWageItem]:
+    return [
+        MinimumWageItem(
+            year=int(r["year"]),
+            hourly=int(r["hourly"] or 0),
+            monthly_209h=(int(r["monthly_209h"]) if r["monthly_209h"] is not None else None),
+            notice_no=r["notice_no"],
+            notice_date=r["notice_date"],
+            source_url=r["source_url"],
+        ) for r in _run(db, "minimum_wage")
     ]
-    for s in sql_try:
-        rows = _safe_query(db, s)
-        if rows:
-            return [
-                MinimumWageItem(
-                    year=int(r.get("year")),
-                    hourly=int(r.get("hourly") or r.get("amount") or 0),
-                    monthly_209h=(int(r["monthly_209h"]) if r.get("monthly_209h") is not None else None),
-                    notice_no=r.get("notice_no"),
-                    notice_date=r.get("notice_date"),
-                    source_url=r.get("source_url"),
-                ) for r in rows
-            ]
-    # 아무 것도 없으면 빈 배열(500 방지)
-    return []
 
 @router.get("/holidays/{year}", response_model=List[HolidayItem], summary="List holidays for a year")
-def list_holidays(year: int, db: Session = Depends(get_db)):
-    if Holiday is not None:
-        try:
-            # 일반적으로 date가 'YYYY-MM-DD' 문자열이라고 가정
-            stmt = select(Holiday).where(Holiday.date.like(f"{year}-%")).order_by(Holiday.date.asc())
-            rows = db.execute(stmt).scalars().all()
-            return [
-                HolidayItem(
-                    date=getattr(r, "date"),
-                    name=getattr(r, "name"),
-                    type=getattr(r, "type", None),
-                    is_public=getattr(r, "is_public", True),
-                    source_ref=getattr(r, "source_ref", None),
-                ) for r in rows
-            ]
-        except Exception:
-            pass
-
-    # SQL 폴백 (holiday / holidays 양쪽 테이블명 시도)
-    sql_try = [
-        """SELECT date, name, type, is_public, source_ref
-           FROM holidays
-           WHERE date LIKE :prefix
-           ORDER BY date ASC""",
-        """SELECT date, name, type, is_public, source_ref
-           FROM holiday
-           WHERE date LIKE :prefix
-           ORDER BY date ASC""",
-    ]
-    for s in sql_try:
-        rows = _safe_query(db, s, {"prefix": f"{year}-%"})
-        if rows:
-            out = []
-            for r in rows:
-                out.append(HolidayItem(
-                    date=str(r.get("date")),
-                    name=str(r.get("name")),
-                    type=r.get("type"),
-                    is_public=bool(r.get("is_public")) if r.get("is_public") is not None else True,
-                    source_ref=r.get("source_ref"),
-                ))
-            return out
-    return []
-
-@router.get("/policy_bulletins", response_model=List[PolicyBulletinItem], summary="List policy bulletins")
-def list_policy_bulletins(db: Session = Depends(get_db)):
-    if PolicyBulletin is not None:
-        try:
-            stmt = select(PolicyBulletin).order_by(desc(getattr(PolicyBulletin, "effective_date", None)))
-            rows = db.execute(stmt).scalars().all()
-            return [
-                PolicyBulletinItem(
-                    id=str(getattr(r, "id")),
-                    title=getattr(r, "title"),
-                    effective_date=getattr(r, "effective_date", None),
-                    audience=getattr(r, "audience", None),
-                    category=getattr(r, "category", None),
-                    summary_md=getattr(r, "summary_md", None),
-                    law_id=getattr(r, "law_id", None),
-                    article_no=getattr(r, "article_no", None),
-                    source_url=getattr(r, "source_url", None),
-                    tags=getattr(r, "tags", None),
-                ) for r in rows
-            ]
-        except Exception:
-            pass
-
-    sql_try = [
-        """SELECT id, title, effective_date, audience, category, summary_md, law_id, article_no, source_url, tags
-           FROM policy_bulletin
-           ORDER BY COALESCE(effective_date, '') DESC, id DESC""",
-        """SELECT id, title, effective_date, audience, category, summary_md, law_id, article_no, source_url, tags
-           FROM policy_bulletins
-           ORDER BY COALESCE(effective_date, '') DESC, id DESC""",
-    ]
-    for s in sql_try:
-        rows = _safe_query(db, s)
-        if rows:
-            return [
-                PolicyBulletinItem(
-                    id=str(r.get("id")),
-                    title=str(r.get("title")),
-                    effective_date=r.get("effective_date"),
-                    audience=r.get("audience"),
-                    category=r.get("category"),
-                    summary_md=r.get("summary_md"),
-                    law_id=r.get("law_id"),
-                    article_no=r.get("article_no"),
-                    source_url=r.get("source_url"),
-                    tags=r.get("tags"),
-                ) for r in rows
-            ]
-    return []
-
-@router.get("/interpretations", response_model=List[InterpretationItem], summary="List admin interpretations")
-def list_interpretations(db: Session = Depends(get_db)):
-    if AdminInterpretation is not None:
-        try:
-            stmt = select(AdminInterpretation).order_by(desc(getattr(AdminInterpretation, "answered_at", None)))
-            rows = db.execute(stmt).scalars().all()
-            return [
-                InterpretationItem(
-                    interp_id=str(getattr(r, "interp_id")),
-                    title=getattr(r, "title"),
-                    asked_at=getattr(r, "asked_at", None),
-                    answered_at=getattr(r, "answered_at", None),
-                    question=getattr(r, "question", None),
-                    answer=getattr(r, "answer", None),
-                    law_id=getattr(r, "law_id", None),
-                    article_no=getattr(r, "article_no", None),
-                    source_url=getattr(r, "source_url", None),
-                    tags=getattr(r, "tags", None),
-                ) for r in rows
-            ]
-        except Exception:
-            pass
-
-    sql_try = [
-        """SELECT interp_id, title, asked_at, answered_at, question, answer, law_id, article_no, source_url, tags
-           FROM admin_interpretation
-           ORDER BY COALESCE(answered_at, asked_at) DESC""",
-        """SELECT interp_id, title, asked_at, answered_at, question, answer, law_id, article_no, source_url, tags
-           FROM admin_interpretations
-           ORDER BY COALESCE(answered_at, asked_at) DESC""",
+async def list_holidays(year: int, request: Request, response: Response, db: ReadDB = Depends(get_read_runner)):
+    return await db.run(_list_holidays, year, request, response)
+
+def _list_holidays(db: Session, year: int, request: Request, response: Response):
+    nm = _not_modified(request, response, db, "holidays", f"holidays:{year}")
+    if nm:
+        return nm
+    return knowledge_cache.get_or_set(f"holidays:{year}", lambda: _dump(_load_holidays(db, year)))
+
+def _load_holidays(db: Session, year: int) -> list[HolidayItem]:
+    # date는 'YYYY-MM-DD' 문자열 (plan에 따라 date_iso 범위 또는 LIKE 접두어 중 하나만 사용)
+    params = {"start": f"{year:04d}-01-01", "end": f"{year + 1:04d}-01-01", "prefix": f"{year}-%"}
+    return [
+        HolidayItem(
+            date=str(r["date"]),
+            name=str(r["name"]),
+            type=r["type"],
+            is_public=bool(r["is_public"]) if r["is_public"] is not None else True,
+            source_ref=r["source_ref"],
+        ) for r in _run(db, "holidays", params)
     ]
-    for s in sql_try:
-        rows = _safe_query(db, s)
-        if rows:
-            return [
-                InterpretationItem(
-                    interp_id=str(r.get("interp_id")),
-                    title=str(r.get("title")),
-                    asked_at=r.get("asked_at"),
-                    answered_at=r.get("answered_at"),
-                    question=r.get("question"),
-                    answer=r.get("answer"),
-                    law_id=r.get("law_id"),
-                    article_no=r.get("article_no"),
-                    source_url=r.get("source_url"),
-                    tags=r.get("tags"),
-                ) for r in rows
-            ]
-    return []
+
+def _policy_bulletin_item(r: dict) -> dict:
+    item = dict(r)
+    item["id"] = str(r["id"])
+    if "title" in r:
+        item["title"] = str(r["title"])
+    return PolicyBulletinItem(**item).model_dump(exclude_unset=True)
+
+def _interpretation_item(r: dict) -> dict:
+    item = dict(r)
+    item["interp_id"] = str(r["interp_id"])
+    if "title" in r:
+        item["title"] = str(r["title"])
+    return InterpretationItem(**item).model_dump(exclude_unset=True)
+
+def _paged_list(
+    db: Session, name: str, to_item, request: Request, response: Response,
+    limit: int, cursor: Optional[str], fields: Optional[str],
+):
+    out_fields = _parse_fields(name, fields)
+    key = f"{_RESOURCES[name]['cache_prefix']}:{limit}:{cursor or ''}:{','.join(out_fields)}"
+    nm = _not_modified(request, response, db, name, key)
+    if nm:
+        return nm
+
+    def build() -> dict:
+        page = _page(db, name, limit, cursor, out_fields)
+        return {"items": [to_item(r) for r in page["items"]], "next": page["next"]}
+
+    page = knowledge_cache.get_or_set(key, build)
+    # 본문은 기존처럼 배열, 다음 페이지 커서는 헤더로 전달
+    if page["next"]:
+        response.headers["X-Next-Cursor"] = page["next"]
+    return page["items"]
+
+# 목록: (정렬일자, id) 내림차순 keyset 페이지. fields=로 큰 본문 컬럼(summary_md 등) 생략 가능.
+# 호환성 변경: 예전에는 전체를 한 번에 반환했지만 이제 limit(기본 50)건까지만 반환한다.
+# 본문 모양(배열)은 그대로이므로 전체가 필요한 클라이언트는 X-Next-Cursor가 없을 때까지 cursor=로 이어서 요청해야 한다.
+_PAGED_DESCRIPTION = (
+    "**Breaking change:** returns at most `limit` rows (default 50) instead of the full list. "
+    "The body is still a JSON array; when more rows exist the `X-Next-Cursor` response header "
+    "holds the cursor for the next page (pass it back as `cursor=`). Repeat until the header is absent "
+    "to read everything."
+)
+@router.get(
+    "/policy_bulletins",
+    response_model=List[PolicyBulletinItem],
+    response_model_exclude_unset=True,
+    summary="List policy bulletins (cursor paginated)",
+    description=_PAGED_DESCRIPTION,
+)
+async def list_policy_bulletins(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기 (기본 50, 최대 500). 전체가 아니라 이 건수까지만 반환"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description="콤마 구분 필드 목록 (예: id,title,effective_date)"),
+    db: ReadDB = Depends(get_read_runner),
+):
+    return await db.run(_paged_list, "policy_bulletins", _policy_bulletin_item, request, response, limit, cursor, fields)
+
+@router.get("/policy_bulletins/{bulletin_id}", response_model=PolicyBulletinItem, summary="Get a policy bulletin")
+async def get_policy_bulletin(bulletin_id: str, db: ReadDB = Depends(get_read_runner)):
+    row = await db.run(_detail, "policy_bulletins", bulletin_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Policy bulletin not found")
+    return _policy_bulletin_item(row)
+
+@router.get(
+    "/interpretations",
+    response_model=List[InterpretationItem],
+    response_model_exclude_unset=True,
+    summary="List admin interpretations (cursor paginated)",
+    description=_PAGED_DESCRIPTION,
+)
+async def list_interpretations(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500, description="페이지 크기 (기본 50, 최대 500). 전체가 아니라 이 건수까지만 반환"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor"),
+    fields: Optional[str] = Query(None, description="콤마 구분 필드 목록 (예: interp_id,title,answered_at)"),
+    db: ReadDB = Depends(get_read_runner),
+):
+    return await db.run(_paged_list, "interpretations", _interpretation_item, request, response, limit, cursor, fields)
+
+@router.get("/interpretations/{interp_id}", response_model=InterpretationItem, summary="Get an admin interpretation")
+async def get_interpretation(interp_id: str, db: ReadDB = Depends(get_read_runner)):
+    row = await db.run(_detail, "interpretations", interp_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Interpretation not found")
+    return _interpretation_item(row)
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
-from database.connection import get_db
+from database.async_db import ReadDB, get_read_runner
 from models.law import Law, LawArticle, LawArticleVersion
+from utils import law_diff, law_timeline
+from utils.http_cache import conditional_response, make_etag
 
 router = APIRouter(prefix="/law", tags=["law"])
 
 @router.get("/list")
-def list_laws(q: Optional[str] = Query(default=None, description="검색어"), db: Session = Depends(get_db)):
+async def list_laws(q: Optional[str] = Query(default=None, description="검색어"), db: ReadDB = Depends(get_read_runner)):
+    return await db.run(_list_laws, q)
+
+def _list_laws(db: Session, q: Optional[str]):
     query = db.query(Law)
     if q:
         like = f"%{q}%"
@@ -27,7 +35,10 @@ def list_laws(q: Optional[str] = Query(default=None, description="검색어"), d
     return [to_dict(l) for l in rows]
 
 @router.get("/articles")
-def list_articles(law_name: str = Query(...), db: Session = Depends(get_db)):
+async def list_articles(request: Request, response: Response, law_name: str = Query(...), db: ReadDB = Depends(get_read_runner)):
+    return await db.run(_list_articles, request, response, law_name)
+
+def _list_articles(db: Session, request: Request, response: Response, law_name: str):
     # law_name/name 중 프로젝트에 있는 컬럼으로 조회
     if hasattr(Law, "law_name"):
         law = db.query(Law).filter(Law.law_name == law_name).first()
@@ -35,45 +46,223 @@ def list_articles(law_name: str = Query(...), db: Session = Depends(get_db)):
         law = db.query(Law).filter(Law.name == law_name).first()
     if not law:
         return []
-    arts = db.query(LawArticle).filter(LawArticle.law_id == law.id).order_by(LawArticle.id).all()
-    res = []
-    for a in arts:
-        # 버전 수 카운트(옵션)
-        vcount = 0
-        if hasattr(LawArticleVersion, "article_id"):
-            vcount = db.query(LawArticleVersion).filter(LawArticleVersion.article_id == a.id).count()
-        res.append({
-            "id": a.id,
-            "law_id": a.law_id,
-            "article_no": getattr(a, "article_no", None),
-            "title": getattr(a, "title", None),
-            "content": getattr(a, "content", ""),
-            "version_count": vcount
-        })
-    return res
+
+    # 조건부 GET: 조문 행을 읽기 전에 집계만으로 304 판단
+    # (조문 수, 최종 갱신시각, 버전 수, 최신 버전 id → version_count 변화도 반영)
+    n, last_modified, n_versions, max_version_id = db.execute(
+        select(
+            func.count(func.distinct(LawArticle.id)),
+            func.max(LawArticle.updated_at),
+            func.count(LawArticleVersion.id),
+            func.max(LawArticleVersion.id),
+        )
+        .select_from(LawArticle)
+        .outerjoin(LawArticleVersion, LawArticleVersion.article_id_fk == LawArticle.id)
+        .where(LawArticle.law_id_fk == law.id)
+    ).one()
+    etag = make_etag("law:articles", law.id, n, last_modified, n_versions, max_version_id, law.updated_at)
+    nm = conditional_response(request, response, etag, last_modified)
+    if nm:
+        return nm
+
+    return [
+        {
+            "id": r.id,
+            "law_id": r.law_id_fk,
+            "article_no": r.article_no,
+            "title": r.title,
+            "current_text": r.current_text,
+            "content": r.current_text or "",  # 하위 호환: 기존 응답 키
+            "version_count": r.version_count,
+        }
+        for r in articles_with_version_counts(db, law.id)
+    ]
+
+def articles_with_version_counts(db: Session, law_pk: int):
+    """
+    조문 목록 + 조문별 버전 수를 LEFT JOIN/GROUP BY 한 번으로 조회 (조문당 COUNT 쿼리 제거)
+    """
+    stmt = (
+        select(
+            LawArticle.id,
+            LawArticle.law_id_fk,
+            LawArticle.article_no,
+            LawArticle.title,
+            LawArticle.current_text,
+            func.count(LawArticleVersion.id).label("version_count"),
+        )
+        .outerjoin(LawArticleVersion, LawArticleVersion.article_id_fk == LawArticle.id)
+        .where(LawArticle.law_id_fk == law_pk)
+        .group_by(LawArticle.id)
+        .order_by(LawArticle.id)
+    )
+    return db.execute(stmt).all()
 
 # ✅ 신규: 조문 버전 목록 API
 @router.get("/article-versions")
-def list_article_versions(
+async def list_article_versions(
     article_id: int = Query(..., description="LawArticle.id"),
-    db: Session = Depends(get_db)
+    db: ReadDB = Depends(get_read_runner)
 ):
-    if not hasattr(LawArticleVersion, "article_id"):
-        # 모델에 버전 테이블이 없거나 매핑되지 않은 경우 빈 배열
-        return []
+    return await db.run(_list_article_versions, article_id)
+
+def _list_article_versions(db: Session, article_id: int):
     versions = (
         db.query(LawArticleVersion)
-        .filter(LawArticleVersion.article_id == article_id)
-        .order_by(getattr(LawArticleVersion, "effective_date", None).desc()
-                  if hasattr(LawArticleVersion, "effective_date") else LawArticleVersion.id.desc())
+        .filter(LawArticleVersion.article_id_fk == article_id)
+        .order_by(LawArticleVersion.effective_date.desc(), LawArticleVersion.id.desc())
         .all()
     )
     def to_dict(v: LawArticleVersion):
         return {
             "id": v.id,
-            "article_id": v.article_id,
+            "article_id": v.article_id_fk,
             "version_no": getattr(v, "version_no", None),
-            "effective_date": getattr(v, "effective_date", None),
-            "content": getattr(v, "content", ""),
+            "effective_date": v.effective_date,
+            "content": v.text or "",
         }
     return [to_dict(v) for v in versions]
+
+# ✅ 시점 조회: D일에 시행 중이던 조문 본문
+AS_OF_BULK_MAX = 1000
+
+class AsOfBulkIn(BaseModel):
+    date: date
+    article_ids: List[int] = Field(..., min_length=1, max_length=AS_OF_BULK_MAX)
+
+def _as_of(db: Session, article_ids: List[int], on: date) -> dict:
+    """
+    조문 id들 → {id: 결과 dict | None(조문 없음)}
+    시행일 인덱스(law_timeline, 캐시)로 버전을 고른 뒤, 고른 버전 본문만 IN 조회 1회
+    """
+    on_iso = on.isoformat()
+    ids = list(dict.fromkeys(article_ids))
+    timelines = law_timeline.get_timelines(db, ids)
+    hits = {aid: tl.resolve(on_iso) for aid, tl in timelines.items()}
+    version_ids = [h["version_id"] for h in hits.values() if h]
+    texts = {}
+    for i in range(0, len(version_ids), law_timeline.LOAD_CHUNK):
+        chunk = version_ids[i:i + law_timeline.LOAD_CHUNK]
+        texts.update(db.execute(
+            select(LawArticleVersion.id, LawArticleVersion.text).where(LawArticleVersion.id.in_(chunk))
+        ).all())
+
+    out = {}
+    for aid in ids:
+        tl = timelines.get(aid)
+        if tl is None:
+            out[aid] = None
+            continue
+        hit = hits[aid]
+        out[aid] = {
+            "article_id": aid,
+            "law_id": tl.law_id,
+            "article_no": tl.article_no,
+            "title": tl.title,
+            "as_of": on_iso,
+            "version_id": hit["version_id"] if hit else None,
+            "effective_from": hit["effective_from"] if hit else None,
+            "effective_to": hit["effective_to"] if hit else None,
+            "content": (texts.get(hit["version_id"]) or "") if hit else None,
+        }
+    return out
+
+@router.get("/articles/{article_id}/as-of")
+async def article_as_of(
+    article_id: int,
+    on: date = Query(..., alias="date", description="기준일 (YYYY-MM-DD)"),
+    db: ReadDB = Depends(get_read_runner),
+):
+    """기준일에 시행 중이던 조문 버전 (effective_to는 다음 버전 시행일, 미포함)"""
+    item = (await db.run(_as_of, [article_id], on))[article_id]
+    if item is None:
+        raise HTTPException(status_code=404, detail="Article not found")
+    if item["version_id"] is None:
+        raise HTTPException(status_code=404, detail=f"No version in effect on {on.isoformat()}")
+    return item
+
+@router.post("/articles/as-of")
+async def articles_as_of(body: AsOfBulkIn, db: ReadDB = Depends(get_read_runner)):
+    """여러 조문의 기준일 버전 (요청 순서대로, 없는 조문은 error 표시)"""
+    found = await db.run(_as_of, body.article_ids, body.date)
+    return [
+        found[aid] if found[aid] is not None else {"article_id": aid, "as_of": body.date.isoformat(), "error": "article not found"}
+        for aid in body.article_ids
+    ]
+
+# ✅ 버전 비교: 두 조문 버전의 줄/단어 diff (버전 쌍별 캐시)
+@router.get("/article-versions/diff")
+async def diff_article_versions(
+    from_id: int = Query(..., alias="from", description="비교 기준 LawArticleVersion.id"),
+    to_id: int = Query(..., alias="to", description="비교 대상 LawArticleVersion.id"),
+    db: ReadDB = Depends(get_read_runner),
+):
+    result = (await db.run(law_diff.version_diffs, [(from_id, to_id)]))[(from_id, to_id)]
+    if result is None:
+        raise HTTPException(status_code=404, detail="Article version not found")
+    return result
+
+def _law_changes(db: Session, law_name: str, since: date, until: date, include_diff: bool):
+    law = db.query(Law).filter(Law.name == law_name).first()
+    if not law:
+        return None
+    ids = [aid for (aid,) in db.execute(
+        select(LawArticle.id).where(LawArticle.law_id_fk == law.id).order_by(LawArticle.id)
+    )]
+    timelines = law_timeline.get_timelines(db, ids)
+    a_iso, b_iso = since.isoformat(), until.isoformat()
+
+    entries = []
+    pairs = []
+    for aid in ids:
+        tl = timelines.get(aid)
+        if tl is None:
+            continue
+        a, b = tl.resolve(a_iso), tl.resolve(b_iso)
+        va, vb = (a or {}).get("version_id"), (b or {}).get("version_id")
+        if va == vb:
+            continue
+        status = "added" if va is None else "removed" if vb is None else "changed"
+        entries.append({"article_id": aid, "article_no": tl.article_no, "title": tl.title, "status": status,
+                        "from_version_id": va, "to_version_id": vb})
+        if status == "changed":
+            pairs.append((va, vb))
+
+    diffs = law_diff.version_diffs(db, pairs)
+    changes = []
+    same_text = 0
+    for e in entries:
+        if e["status"] == "changed":
+            d = diffs.get((e["from_version_id"], e["to_version_id"]))
+            if d is None or not d["changed"]:
+                same_text += 1  # 시행일만 바뀐 재적재 등
+                continue
+            e["stats"] = d["stats"]
+            if include_diff:
+                e["unified"], e["words"] = d["unified"], d["words"]
+        changes.append(e)
+
+    counts = {s: sum(1 for e in changes if e["status"] == s) for s in ("added", "changed", "removed")}
+    return {
+        "law_id": law.id,
+        "law_name": law.name,
+        "from": a_iso,
+        "to": b_iso,
+        "articles": len(ids),
+        "summary": {**counts, "same_text": same_text},
+        "changes": changes,
+    }
+
+@router.get("/changes")
+async def law_changes(
+    law_name: str = Query(...),
+    since: date = Query(..., alias="from", description="기준일 X (YYYY-MM-DD)"),
+    until: date = Query(..., alias="to", description="비교일 Y (YYYY-MM-DD)"),
+    include_diff: bool = Query(False, description="조문별 줄/단어 diff 포함"),
+    db: ReadDB = Depends(get_read_runner),
+):
+    """법령 전체: X일 시행 본문 → Y일 시행 본문 사이에 바뀐 조문 목록 (diff는 버전 쌍별 캐시 재사용)"""
+    report = await db.run(_law_changes, law_name, since, until, include_diff)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Law not found")
+    return report
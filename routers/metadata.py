@@ -1,34 +1,26 @@
 # worklaw-backend/routers/metadata.py
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from database.connection import get_db
-from models.wage import MinimumWage
+from fastapi import APIRouter, Query
 from schemas.wage_schema import MinimumWageOut
+from utils import wage_table
 
 router = APIRouter(prefix="/metadata", tags=["Metadata"])
 
 @router.get("/minimum-wage", response_model=MinimumWageOut)
-def get_minimum_wage(
+async def get_minimum_wage(
     year: int = Query(..., ge=2010, le=2100, description="기준 연도 (예: 2025)"),
-    db: Session = Depends(get_db),
 ):
     """
-    DB에서 해당 연도의 최저임금(원/시간)을 반환합니다.
-    없는 연도라면, DB에 저장된 최근 연도의 값을 반환합니다.
+    해당 연도의 최저임금(원/시간)을 반환합니다.
+    없는 연도라면, 저장된 최근 연도의 값을 반환합니다.
+    (메모리 조회 테이블 사용 → 요청마다 DB 조회 없음)
     """
-    record = db.query(MinimumWage).filter(MinimumWage.year == year).first()
-    if record:
-        return {"year": record.year, "minimum_wage": record.amount, "unit": record.unit}
+    table = await wage_table.get_table_async()
 
-    # 해당 연도가 없으면 최신 연도로 fallback
-    latest = db.query(MinimumWage).order_by(MinimumWage.year.desc()).first()
-    if latest:
-        return {
-            "year": latest.year,
-            "minimum_wage": latest.amount,
-            "unit": latest.unit,
-        }
+    entry = table.resolve(year)
+    if entry:
+        y, amount, unit = entry
+        return {"year": y, "minimum_wage": amount, "unit": unit}
 
     # DB가 비어있는 경우 (이론상 시드 로직으로 거의 발생하지 않음)
     return {"year": year, "minimum_wage": 0, "unit": "KRW/hour"}
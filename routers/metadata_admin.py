@@ -2,28 +2,30 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, Path
 from sqlalchemy.orm import Session
-from database.connection import get_db
+from database.connection import get_write_db
 from models.wage import MinimumWage, MinimumWageHistory
 from schemas.wage_schema import (
     MinimumWageIn, MinimumWageUpdate, MinimumWageRow, MinimumWageHistoryRow
 )
 from routers.auth import get_current_admin  # ✅ JWT 의존성
+from utils import wage_table
 
 router = APIRouter(prefix="/admin/metadata", tags=["Admin: Metadata"])
 
 @router.get("/minimum-wage", response_model=list[MinimumWageRow])
-def list_minimum_wage(_: dict = Depends(get_current_admin), db: Session = Depends(get_db)):
+def list_minimum_wage(_: dict = Depends(get_current_admin), db: Session = Depends(get_write_db)):
     rows = db.query(MinimumWage).order_by(MinimumWage.year.asc()).all()
     return [{"year": r.year, "amount": r.amount, "unit": r.unit} for r in rows]
 
 @router.post("/minimum-wage", response_model=MinimumWageRow, status_code=201)
-def create_minimum_wage(payload: MinimumWageIn, _: dict = Depends(get_current_admin), db: Session = Depends(get_db)):
+def create_minimum_wage(payload: MinimumWageIn, _: dict = Depends(get_current_admin), db: Session = Depends(get_write_db)):
     exists = db.query(MinimumWage).filter(MinimumWage.year == payload.year).first()
     if exists:
         raise HTTPException(status_code=409, detail="Year already exists")
     row = MinimumWage(year=payload.year, amount=payload.amount, unit=payload.unit)
     db.add(row)
     db.commit()
+    wage_table.reload(db)  # 커밋 직후 조회 테이블 교체
 
     hist = MinimumWageHistory(
         year=payload.year, old_amount=None, new_amount=payload.amount,
@@ -38,7 +40,7 @@ def update_minimum_wage(
     year: int = Path(..., ge=2010, le=2100),
     payload: MinimumWageUpdate = None,
     _: dict = Depends(get_current_admin),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_write_db),
 ):
     row = db.query(MinimumWage).filter(MinimumWage.year == year).first()
     if not row:
@@ -50,6 +52,7 @@ def update_minimum_wage(
     if payload.unit is not None:
         row.unit = payload.unit
     db.commit()
+    wage_table.reload(db)
 
     hist = MinimumWageHistory(
         year=year, old_amount=old_amount, new_amount=row.amount,
@@ -61,7 +64,7 @@ def update_minimum_wage(
     return {"year": row.year, "amount": row.amount, "unit": row.unit}
 
 @router.delete("/minimum-wage/{year}", status_code=204)
-def delete_minimum_wage(year: int = Path(..., ge=2010, le=2100), _: dict = Depends(get_current_admin), db: Session = Depends(get_db)):
+def delete_minimum_wage(year: int = Path(..., ge=2010, le=2100), _: dict = Depends(get_current_admin), db: Session = Depends(get_write_db)):
     row = db.query(MinimumWage).filter(MinimumWage.year == year).first()
     if not row:
         raise HTTPException(status_code=404, detail="Year not found")
@@ -73,10 +76,11 @@ def delete_minimum_wage(year: int = Path(..., ge=2010, le=2100), _: dict = Depen
     db.add(hist)
     db.delete(row)
     db.commit()
+    wage_table.reload(db)
     return
 
 @router.get("/minimum-wage/{year}/history", response_model=list[MinimumWageHistoryRow])
-def history_minimum_wage(year: int = Path(..., ge=2010, le=2100), _: dict = Depends(get_current_admin), db: Session = Depends(get_db)):
+def history_minimum_wage(year: int = Path(..., ge=2010, le=2100), _: dict = Depends(get_current_admin), db: Session = Depends(get_write_db)):
     rows = (
         db.query(MinimumWageHistory)
         .filter(MinimumWageHistory.year == year)
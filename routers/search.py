@@ -0,0 +1,42 @@
+# worklaw-backend/routers/search.py
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from database.connection import get_read_db
+from database import search_index
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+class SearchHit(BaseModel):
+    kind: str                 # law / article / core_article / interpretation / bulletin
+    id: str
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    score: float
+
+@router.get(
+    "",
+    response_model=List[SearchHit],
+    summary="Full-text search across laws, articles, interpretations, bulletins",
+    description=(
+        "`snippet` is HTML-escaped text with matches wrapped in `<b>…</b>`. "
+        "Queries made only of 1–2 character words (e.g. `연차`) cannot use the trigram index: they scan "
+        f"for at most {search_index.SHORT_TERM_SCAN_LIMIT} matching rows, rank those (title matches first) "
+        "and may miss results beyond that. Add a word of 3+ characters for complete, bm25-ranked results."
+    ),
+)
+def search(
+    q: str = Query(..., min_length=1, description="검색어 (공백으로 여러 단어 AND)"),
+    kind: Optional[str] = Query(None, description="결과 종류 필터: " + ", ".join(search_index.KINDS)),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_read_db),
+):
+    if kind and kind not in search_index.KINDS:
+        raise HTTPException(status_code=400, detail=f"Unknown kind: {kind}")
+    conn = db.connection()
+    if conn.dialect.name != "sqlite":
+        raise HTTPException(status_code=501, detail="Full-text search requires the SQLite FTS5 index")
+    return search_index.search(conn, q.strip(), kind=kind, limit=limit)
@@ -0,0 +1,133 @@
+# worklaw-backend/scripts/bench/bench_async_db.py
+"""
+공개 조회 API 부하 벤치마크: 동기 세션(스레드 풀) vs 비동기 세션(DB_ASYNC=true)
+
+- 모드마다 새 프로세스(환경변수로 모드 선택)에서 앱을 띄우고 ASGI로 직접 호출
+- 동시 클라이언트 N개가 각자 /knowledge, /law, /metadata 조회를 반복
+- 처리량(req/s)과 지연(p50/p99) 비교
+
+실행:
+  python -m scripts.bench.bench_async_db --clients 500 --requests 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+PATHS = [
+    "/knowledge/policy_bulletins?limit=20",
+    "/knowledge/policy_bulletins/PB-00042",
+    "/law/articles?law_name=벤치법",
+    "/metadata/minimum-wage?year=2025",
+    "/law/list",
+]
+
+
+def _seed():
+    import main  # noqa: F401  (모델 import 순서: 앱과 동일하게)
+    from database.connection import Base, SessionLocal, engine
+    from models.knowledge_core import PolicyBulletin
+    from models.law import Law, LawArticle
+    from models.wage import MinimumWage
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    try:
+        db.add_all(PolicyBulletin(id=f"PB-{i:05d}", title=f"공지 {i}", summary_md="본문 " * 50) for i in range(500))
+        law = Law(name="벤치법")
+        db.add(law)
+        db.flush()
+        db.add_all(LawArticle(law_id_fk=law.id, article_no=f"제{i}조", current_text="조문 " * 40) for i in range(1, 101))
+        db.add(MinimumWage(year=2025, amount=10030, unit="KRW/hour"))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _load(clients: int, per_client: int) -> dict:
+    from httpx import ASGITransport, AsyncClient
+    from main import app
+    from utils.cache import knowledge_cache
+
+    transport = ASGITransport(app=app)
+    latencies: list[float] = []
+    errors = 0
+
+    async with AsyncClient(transport=transport, base_url="http://bench") as ac:
+        # 워밍업 (스키마 해석, 커넥션 풀)
+        for p in PATHS:
+            await ac.get(p)
+
+        async def client(cid: int):
+            nonlocal errors
+            for i in range(per_client):
+                # /knowledge 응답 캐시를 비워 매번 DB까지 내려가게 함
+                knowledge_cache.clear()
+                t0 = time.perf_counter()
+                r = await ac.get(PATHS[(cid + i) % len(PATHS)])
+                latencies.append(time.perf_counter() - t0)
+                if r.status_code != 200:
+                    errors += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client(c) for c in range(clients)))
+        wall = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def child(clients: int, per_client: int):
+    import logging
+    logging.disable(logging.CRITICAL)
+    _seed()
+    print(json.dumps(asyncio.run(_load(clients, per_client))))
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--clients", type=int, default=500)
+    ap.add_argument("--requests", type=int, default=10, help="클라이언트당 요청 수")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args.clients, args.requests)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("sync", "async"):
+            env = dict(os.environ)
+            env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp, mode + '.db')}"
+            env["DB_ASYNC"] = "true" if mode == "async" else "false"
+            out = subprocess.run(
+                [sys.executable, "-m", "scripts.bench.bench_async_db", "--child",
+                 "--clients", str(args.clients), "--requests", str(args.requests)],
+                cwd=BASE_DIR, env=env, capture_output=True, text=True, check=True,
+            )
+            results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    print(f"clients={args.clients} requests/client={args.requests}")
+    print(f"{'metric':<10}{'sync':>12}{'async':>12}")
+    for k in ("requests", "rps", "p50_ms", "p99_ms", "errors"):
+        s, a = results["sync"][k], results["async"][k]
+        fmt = "{:>12.1f}" if isinstance(s, float) else "{:>12d}"
+        print(f"{k:<10}" + fmt.format(s) + fmt.format(a))
+
+
+if __name__ == "__main__":
+    main()
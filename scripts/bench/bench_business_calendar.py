@@ -0,0 +1,106 @@
+# worklaw-backend/scripts/bench/bench_business_calendar.py
+"""
+영업일 계산 벤치마크: 하루씩 훑기(변경 전 클라이언트 방식) vs 연도 비트맵(utils.business_calendar)
+
+- 1950~2100년 전체에 설날/추석/국경일 형태의 공휴일을 채운 가짜 데이터로 달력을 빌드
+- 구간 길이(1년 ~ 150년)별로 "근무일 수 세기"와 "N 근무일 더하기" 평균 시간을 비교
+- 두 방식 결과가 같은지 매 구간 확인
+
+실행:
+  python -m scripts.bench.bench_business_calendar --queries 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.business_calendar import MAX_YEAR, MIN_YEAR, WEEKEND, BusinessCalendar  # noqa: E402
+
+
+def fake_rows():
+    rows = []
+    for y in range(MIN_YEAR, MAX_YEAR + 1):
+        for md, name in (("01-01", "신정"), ("03-01", "삼일절"), ("05-05", "어린이날"), ("06-06", "현충일"),
+                         ("08-15", "광복절"), ("10-03", "개천절"), ("10-09", "한글날"), ("12-25", "기독탄신일")):
+            rows.append((f"{y}-{md}", name, True))
+        # 음력 명절 대신 해마다 위치가 바뀌는 3일 연휴
+        for base, name in ((date(y, 1, 20), "설날"), (date(y, 9, 10), "추석")):
+            d0 = base + timedelta(days=(y * 11) % 25)
+            for k, suffix in enumerate((" 전날", "", " 다음날")):
+                rows.append(((d0 + timedelta(days=k)).isoformat(), name + suffix, True))
+    return rows
+
+
+def scan_count(off: set, start: date, end: date) -> int:
+    n = 0
+    d = start
+    while d <= end:
+        if d.weekday() not in WEEKEND and d not in off:
+            n += 1
+        d += timedelta(days=1)
+    return n
+
+
+def scan_add(off: set, start: date, k: int) -> date:
+    d = start
+    while k:
+        d += timedelta(days=1)
+        if d.weekday() not in WEEKEND and d not in off:
+            k -= 1
+    return d
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+    rnd = random.Random(3)
+
+    rows = fake_rows()
+    t0 = time.perf_counter()
+    cal = BusinessCalendar(rows, 0)
+    build_ms = (time.perf_counter() - t0) * 1000
+    # 스캔 쪽 입력: 평일 휴무일 집합 (대체공휴일 포함, 변경 전 클라이언트가 목록에서 만들던 것)
+    first, last = date(MIN_YEAR, 1, 1), date(MAX_YEAR, 12, 31)
+    all_days = (first + timedelta(days=i) for i in range((last - first).days + 1))
+    off = {d for d in all_days if d.weekday() not in WEEKEND and not cal.is_business_day(d)}
+    print(f"build {MAX_YEAR - MIN_YEAR + 1} years ({len(rows)} holiday rows): {build_ms:.1f} ms")
+    print(f"{'span':>6} | {'count scan':>11} {'count bitmap':>13} {'x':>7} | {'add scan':>10} {'add bitmap':>11} {'x':>7}")
+
+    for years in (1, 10, 30, 75, 150):
+        span = years * 365
+        cases = []
+        for _ in range(args.queries):
+            a = date(MIN_YEAR, 1, 1) + timedelta(days=rnd.randint(0, max(0, 55_000 - span)))
+            cases.append((a, a + timedelta(days=span - 1)))
+        qs = cases[: max(5, args.queries // years)]   # 스캔은 느리므로 긴 구간은 표본을 줄임
+
+        t0 = time.perf_counter()
+        expected = [scan_count(off, a, b) for a, b in qs]
+        t_scan = (time.perf_counter() - t0) / len(qs)
+        t0 = time.perf_counter()
+        got = [cal.count_business_days(a, b) for a, b in cases]
+        t_bit = (time.perf_counter() - t0) / len(cases)
+        assert got[: len(qs)] == expected
+
+        # 각 구간의 근무일 수만큼 더하기 → 결과는 구간 끝 부근 (지원 범위 안)
+        t0 = time.perf_counter()
+        res_scan = [scan_add(off, a, n) for (a, _), n in zip(qs, expected)]
+        t_ascan = (time.perf_counter() - t0) / len(qs)
+        t0 = time.perf_counter()
+        res_bit = [cal.add_business_days(a, n) for (a, _), n in zip(cases, got)]
+        t_abit = (time.perf_counter() - t0) / len(cases)
+        assert res_bit[: len(qs)] == res_scan
+
+        print(f"{years:>5}y | {t_scan * 1e3:>9.2f}ms {t_bit * 1e6:>11.1f}µs {t_scan / t_bit:>6.0f}x"
+              f" | {t_ascan * 1e3:>8.2f}ms {t_abit * 1e6:>9.1f}µs {t_ascan / t_abit:>6.0f}x")
+
+
+if __name__ == "__main__":
+    main()
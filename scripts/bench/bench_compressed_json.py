@@ -0,0 +1,135 @@
+# worklaw-backend/scripts/bench/bench_compressed_json.py
+"""
+압축 JSON 컬럼(database.types.CompressedJSON) 벤치마크: 저장 크기와 읽기 지연
+
+코덱별로 임시 SQLite 파일을 새로 만들어 조문 버전 N개(법령 API 형태의 raw_json)를 넣고
+- raw_json 컬럼 바이트 합계 / DB 파일 크기
+- 전체 스캔(raw_json 전부 읽어 디코드), 무작위 PK 단건 조회 지연
+을 비교한다. none = 평문 JSON (압축 전과 같은 크기), zstd 는 zstandard 설치 시에만.
+
+실행:
+  python -m scripts.bench.bench_compressed_json --versions 5000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import create_engine, func, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import main  # noqa: E402,F401  (모델 import 순서)
+from database import types  # noqa: E402
+from database.connection import Base  # noqa: E402
+from database.types import JSONCodec, train_dictionary  # noqa: E402
+from models.law import Law, LawArticle, LawArticleVersion  # noqa: E402
+
+WORDS = "사용자는 근로자에게 임금 근로시간 휴일 휴가 해고 예고 수당 지급 하여야 한다 다만 경우에는 그러하지 아니하다".split()
+
+
+def article_json(rnd: random.Random, no: int) -> dict:
+    """국가법령정보센터 조문단위 JSON 모양 (키 이름·구조 반복, 본문은 무작위)"""
+    sentence = lambda n: " ".join(rnd.choice(WORDS) for _ in range(n))  # noqa: E731
+    return {
+        "조문번호": str(no),
+        "조문여부": "조문",
+        "조문제목": sentence(2),
+        "조문시행일자": rnd.choice(["20200101", "20230701", "20250101"]),
+        "조문변경여부": rnd.choice(["Y", "N"]),
+        "조문내용": f"제{no}조({sentence(2)}) {sentence(12)}",
+        "항": [
+            {
+                "항번호": "①②③④"[h],
+                "항내용": f"{'①②③④'[h]} {sentence(18)}",
+                "호": [{"호번호": f"{k}.", "호내용": f"{k}. {sentence(8)}"} for k in range(1, rnd.randint(1, 4))],
+            }
+            for h in range(rnd.randint(1, 4))
+        ],
+    }
+
+
+def run(codec: JSONCodec, docs, n_points: int):
+    types.set_codec(codec)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        law = Law(name="압축벤치법")
+        db.add(law)
+        db.flush()
+        art = LawArticle(law_id_fk=law.id, article_no="제1조")
+        db.add(art)
+        db.flush()
+        db.execute(
+            LawArticleVersion.__table__.insert(),
+            [{"article_id_fk": art.id, "effective_date": "20250101", "text": "", "raw_json": d} for d in docs],
+        )
+        db.commit()
+        col_bytes = db.execute(select(func.sum(func.length(LawArticleVersion.raw_json)))).scalar()
+        db.close()
+        engine.dispose()
+        file_bytes = os.path.getsize(path)
+
+        engine = create_engine(f"sqlite:///{path}")
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        t0 = time.perf_counter()
+        scanned = db.execute(select(LawArticleVersion.raw_json)).scalars().all()
+        scan_ms = (time.perf_counter() - t0) * 1000
+        assert len(scanned) == len(docs) and scanned[0] == docs[0]
+
+        rnd = random.Random(3)
+        ids = [rnd.randint(1, len(docs)) for _ in range(n_points)]
+        lat = []
+        for i in ids:
+            t0 = time.perf_counter()
+            db.execute(select(LawArticleVersion.raw_json).where(LawArticleVersion.id == i)).scalar_one()
+            lat.append((time.perf_counter() - t0) * 1e6)
+        db.close()
+        engine.dispose()
+    return col_bytes, file_bytes, scan_ms, statistics.median(lat)
+
+
+def main_():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--versions", type=int, default=5000)
+    ap.add_argument("--points", type=int, default=2000)
+    args = ap.parse_args()
+
+    rnd = random.Random(7)
+    docs = [article_json(rnd, i % 120 + 1) for i in range(args.versions)]
+    # 사전은 별도 표본으로 학습 (실운영처럼 저장 대상과 겹치지 않게)
+    dictionary = train_dictionary([article_json(random.Random(11), i) for i in range(1, 500)], size=16 * 1024)
+
+    codecs = [
+        ("none (plain JSON)", JSONCodec(method="none")),
+        ("zlib", JSONCodec(method="zlib")),
+        ("zlib + dict", JSONCodec(method="zlib", dictionary=dictionary)),
+    ]
+    if types.zstandard is not None:
+        codecs += [
+            ("zstd", JSONCodec(method="zstd")),
+            ("zstd + dict", JSONCodec(method="zstd", dictionary=dictionary)),
+        ]
+
+    print(f"versions={args.versions}  dict={len(dictionary)} bytes  zstandard={'yes' if types.zstandard else 'no'}")
+    print(f"{'codec':<20}{'raw_json bytes':>16}{'db file':>12}{'full scan':>12}{'point read':>13}")
+    base = None
+    for name, codec in codecs:
+        col, size, scan, point = run(codec, docs, args.points)
+        base = base or col
+        print(f"{name:<20}{col:>10} ({col / base:4.0%}){size / 1024:>9.0f} KB{scan:>9.1f} ms{point:>10.1f} µs")
+    types.set_codec(None)
+
+
+if __name__ == "__main__":
+    main_()
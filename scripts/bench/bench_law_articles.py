@@ -0,0 +1,104 @@
+# worklaw-backend/scripts/bench/bench_law_articles.py
+"""
+/law/articles 조회 벤치마크: 조문당 COUNT(N+1) vs LEFT JOIN + GROUP BY 1회
+
+실행:
+  python -m scripts.bench.bench_law_articles --articles 500 --versions 3
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from database.connection import Base  # noqa: E402
+from models.law import Law, LawArticle, LawArticleVersion  # noqa: E402
+from routers.law import articles_with_version_counts  # noqa: E402
+
+
+def legacy_n_plus_one(db, law_pk: int):
+    # 변경 전 방식: 조문 목록 후 조문마다 버전 COUNT
+    arts = db.query(LawArticle).filter(LawArticle.law_id_fk == law_pk).order_by(LawArticle.id).all()
+    out = []
+    for a in arts:
+        vcount = db.query(LawArticleVersion).filter(LawArticleVersion.article_id_fk == a.id).count()
+        out.append((a.id, a.article_no, a.title, a.current_text, vcount))
+    return out
+
+
+def joined(db, law_pk: int):
+    return [(r.id, r.article_no, r.title, r.current_text, r.version_count) for r in articles_with_version_counts(db, law_pk)]
+
+
+def seed(Session, n_articles: int, n_versions: int) -> int:
+    db = Session()
+    law = Law(name="벤치마크법")
+    db.add(law)
+    db.flush()
+    for i in range(1, n_articles + 1):
+        art = LawArticle(law_id_fk=law.id, article_no=f"제{i}조", title=f"(조문 {i})", current_text="본문 " * 40)
+        db.add(art)
+        db.flush()
+        for v in range(n_versions):
+            db.add(LawArticleVersion(article_id_fk=art.id, effective_date=f"20{10 + v}0101", text=art.current_text))
+    db.commit()
+    law_pk = law.id
+    db.close()
+    return law_pk
+
+
+def measure(Session, engine, fn, law_pk: int, repeat: int):
+    counter = {"n": 0}
+
+    def _count(*_args, **_kw):
+        counter["n"] += 1
+
+    timings = []
+    result = None
+    for _ in range(repeat):
+        db = Session()
+        event.listen(engine, "before_cursor_execute", _count)
+        counter["n"] = 0
+        t0 = time.perf_counter()
+        result = fn(db, law_pk)
+        timings.append((time.perf_counter() - t0) * 1000)
+        event.remove(engine, "before_cursor_execute", _count)
+        db.close()
+    return result, counter["n"], statistics.median(timings)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--articles", type=int, default=500)
+    ap.add_argument("--versions", type=int, default=3)
+    ap.add_argument("--repeat", type=int, default=7)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", future=True)
+        tables = [Law.__table__, LawArticle.__table__, LawArticleVersion.__table__]
+        Base.metadata.create_all(bind=engine, tables=tables)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        law_pk = seed(Session, args.articles, args.versions)
+
+        before, q_before, ms_before = measure(Session, engine, legacy_n_plus_one, law_pk, args.repeat)
+        after, q_after, ms_after = measure(Session, engine, joined, law_pk, args.repeat)
+        assert before == after, "결과 불일치"
+
+        print(f"articles={args.articles} versions/article={args.versions}")
+        print(f"before (N+1)       : {q_before:5d} queries  {ms_before:8.2f} ms")
+        print(f"after  (JOIN/GROUP): {q_after:5d} queries  {ms_after:8.2f} ms")
+        print(f"speedup x{ms_before / ms_after:.1f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# worklaw-backend/scripts/bench/bench_law_as_of.py
+"""
+"D일 기준 조문" 조회 벤치마크
+
+- scan: 조문의 버전을 전부 읽어 파이썬에서 시행일 <= D 중 최신을 고름 (변경 전 클라이언트 방식)
+- sql: 조회마다 WHERE article_id_fk = ? ORDER BY effective_date DESC LIMIT 1 (버전 전체를 정렬)
+- index: routers.law._as_of (캐시된 시행일 인덱스 bisect + 고른 버전 본문만 조회)
+
+임시 SQLite 파일에 조문 N개 × 버전 V개를 만들고 무작위 (조문, 날짜) 조회를 반복한다.
+
+실행:
+  python -m scripts.bench.bench_law_as_of --articles 500 --versions 40 --lookups 2000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import main  # noqa: E402,F401  (모델 import 순서)
+from database.connection import Base  # noqa: E402
+from models.law import Law, LawArticle, LawArticleVersion  # noqa: E402
+from routers.law import _as_of  # noqa: E402
+from utils import law_timeline  # noqa: E402
+
+
+def seed(Session, n_articles: int, n_versions: int) -> list:
+    db = Session()
+    law = Law(name="시점조회벤치법")
+    db.add(law)
+    db.flush()
+    arts = [LawArticle(law_id_fk=law.id, article_no=f"제{i}조") for i in range(1, n_articles + 1)]
+    db.add_all(arts)
+    db.flush()
+    rows = []
+    for a in arts:
+        d = date(1980, 1, 1)
+        for v in range(n_versions):
+            d += timedelta(days=random.randint(100, 500))
+            rows.append({"article_id_fk": a.id, "effective_date": d.strftime("%Y%m%d"), "text": f"{a.article_no} v{v} " * 30})
+    db.execute(LawArticleVersion.__table__.insert(), rows)
+    db.commit()
+    ids = [a.id for a in arts]
+    db.close()
+    return ids
+
+
+def scan(db, aid: int, on: date):
+    key = on.strftime("%Y%m%d")
+    best = None
+    for v in db.query(LawArticleVersion).filter(LawArticleVersion.article_id_fk == aid).all():
+        if v.effective_date and v.effective_date <= key and (best is None or v.effective_date >= best.effective_date):
+            best = v
+    return best.text if best else None
+
+
+def sql(db, aid: int, on: date):
+    return db.execute(
+        select(LawArticleVersion.text)
+        .where(LawArticleVersion.article_id_fk == aid, LawArticleVersion.effective_date <= on.strftime("%Y%m%d"))
+        .order_by(LawArticleVersion.effective_date.desc(), LawArticleVersion.id.desc())
+        .limit(1)
+    ).scalar()
+
+
+def indexed(db, aid: int, on: date):
+    return _as_of(db, [aid], on)[aid]["content"]
+
+
+def run(Session, fn, lookups):
+    db = Session()
+    t0 = time.perf_counter()
+    out = [fn(db, aid, on) for aid, on in lookups]
+    dt = time.perf_counter() - t0
+    db.close()
+    return out, dt / len(lookups) * 1e6
+
+
+def main_():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--articles", type=int, default=500)
+    ap.add_argument("--versions", type=int, default=40)
+    ap.add_argument("--lookups", type=int, default=2000)
+    args = ap.parse_args()
+    random.seed(5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        ids = seed(Session, args.articles, args.versions)
+        lookups = [(random.choice(ids), date(1980, 1, 1) + timedelta(days=random.randint(0, 20000)))
+                   for _ in range(args.lookups)]
+
+        ref, t_scan = run(Session, scan, lookups)
+        got_sql, t_sql = run(Session, sql, lookups)
+        law_timeline.invalidate()
+        got_cold, t_cold = run(Session, indexed, lookups)
+        got_warm, t_warm = run(Session, indexed, lookups)
+        assert ref == got_sql == got_cold == got_warm
+
+        db = Session()
+        t0 = time.perf_counter()
+        bulk = _as_of(db, ids, date(2000, 1, 1))
+        t_bulk = (time.perf_counter() - t0) * 1000
+        db.close()
+        engine.dispose()
+
+    print(f"articles={args.articles} versions/article={args.versions} lookups={args.lookups}")
+    print(f"scan all versions         : {t_scan:8.1f} µs/lookup")
+    print(f"sql ORDER BY ... LIMIT 1  : {t_sql:8.1f} µs/lookup")
+    print(f"timeline (cold cache)     : {t_cold:8.1f} µs/lookup")
+    print(f"timeline (warm cache)     : {t_warm:8.1f} µs/lookup  (x{t_scan / t_warm:.1f} vs scan)")
+    print(f"bulk {len(bulk)} articles (warm) : {t_bulk:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,107 @@
+# worklaw-backend/scripts/bench/bench_law_diff.py
+"""
+법령 전체 변경 보고서(/law/changes) 벤치마크: 첫 요청(diff 계산) vs 이후 요청(버전 쌍 캐시)
+
+임시 SQLite 파일에 조문 N개를 만들고, 그중 --changed 개 조문에 단어 일부를 바꾼 새 버전을 넣는다.
+
+실행:
+  python -m scripts.bench.bench_law_diff --articles 600 --changed 400
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import main  # noqa: E402,F401  (모델 import 순서)
+from database.connection import Base  # noqa: E402
+from models.law import Law, LawArticle, LawArticleVersion  # noqa: E402
+from routers.law import _law_changes  # noqa: E402
+from utils import law_diff, law_timeline  # noqa: E402
+
+WORDS = "사용자는 근로자에게 임금 근로시간 휴일 휴가 해고 예고 수당 지급 하여야 한다 다만 경우에는 그러하지 아니하다".split()
+
+
+def article_text(rnd: random.Random) -> str:
+    return "\n".join(" ".join(rnd.choice(WORDS) for _ in range(25)) for _ in range(8))
+
+
+def amend(rnd: random.Random, text: str) -> str:
+    words = text.split(" ")
+    for _ in range(6):
+        words[rnd.randrange(len(words))] = rnd.choice(WORDS) + "및"
+    return " ".join(words)
+
+
+def seed(Session, n_articles: int, n_changed: int) -> None:
+    rnd = random.Random(9)
+    db = Session()
+    law = Law(name="diff벤치법")
+    db.add(law)
+    db.flush()
+    arts = [LawArticle(law_id_fk=law.id, article_no=f"제{i}조") for i in range(1, n_articles + 1)]
+    db.add_all(arts)
+    db.flush()
+    rows = []
+    for k, a in enumerate(arts):
+        text = article_text(rnd)
+        rows.append({"article_id_fk": a.id, "effective_date": "20200101", "text": text})
+        if k < n_changed:
+            rows.append({"article_id_fk": a.id, "effective_date": "20240101", "text": amend(rnd, text)})
+    db.execute(LawArticleVersion.__table__.insert(), rows)
+    db.commit()
+    db.close()
+
+
+def timed(Session, include_diff: bool):
+    db = Session()
+    t0 = time.perf_counter()
+    report = _law_changes(db, "diff벤치법", date(2021, 1, 1), date(2024, 6, 1), include_diff)
+    dt = (time.perf_counter() - t0) * 1000
+    db.close()
+    return report, dt
+
+
+def main_():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--articles", type=int, default=600)
+    ap.add_argument("--changed", type=int, default=400)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        seed(Session, args.articles, args.changed)
+
+        law_timeline.invalidate()
+        law_diff.diff_cache.clear()
+        report, cold = timed(Session, True)
+        assert report["summary"]["changed"] == args.changed, report["summary"]
+        warm = statistics.median(timed(Session, True)[1] for _ in range(args.repeat))
+        # 타임라인 TTL 만료 후처럼 인덱스만 다시 읽고 diff는 캐시 재사용
+        timeline_only = []
+        for _ in range(args.repeat):
+            law_timeline.invalidate()
+            timeline_only.append(timed(Session, True)[1])
+        engine.dispose()
+
+    print(f"articles={args.articles} changed={args.changed}")
+    print(f"first request (compute diffs) : {cold:8.1f} ms")
+    print(f"warm (cached diffs + index)   : {warm:8.1f} ms  (x{cold / warm:.0f})")
+    print(f"index reload, cached diffs    : {statistics.median(timeline_only):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,172 @@
+# worklaw-backend/scripts/bench/bench_law_extract.py
+"""
+조문 추출기 마이크로벤치마크: 기존 extract_articles_from_payload(list.pop(0) + 재귀 join)
+vs scripts/law_extract.iter_articles (deque + 단일 버퍼)
++ 응답 바이트 → 조문: 전체 json.loads 후 추출 vs 증분 파싱(ArticleStreamParser) 피크 메모리
+
+실행:
+  python -m scripts.bench.bench_law_extract --articles 3000
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from scripts.law_extract import ArticleStreamParser, iter_articles  # noqa: E402
+
+
+def legacy_extract(payload):
+    # 변경 전 구현(비교용 사본)
+    articles = []
+
+    def flatten_text(node):
+        if node is None:
+            return ""
+        if isinstance(node, str):
+            return node
+        if isinstance(node, list):
+            return "\n".join(flatten_text(x) for x in node)
+        if isinstance(node, dict):
+            parts = []
+            for k, v in node.items():
+                parts.append(flatten_text(v))
+            return "\n".join(p for p in parts if p)
+        return str(node)
+
+    root = payload.get("eflaw") or payload.get("law") or payload
+    if not root:
+        return articles
+    candidates = []
+    for key in ["조문", "조문목록", "장", "편", "항목"]:
+        val = root.get(key)
+        if val:
+            candidates.append(val)
+    stack = candidates[:]
+    while stack:
+        cur = stack.pop(0)
+        if isinstance(cur, list):
+            for item in cur:
+                stack.append(item)
+        elif isinstance(cur, dict):
+            article_no = cur.get("조문번호") or cur.get("조") or cur.get("조문")
+            content = cur.get("조문내용") or cur.get("내용") or cur.get("본문")
+            title = cur.get("조문제목") or cur.get("제목")
+            if article_no:
+                articles.append({
+                    "article_no": str(article_no),
+                    "title": str(title) if title else None,
+                    "text": flatten_text(content),
+                    "raw": cur,
+                })
+            else:
+                for v in cur.values():
+                    stack.append(v)
+    uniq = {}
+    for a in articles:
+        if a["article_no"] not in uniq:
+            uniq[a["article_no"]] = a
+    return list(uniq.values())
+
+
+def make_payload(n_articles: int, hang: int = 4, ho: int = 5, mok: int = 3) -> dict:
+    """편 > 장 > 조문 > 항 > 호 > 목 구조의 큰 가짜 응답"""
+    def article(i):
+        return {
+            "조문번호": str(i),
+            "조문제목": f"조문 {i}",
+            "조문내용": [
+                {
+                    "항번호": f"①{h}",
+                    "항내용": f"제{i}조 제{h}항 본문 " * 3,
+                    "호": [
+                        {
+                            "호번호": f"{k}.",
+                            "호내용": f"호 내용 {k} " * 2,
+                            "목": [{"목번호": f"가{m}", "목내용": f"목 내용 {m}"} for m in range(mok)],
+                        }
+                        for k in range(ho)
+                    ],
+                }
+                for h in range(hang)
+            ],
+            "시행일자": "20250101",
+        }
+
+    per_chapter = 50
+    chapters = [
+        {"장번호": c, "조문단위": [article(i) for i in range(c * per_chapter + 1, min(n_articles, (c + 1) * per_chapter) + 1)]}
+        for c in range((n_articles + per_chapter - 1) // per_chapter)
+    ]
+    return {"law": {"편": [{"편번호": 1, "장": chapters}]}}
+
+
+def bench(fn, payload, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(payload)
+        times.append((time.perf_counter() - t0) * 1000)
+    tracemalloc.start()
+    fn(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, statistics.median(times), peak
+
+
+def peak_per_article(fn, body: bytes):
+    """조문을 하나씩 소비(보관하지 않음)할 때의 피크 메모리 — 파싱 단계 자체의 비용"""
+    tracemalloc.start()
+    n = 0
+    for _ in fn(body):
+        n += 1
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return n, peak
+
+
+def full_parse(body: bytes):
+    text = body.decode("utf-8")          # 기존: r.text
+    yield from iter_articles(json.loads(text))
+
+
+def stream_parse(body: bytes, chunk: int = 64 * 1024):
+    parser = ArticleStreamParser()
+    for i in range(0, len(body), chunk):
+        yield from parser.feed(body[i:i + chunk])
+    yield from parser.close()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--articles", type=int, default=3000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    payload = make_payload(args.articles)
+    old, ms_old, peak_old = bench(legacy_extract, payload, args.repeat)
+    new, ms_new, peak_new = bench(lambda p: list(iter_articles(p)), payload, args.repeat)
+    assert [(a["article_no"], a["text"]) for a in old] == [(a["article_no"], a["text"]) for a in new], "결과 불일치"
+
+    print(f"articles={len(new)}")
+    print(f"legacy  : {ms_old:9.2f} ms  peak {peak_old / 1e6:7.2f} MB")
+    print(f"streamed: {ms_new:9.2f} ms  peak {peak_new / 1e6:7.2f} MB")
+    print(f"speedup x{ms_old / ms_new:.1f}")
+
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    n_full, peak_full = peak_per_article(full_parse, body)
+    n_stream, peak_stream = peak_per_article(stream_parse, body)
+    assert n_full == n_stream
+    print(f"response={len(body) / 1e6:.2f} MB")
+    print(f"json.loads + extract : peak {peak_full / 1e6:7.2f} MB")
+    print(f"incremental (ijson)  : peak {peak_stream / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
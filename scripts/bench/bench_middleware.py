@@ -0,0 +1,136 @@
+# worklaw-backend/scripts/bench/bench_middleware.py
+"""
+/health 초당 요청 수 벤치마크: BaseHTTPMiddleware + 동기 로깅(변경 전) vs 순수 ASGI + QueueHandler(변경 후)
+
+- 네트워크/HTTP 클라이언트 비용을 빼기 위해 ASGI 앱을 직접 호출 (scope/receive/send)
+- 두 앱 모두 CORS + 보안 헤더 미들웨어 + /health 라우트로 구성 (main.py와 동일 순서)
+- 로그는 양쪽 모두 같은 파일 핸들러로 출력 (변경 전: 요청 경로에서 직접 write, 변경 후: 큐 → 리스너 스레드)
+
+실행:
+  python -m scripts.bench.bench_middleware --requests 20000 --concurrency 50
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+import main  # noqa: E402
+
+
+def legacy_middleware(log: logging.Logger):
+    # 변경 전 main.SecurityHeadersMiddleware 그대로
+    class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            start = time.perf_counter()
+            response = await call_next(request)
+            dur_ms = int((time.perf_counter() - start) * 1000)
+            response.headers["X-Content-Type-Options"] = "nosniff"
+            response.headers["X-Frame-Options"] = "DENY"
+            response.headers["Referrer-Policy"] = "no-referrer"
+            response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+            log.info("%s %s -> %s (%d ms)", request.method, request.url.path, response.status_code, dur_ms)
+            return response
+    return LegacySecurityHeadersMiddleware
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CORSMiddleware, allow_origins=["http://localhost:3000"], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(middleware)
+
+    @app.get("/health")
+    def health():
+        return {"status": "ok", "env": "bench"}
+
+    return app
+
+
+SCOPE = {
+    "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+    "scheme": "http", "path": "/health", "raw_path": b"/health", "query_string": b"",
+    "root_path": "", "headers": [(b"host", b"bench")], "server": ("bench", 80), "client": ("bench", 1),
+}
+
+
+async def call(app) -> int:
+    status = 0
+    done = asyncio.Event()
+    sent_request = False
+
+    async def receive():
+        nonlocal sent_request
+        if not sent_request:
+            sent_request = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(dict(SCOPE), receive, send)
+    done.set()
+    return status
+
+
+async def run(app, total: int, concurrency: int) -> float:
+    for _ in range(200):  # 워밍업
+        await call(app)
+    per = total // concurrency
+
+    async def worker():
+        for _ in range(per):
+            assert await call(app) == 200
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per * concurrency / (time.perf_counter() - t0)
+
+
+def main_():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=20000)
+    ap.add_argument("--concurrency", type=int, default=50)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = logging.FileHandler(os.path.join(tmp, "access.log"))
+        handler.setFormatter(logging.Formatter(main.LOG_FORMAT))
+
+        legacy_log = logging.getLogger("bench.legacy")
+        legacy_log.propagate = False
+        legacy_log.setLevel(logging.INFO)
+        legacy_log.addHandler(handler)
+
+        # 변경 후: main의 큐 리스너를 같은 파일 핸들러로 교체
+        main.stop_access_log()
+        main.access_listener.handlers = (handler,)
+        main.start_access_log()
+        main.access_logger.setLevel(logging.INFO)
+
+        before = asyncio.run(run(build_app(legacy_middleware(legacy_log)), args.requests, args.concurrency))
+        after = asyncio.run(run(build_app(main.SecurityHeadersMiddleware), args.requests, args.concurrency))
+        main.stop_access_log()
+        handler.close()
+
+    print(f"requests={args.requests} concurrency={args.concurrency}")
+    print(f"BaseHTTPMiddleware + sync log : {before:8.0f} req/s")
+    print(f"pure ASGI + QueueHandler      : {after:8.0f} req/s  (x{after / before:.2f})")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,133 @@
+# worklaw-backend/scripts/bench/bench_sqlite_profile.py
+"""
+SQLite 읽기/쓰기 혼합 부하 벤치마크: 드라이버 기본값 vs 튜닝 프로필(WAL 등)
+
+- 쓰기 스레드: ETL처럼 정책공지 50행 upsert를 트랜잭션 1개로 반복
+- 읽기 스레드: /knowledge/policy_bulletins 와 같은 목록 조회 반복
+- 지정 시간 동안 처리량, 지연(p50/p95), 'database is locked' 오류 수 비교
+
+실행:
+  python -m scripts.bench.bench_sqlite_profile --readers 8 --writers 2 --seconds 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from database.connection import Base, make_engine, sqlite_pragmas  # noqa: E402
+import models.knowledge_core  # noqa: E402,F401  (테이블 등록)
+
+READ_SQL = text("SELECT id, title, effective_date FROM policy_bulletins ORDER BY id DESC LIMIT 50")
+WRITE_SQL = text(
+    "INSERT INTO policy_bulletins (id, title, summary_md) VALUES (:id, :title, :body) "
+    "ON CONFLICT(id) DO UPDATE SET title = excluded.title, summary_md = excluded.summary_md"
+)
+
+
+def _plain_engine(url: str):
+    # 변경 전: check_same_thread만 지정한 기본 엔진
+    return create_engine(url, future=True, connect_args={"check_same_thread": False})
+
+
+def _pct(xs, p):
+    if not xs:
+        return 0.0
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(len(xs) * p))] * 1000
+
+
+def run_mixed(eng, readers: int, writers: int, seconds: float, batch: int) -> dict:
+    stop = time.perf_counter() + seconds
+    lock = threading.Lock()
+    stats = {"reads": [], "writes": [], "locked": 0, "other_errors": 0}
+
+    def reader():
+        lat = []
+        while time.perf_counter() < stop:
+            t0 = time.perf_counter()
+            try:
+                with eng.connect() as conn:
+                    conn.execute(READ_SQL).all()
+                lat.append(time.perf_counter() - t0)
+            except OperationalError as e:
+                with lock:
+                    stats["locked" if "locked" in str(e) else "other_errors"] += 1
+        with lock:
+            stats["reads"].extend(lat)
+
+    def writer(wid: int):
+        lat, n = [], 0
+        while time.perf_counter() < stop:
+            rows = [{"id": f"BENCH-{wid}-{(n + i) % 2000}", "title": f"공지 {n + i}", "body": "x" * 400} for i in range(batch)]
+            n += batch
+            t0 = time.perf_counter()
+            try:
+                with eng.begin() as conn:
+                    conn.execute(WRITE_SQL, rows)
+                lat.append(time.perf_counter() - t0)
+            except OperationalError as e:
+                with lock:
+                    stats["locked" if "locked" in str(e) else "other_errors"] += 1
+        with lock:
+            stats["writes"].extend(lat)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(w,)) for w in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {
+        "read_ops": len(stats["reads"]) / seconds,
+        "write_tx": len(stats["writes"]) / seconds,
+        "read_p50": _pct(stats["reads"], 0.5),
+        "read_p95": _pct(stats["reads"], 0.95),
+        "write_p50": _pct(stats["writes"], 0.5),
+        "write_p95": _pct(stats["writes"], 0.95),
+        "locked": stats["locked"],
+        "other_errors": stats["other_errors"],
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--readers", type=int, default=8)
+    ap.add_argument("--writers", type=int, default=2)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--batch", type=int, default=50, help="쓰기 트랜잭션당 행 수")
+    args = ap.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, factory in (("default", _plain_engine), ("tuned", make_engine)):
+            url = f"sqlite:///{os.path.join(tmp, label + '.db')}"
+            eng = factory(url)
+            Base.metadata.create_all(eng)
+            with eng.begin() as conn:
+                conn.execute(WRITE_SQL, [{"id": f"SEED-{i}", "title": f"seed {i}", "body": "x" * 400} for i in range(500)])
+            results[label] = run_mixed(eng, args.readers, args.writers, args.seconds, args.batch)
+            eng.dispose()
+
+    print(f"readers={args.readers} writers={args.writers} seconds={args.seconds} batch={args.batch}")
+    print(f"tuned pragmas: {sqlite_pragmas('sqlite:///x.db')}")
+    keys = ["read_ops", "write_tx", "read_p50", "read_p95", "write_p50", "write_p95", "locked", "other_errors"]
+    print(f"{'metric':<14}{'default':>12}{'tuned':>12}")
+    for k in keys:
+        d, t = results["default"][k], results["tuned"][k]
+        fmt = "{:>12.1f}" if isinstance(d, float) else "{:>12d}"
+        print(f"{k:<14}" + fmt.format(d) + fmt.format(t))
+    print("(ops = 초당 횟수, p50/p95 = ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# worklaw-backend/scripts/bench/bench_wage_check.py
+"""
+POST /calc/minimum-wage-check 배치 계산 벤치마크
+
+- loop: 행마다 최저시급 조회 + 환산시급/부족액 계산 (파이썬 for, 단건 API를 N번 부르는 것과 같은 계산)
+- vectorized: utils.wage_check.compute (numpy 열 연산)
+- endpoint: JSON 입력 → NDJSON 스트리밍 응답 전체 수신까지 (ASGI 직접 호출, 네트워크 제외)
+
+실행:
+  python -m scripts.bench.bench_wage_check --rows 100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+import main  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+
+from utils import wage_check, wage_table  # noqa: E402
+from utils.wage_table import MinimumWageTable  # noqa: E402
+
+
+def make_table() -> MinimumWageTable:
+    rows = {y: (y, 4000 + (y - 2010) * 400, "KRW/hour") for y in range(2010, 2027)}
+    return MinimumWageTable(rows, time.monotonic())
+
+
+def make_rows(n: int, seed: int = 7):
+    rnd = random.Random(seed)
+    return [
+        {
+            "year": rnd.randint(2010, 2026),
+            "monthly_pay": rnd.randint(800_000, 3_000_000),
+            "contracted_hours": rnd.choice([209, 209, 209, 174, 120]),
+            "allowances": rnd.choice([0, 0, 50_000, 100_000]),
+        }
+        for _ in range(n)
+    ]
+
+
+def loop_check(table: MinimumWageTable, rows):
+    out = []
+    for r in rows:
+        hit = table.get(r["year"])
+        if hit is None:
+            out.append(None)
+            continue
+        total = r["monthly_pay"] + r["allowances"]
+        hourly = round(total / r["contracted_hours"], 2)
+        required = round(hit[1] * r["contracted_hours"])
+        out.append((hourly, required, max(0, required - total), hourly < hit[1]))
+    return out
+
+
+def timed(fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, res
+
+
+async def endpoint(rows, table):
+    wage_table._table = table
+    transport = ASGITransport(app=main.app)
+    async with AsyncClient(transport=transport, base_url="http://bench", timeout=None) as ac:
+        t0 = time.perf_counter()
+        res = await ac.post("/calc/minimum-wage-check", json={"rows": rows})
+        dt = time.perf_counter() - t0
+    assert res.status_code == 200, res.text[:200]
+    return dt, int(res.headers["x-violations"]), len(res.content)
+
+
+def main_():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    table = make_table()
+    rows = make_rows(args.rows)
+
+    t_loop, loop_res = timed(lambda: loop_check(table, rows), args.repeat)
+    t_parse, arr = timed(lambda: wage_check.arrays_from_rows(rows), args.repeat)
+    t_vec, res = timed(lambda: wage_check.compute(table, arr), args.repeat)
+
+    # 두 경로 결과가 같은지 확인
+    loop_viol = sum(1 for r in loop_res if r and r[3])
+    assert loop_viol == wage_check.summary(res)["violations"], (loop_viol, wage_check.summary(res))
+
+    t_http, viol, nbytes = asyncio.run(endpoint(rows, table))
+
+    print(f"rows={args.rows}  violations={viol}")
+    print(f"loop (per-row python)     : {t_loop * 1000:8.1f} ms")
+    print(f"vectorized compute        : {t_vec * 1000:8.1f} ms  (x{t_loop / t_vec:.1f})")
+    print(f"  + rows→arrays           : {t_parse * 1000:8.1f} ms")
+    print(f"endpoint JSON→NDJSON      : {t_http * 1000:8.1f} ms  ({nbytes / 1e6:.1f} MB, {args.rows / t_http:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main_()
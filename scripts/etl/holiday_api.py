@@ -1,22 +1,31 @@
-import json, os, hashlib
+import json, os
 from sqlalchemy.orm import Session
+from utils.cache import invalidate_source
+from database.bulk import bulk_upsert
 from models.knowledge_core import Holiday
+from scripts.etl.staging import stage_records
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "holidays_kr_2025.json")
 
 def run(db: Session):
     with open(DATA_PATH, "r", encoding="utf-8") as f:
         data = json.load(f)  # [{date,name,type,is_public}]
-    upserted = 0
-    h = hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
-    for r in data:
-        obj = db.query(Holiday).get(r["date"])
-        if not obj:
-            obj = Holiday(date=r["date"], name=r["name"])
-        obj.name = r["name"]
-        obj.type = r.get("type", "public")
-        obj.is_public = bool(r.get("is_public", True))
-        obj.source_ref = r.get("source_ref")
-        db.merge(obj); upserted += 1
+    # 변경 없는 날짜는 건너뛰고 새로 생기거나 바뀐 것만 반영
+    changed, skipped, h = stage_records(db, "holiday_api", data, lambda r: r["date"])
+    counts = bulk_upsert(db, Holiday, [
+        {
+            "date": r["date"],
+            "name": r["name"],
+            "type": r.get("type", "public"),
+            "is_public": bool(r.get("is_public", True)),
+            "source_ref": r.get("source_ref"),
+        }
+        for r in changed
+    ])
     db.commit()
-    return upserted, h, f"holidays: upserted={upserted}"
+    upserted = counts["inserted"] + counts["updated"]
+    if upserted:
+        invalidate_source("holiday_api")
+    return upserted, skipped, h, (
+        f"holidays: inserted={counts['inserted']} updated={counts['updated']} skipped={skipped}"
+    )
@@ -1,17 +1,17 @@
 from sqlalchemy.orm import Session
+from utils.cache import invalidate_source
+from database.bulk import bulk_upsert
 from models.knowledge_core import AdminInterpretation
+from scripts.etl.staging import stage_records
 
-def run(db: Session):
+def fetch():
     """
-    스켈레톤: 실제로는 행정해석 OpenAPI 페이징 호출 → upsert.
+    스켈레톤: 실제로는 행정해석 OpenAPI 페이징 호출.
     여기서는 1건 예시.
     """
-    upserted = 0
-    iid = "MOEL-INT-2025-0001"
-    obj = db.query(AdminInterpretation).get(iid)
-    if not obj:
-        obj = AdminInterpretation(
-            interp_id=iid,
+    return [
+        dict(
+            interp_id="MOEL-INT-2025-0001",
             title="연차사용계획 통지 관련 질의",
             asked_at="2025-01-10",
             answered_at="2025-01-20",
@@ -20,9 +20,17 @@ def run(db: Session):
             law_id="KOR_LAW_근로기준법",
             article_no="제61조",
             source_url="https://www.moel.go.kr",
-            tags="연차;촉진"
+            tags="연차;촉진",
         )
-        db.add(obj); upserted += 1
+    ]
+
+def run(db: Session):
+    changed, skipped, checksum = stage_records(db, "interpretation_api", fetch(), lambda r: r["interp_id"])
+    counts = bulk_upsert(db, AdminInterpretation, changed)
     db.commit()
-    checksum = f"interpretation-{upserted}"
-    return upserted, checksum, "interpretation demo upsert"
+    upserted = counts["inserted"] + counts["updated"]
+    if upserted:
+        invalidate_source("interpretation_api")
+    return upserted, skipped, checksum, (
+        f"interpretation: inserted={counts['inserted']} updated={counts['updated']} skipped={skipped}"
+    )
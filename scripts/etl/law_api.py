@@ -1,42 +1,49 @@
 from sqlalchemy.orm import Session
+from utils.cache import invalidate_source
+from database.bulk import bulk_upsert
 from models.knowledge_core import Law, LawVersion, LawArticle
+from scripts.etl.staging import stage_records
 from datetime import datetime
 
-def run(db: Session):
+_MODELS = {"law": Law, "version": LawVersion, "article": LawArticle}
+_KEYS = {"law": "law_id", "version": "id", "article": "id"}
+
+def fetch():
     """
-    스켈레톤: 실제로는 국가법령정보 OpenAPI를 호출해 laws/versions/articles를 적재.
-    여기서는 예시 1건을 더미로 채움.
+    스켈레톤: 실제로는 국가법령정보 OpenAPI를 호출해 laws/versions/articles를 가져옴.
+    여기서는 예시 1건을 더미로 채움. 레코드마다 kind(law/version/article)를 붙여 한 번에 스테이징.
     """
-    upserted = 0
-    # Law
     law_id = "KOR_LAW_근로기준법"
-    law = db.query(Law).get(law_id)
-    if not law:
-        law = Law(law_id=law_id, law_name_kr="근로기준법", law_name_en="Labor Standards Act", status="current")
-        db.add(law); upserted += 1
-    else:
-        law.status = "current"
-
-    # Version
     version_no = "2025-01-01"
-    from models.knowledge_core import LawVersion
-    ver = db.query(LawVersion).filter_by(law_id=law_id, version_no=version_no).first()
-    if not ver:
-        ver = LawVersion(id=f"{law_id}_{version_no}", law_id=law_id, version_no=version_no,
-                         effective_from="2025-01-01", effective_to=None, source_ref="demo")
-        db.add(ver); upserted += 1
-
-    # Article
-    art_id = f"{law_id}_{version_no}_제17조"
-    art = db.query(LawArticle).get(art_id)
-    if not art:
-        art = LawArticle(
-            id=art_id, law_id=law_id, version_no=version_no, article_no="제17조",
+    return [
+        dict(kind="law", law_id=law_id, law_name_kr="근로기준법", law_name_en="Labor Standards Act", status="current"),
+        dict(kind="version", id=f"{law_id}_{version_no}", law_id=law_id, version_no=version_no,
+             effective_from="2025-01-01", effective_to=None, source_ref="demo"),
+        dict(
+            kind="article", id=f"{law_id}_{version_no}_제17조", law_id=law_id, version_no=version_no, article_no="제17조",
             title="(근로조건의 명시)", body_text="사용자는 근로계약을 체결할 때 임금 등 근로조건을 명시하여야 한다.",
             body_html="<p>사용자는 근로계약을 체결할 때 임금 등 근로조건을 명시하여야 한다.</p>",
-            updated_at=str(datetime.utcnow().date())
-        )
-        db.add(art); upserted += 1
+        ),
+    ]
+
+def run(db: Session):
+    records = fetch()
+    changed, skipped, checksum = stage_records(db, "law_api", records, lambda r: f"{r['kind']}:{r[_KEYS[r['kind']]]}")
+    today = str(datetime.utcnow().date())
+    counts = {"inserted": 0, "updated": 0}
+    # 부모 → 자식 순서 (law → version → article), 종류별 upsert 한 번
+    for kind in ("law", "version", "article"):
+        rows = [{k: v for k, v in r.items() if k != "kind"} for r in changed if r["kind"] == kind]
+        if kind == "article":
+            for r in rows:
+                r["updated_at"] = today
+        c = bulk_upsert(db, _MODELS[kind], rows)
+        counts["inserted"] += c["inserted"]
+        counts["updated"] += c["updated"]
     db.commit()
-    checksum = f"{law_id}-{version_no}-{upserted}"
-    return upserted, checksum, "law_api demo upsert"
+    upserted = counts["inserted"] + counts["updated"]
+    if upserted:
+        invalidate_source("law_api")
+    return upserted, skipped, checksum, (
+        f"law_api: inserted={counts['inserted']} updated={counts['updated']} skipped={skipped}"
+    )
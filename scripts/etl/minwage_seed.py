@@ -1,23 +1,74 @@
-import json, os, hashlib
+import json, os
+from typing import Any, Dict, List
+
+from sqlalchemy import MetaData, Table, inspect, select
 from sqlalchemy.orm import Session
-from models.knowledge_core import MinimumWageHistory
+from utils.cache import invalidate_source
+from utils.dates import iso_date
+from database.bulk import bulk_upsert
+from scripts.etl.staging import stage_records
 
 DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "minimum_wage_seed.json")
+TABLE = "minimum_wage_history"
+
+# minimum_wage_history 는 DB마다 스키마가 다를 수 있음 (20261018_minimum_wage_history_year_key 참고)
+# → ORM 모델(models.wage 와 테이블을 공유) 대신 실제 테이블을 반영(reflect)해 있는 컬럼만 쓴다
+#   year 가 PK/UNIQUE 면 bulk_upsert(ON CONFLICT (year)), 아니면 연도별 UPDATE 후 없는 연도만 INSERT
+
+def _reflect(db: Session) -> tuple[Table, bool]:
+    conn = db.connection()
+    insp = inspect(conn)
+    table = Table(TABLE, MetaData(), autoload_with=conn)
+    uniques = [u["column_names"] for u in insp.get_unique_constraints(TABLE)]
+    uniques += [i["column_names"] for i in insp.get_indexes(TABLE) if i.get("unique")]
+    year_is_key = [c.name for c in table.primary_key.columns] == ["year"] or ["year"] in uniques
+    return table, year_is_key
+
+def _upsert_by_year(db: Session, table: Table, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """year 유일 제약이 없는 스키마: 있는 연도는 UPDATE(같은 연도 행 모두), 없는 연도만 INSERT"""
+    years = [r["year"] for r in rows]
+    existing = set(db.execute(select(table.c.year).where(table.c.year.in_(years))).scalars())
+    updated = [r for r in rows if r["year"] in existing]
+    inserted = [r for r in rows if r["year"] not in existing]
+    for r in updated:
+        db.execute(table.update().where(table.c.year == r["year"]).values({k: v for k, v in r.items() if k != "year"}))
+    if inserted:
+        db.execute(table.insert(), inserted)
+    return {"inserted": len(inserted), "updated": len(updated)}
 
 def run(db: Session):
     with open(DATA_PATH, "r", encoding="utf-8") as f:
         data = json.load(f)  # [{year, hourly, monthly_209h, notice_no, notice_date, source_url}]
-    upserted = 0
-    h = hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
-    for r in data:
-        obj = db.query(MinimumWageHistory).get(r["year"])
-        if not obj:
-            obj = MinimumWageHistory(year=r["year"], hourly=r["hourly"])
-        obj.hourly = r["hourly"]
-        obj.monthly_209h = r.get("monthly_209h")
-        obj.notice_no = r.get("notice_no")
-        obj.notice_date = r.get("notice_date")
-        obj.source_url = r.get("source_url")
-        db.merge(obj); upserted += 1
+    changed, skipped, h = stage_records(db, "minwage", data, lambda r: r["year"])
+
+    table, year_is_key = _reflect(db)
+    cols = set(table.c.keys())
+    rows = []
+    for r in changed:
+        row = {
+            "year": r["year"],
+            "hourly": r["hourly"],
+            "monthly_209h": r.get("monthly_209h"),
+            "notice_no": r.get("notice_no"),
+            "notice_date": r.get("notice_date"),
+            "notice_date_iso": iso_date(r.get("notice_date")),
+            "source_url": r.get("source_url"),
+        }
+        if "amount" in cols and "hourly" not in cols:
+            # amount/unit 스키마 (scripts/seed_knowledge_sqlite.py 와 같은 대응)
+            row.update(amount=row.pop("hourly"), unit="KRW/hour")
+        rows.append({k: v for k, v in row.items() if k in cols})
+
+    if not rows:
+        counts = {"inserted": 0, "updated": 0}
+    elif year_is_key:
+        counts = bulk_upsert(db, table, rows, key=["year"])
+    else:
+        counts = _upsert_by_year(db, table, rows)
     db.commit()
-    return upserted, h, f"minwage: upserted={upserted}"
+    upserted = counts["inserted"] + counts["updated"]
+    if upserted:
+        invalidate_source("minwage")
+    return upserted, skipped, h, (
+        f"minwage: inserted={counts['inserted']} updated={counts['updated']} skipped={skipped}"
+    )
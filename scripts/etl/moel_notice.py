@@ -1,17 +1,17 @@
 from sqlalchemy.orm import Session
+from utils.cache import invalidate_source
+from database.bulk import bulk_upsert
 from models.knowledge_core import PolicyBulletin
+from scripts.etl.staging import stage_records
 
-def run(db: Session):
+def fetch():
     """
-    스켈레톤: 실제로는 MOEL 공지/고시 게시판 크롤/피드 → upsert.
+    스켈레톤: 실제로는 MOEL 공지/고시 게시판 크롤/피드.
     여기서는 1건 예시.
     """
-    upserted = 0
-    bid = "PB-2025-001"
-    obj = db.query(PolicyBulletin).get(bid)
-    if not obj:
-        obj = PolicyBulletin(
-            id=bid,
+    return [
+        dict(
+            id="PB-2025-001",
             title="2025 최저임금 고시 요약",
             effective_date="2025-01-01",
             audience="both",
@@ -20,9 +20,17 @@ def run(db: Session):
             law_id="KOR_LAW_최저임금법",
             article_no="제6조",
             source_url="https://www.moel.go.kr",
-            tags="최저임금;고시"
+            tags="최저임금;고시",
         )
-        db.add(obj); upserted += 1
+    ]
+
+def run(db: Session):
+    changed, skipped, checksum = stage_records(db, "moel_notice", fetch(), lambda r: r["id"])
+    counts = bulk_upsert(db, PolicyBulletin, changed)
     db.commit()
-    checksum = f"notice-{upserted}"
-    return upserted, checksum, "moel_notice demo upsert"
+    upserted = counts["inserted"] + counts["updated"]
+    if upserted:
+        invalidate_source("moel_notice")
+    return upserted, skipped, checksum, (
+        f"moel_notice: inserted={counts['inserted']} updated={counts['updated']} skipped={skipped}"
+    )
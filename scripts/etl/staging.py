@@ -0,0 +1,83 @@
+"""
+ETL 공통 스테이징 단계 (staging_raw 기반 증분 동기화)
+
+- 원천 레코드마다 정규화 JSON의 SHA-256을 구해 staging_raw(source_key, natural_id)의 checksum과 비교
+- 기존 checksum은 natural_id IN (...) 청크 조회로 한꺼번에 가져옴 (레코드당 SELECT 없음)
+- 새로 생기거나 바뀐 레코드만 반환 → 도메인 upsert 대상
+- payload는 레코드(dict) 그대로 넘김 → CompressedJSON 컬럼이 압축 저장 (checksum은 정규화 JSON 기준 그대로)
+- staging_raw 행은 같은 세션에 추가/갱신만 하고 commit은 호출 측(도메인 upsert와 같은 트랜잭션)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from models.knowledge_core import StagingRaw
+
+LOOKUP_CHUNK = 500  # SQLite 바인드 변수 한도(999) 아래로
+
+def canonical_json(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+def record_checksum(record: Dict[str, Any]) -> str:
+    return hashlib.sha256(canonical_json(record).encode("utf-8")).hexdigest()
+
+def set_checksum(pairs: Iterable[Tuple[str, str]]) -> str:
+    """(natural_id, checksum) 전체에 대한 순서 무관 checksum (SyncJob.checksum용)"""
+    h = hashlib.sha256()
+    for nid, c in sorted(pairs):
+        h.update(f"{nid}\t{c}\n".encode("utf-8"))
+    return h.hexdigest()
+
+def _existing_checksums(db: Session, source_key: str, natural_ids: List[str]) -> Dict[str, StagingRaw]:
+    out: Dict[str, StagingRaw] = {}
+    for i in range(0, len(natural_ids), LOOKUP_CHUNK):
+        chunk = natural_ids[i:i + LOOKUP_CHUNK]
+        rows = (
+            db.query(StagingRaw)
+            .filter(StagingRaw.source_key == source_key, StagingRaw.natural_id.in_(chunk))
+            .all()
+        )
+        out.update({r.natural_id: r for r in rows})
+    return out
+
+def stage_records(
+    db: Session,
+    source_key: str,
+    records: Iterable[Dict[str, Any]],
+    natural_id: Callable[[Dict[str, Any]], Any],
+) -> Tuple[List[Dict[str, Any]], int, str]:
+    """
+    반환: (새로 생기거나 바뀐 레코드 목록, 건너뛴(변경 없음) 수, 전체 set checksum)
+    같은 natural_id가 여러 번 오면 마지막 레코드가 이긴다.
+    """
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for r in records:
+        by_id[str(natural_id(r))] = r
+    sums = {nid: record_checksum(r) for nid, r in by_id.items()}
+
+    existing = _existing_checksums(db, source_key, list(by_id))
+    now = datetime.utcnow()
+    changed: List[Dict[str, Any]] = []
+    skipped = 0
+    for nid, r in by_id.items():
+        c = sums[nid]
+        row = existing.get(nid)
+        if row is not None and row.checksum == c:
+            skipped += 1
+            continue
+        if row is None:
+            db.add(StagingRaw(
+                id=f"{source_key}:{nid}", source_key=source_key, natural_id=nid,
+                payload=r, checksum=c, fetched_at=now,
+            ))
+        else:
+            row.payload = r
+            row.checksum = c
+            row.fetched_at = now
+        changed.append(r)
+    return changed, skipped, set_checksum(sums.items())
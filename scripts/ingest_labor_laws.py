@@ -1,13 +1,20 @@
 # worklaw-backend/scripts/ingest_labor_laws.py
 import os
-import json
+import re
+import asyncio
 import time
+import hashlib
 import pathlib
-import requests
+from datetime import datetime
 from typing import List, Dict, Any
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from database.connection import SessionLocal, Base, engine
+from database.bulk import dialect_insert, rows_per_statement
 from models.law import Law, LawArticle, LawArticleVersion
+from scripts.law_extract import iter_articles
+from scripts.law_fetch import DONE, RESTART, fetch_laws_to_queue
+from utils import law_timeline
 
 """
 환경변수:
@@ -15,8 +22,6 @@ from models.law import Law, LawArticle, LawArticleVersion
 예) setx LAW_OC yourid
 """
 
-OPENAPI_BASE = "https://www.law.go.kr/DRF/lawService.do"
-
 TARGET_LAWS = [
     "근로기준법",
     "최저임금법",
@@ -30,175 +35,269 @@ TARGET_LAWS = [
     "노동조합 및 노동관계조정법",
 ]
 
-def fetch_law_json_by_name(oc: str, law_name: str) -> Dict[str, Any] | None:
-    """
-    현행법령(시행일) 본문 JSON 조회(target=eflaw, LM=법령명)
-    문서: https://open.law.go.kr/LSO/openApi/guideResult.do?htmlName=lsEfYdInfoGuide
-    """
-    params = {
-        "OC": oc,
-        "target": "eflaw",
-        "LM": law_name,
-        "type": "JSON",
-    }
-    r = requests.get(OPENAPI_BASE, params=params, timeout=20)
-    if r.status_code != 200:
-        print(f"❌ HTTP {r.status_code} for {law_name}")
-        return None
-    try:
-        return r.json()
-    except Exception:
-        # 일부 응답이 JSON string 형태일 수 있어 방어 처리
-        try:
-            return json.loads(r.text)
-        except Exception as e:
-            print(f"❌ JSON parse error for {law_name}: {e}")
-            return None
-
 def extract_articles_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     응답 JSON 구조가 문서/버전에 따라 다소 차이날 수 있습니다.
-    안전하게 '조문 목록'에 해당하는 배열을 탐색하고, 조문번호/표제/본문 텍스트를 생성합니다.
+    '조문 목록'에 해당하는 배열을 탐색해 조문번호/표제/본문 텍스트를 생성합니다.
+    (구현: scripts/law_extract.py 의 스트리밍 추출기)
     원본 JSON은 LawArticle.current_json / LawArticleVersion.raw_json 에 저장합니다.
     """
-    # 가능한 키 후보
-    # 예시: payload["eflaw"]["조문"]["조문내용"] ... 구조가 다양할 수 있음.
-    # 안전하게 문자열 결합을 위해 텍스트를 최대한 풀어 추출.
-    articles: List[Dict[str, Any]] = []
-
-    def flatten_text(node: Any) -> str:
-        if node is None:
-            return ""
-        if isinstance(node, str):
-            return node
-        if isinstance(node, list):
-            return "\n".join(flatten_text(x) for x in node)
-        if isinstance(node, dict):
-            parts = []
-            for k, v in node.items():
-                parts.append(flatten_text(v))
-            return "\n".join(p for p in parts if p)
-        return str(node)
-
-    # 대략적인 구조 탐색
-    root = payload.get("eflaw") or payload.get("law") or payload
-    if not root:
-        return articles
-
-    # 조문 리스트 위치를 찾아봅니다.
-    # 보편적으로 '조문' 배열 또는 '조문목록' 형태가 존재.
-    candidates = []
-    for key in ["조문", "조문목록", "장", "편", "항목"]:
-        val = root.get(key)
-        if val:
-            candidates.append(val)
-
-    # 후보들 중 리스트를 재귀적으로 순회하여 '조문' 성격의 dict들을 수집
-    stack = candidates[:]
-    while stack:
-        cur = stack.pop(0)
-        if isinstance(cur, list):
-            for item in cur:
-                stack.append(item)
-        elif isinstance(cur, dict):
-            # 조문 유력 키
-            article_no = cur.get("조문번호") or cur.get("조") or cur.get("조문")
-            content = cur.get("조문내용") or cur.get("내용") or cur.get("본문")
-            title = cur.get("조문제목") or cur.get("제목")
-
-            # 조문번호가 있으면 조문으로 간주
-            if article_no:
-                articles.append({
-                    "article_no": str(article_no),
-                    "title": str(title) if title else None,
-                    "text": flatten_text(content),
-                    "raw": cur,
-                })
-            else:
-                # 하위 탐색
-                for v in cur.values():
-                    stack.append(v)
-
-    # 중복/공백 제거
-    uniq = {}
-    for a in articles:
-        key = a["article_no"]
-        if key not in uniq:
-            uniq[key] = a
-    return list(uniq.values())
+    return list(iter_articles(payload))
 
 def upsert_law(db: Session, name: str, mst: str | None = None, law_id: str | None = None):
+    # commit하지 않고 flush만 → 조문 upsert와 같은 트랜잭션(법령 단위)으로 묶음
     row = db.query(Law).filter(Law.name == name).first()
     if not row:
         row = Law(name=name, mst=mst, law_id=law_id, status="ACTIVE")
         db.add(row)
-        db.commit()
-        db.refresh(row)
+        db.flush()
     return row
 
-def upsert_articles(db: Session, law_row: Law, articles: List[Dict[str, Any]]):
-    for a in articles:
-        art = db.query(LawArticle).filter(
-            LawArticle.law_id_fk == law_row.id,
-            LawArticle.article_no == a["article_no"]
-        ).first()
-        if not art:
-            art = LawArticle(
-                law_id_fk=law_row.id,
-                article_no=a["article_no"],
-                title=a.get("title"),
-                current_text=a.get("text"),
-                current_json=a.get("raw"),
-            )
-            db.add(art)
-            db.commit()
-            db.refresh(art)
-        else:
-            # 변경 시 갱신
-            art.title = a.get("title")
-            art.current_text = a.get("text")
-            art.current_json = a.get("raw")
-            db.commit()
-
-        # 버전 스냅샷(간단): 시행일 키를 찾으면 저장
-        effective = None
-        raw = a.get("raw") or {}
+def _effective_date(raw: Any) -> str | None:
+    # 버전 스냅샷(간단): 시행일 키를 찾으면 저장
+    if isinstance(raw, dict):
         for k in ["시행일자", "시행일", "effectiveDate"]:
-            if isinstance(raw, dict) and raw.get(k):
-                effective = str(raw.get(k))
+            if raw.get(k):
+                return str(raw.get(k))
+    return None
+
+_WS = re.compile(r"\s+")
+
+def article_content_hash(text: str | None, effective_date: str | None) -> str:
+    """정규화 본문(연속 공백 1칸, 앞뒤 공백 제거) + 시행일의 SHA-256"""
+    normalized = _WS.sub(" ", text or "").strip()
+    return hashlib.sha256(f"{normalized}\x1f{effective_date or ''}".encode("utf-8")).hexdigest()
+
+class ArticleWriter:
+    """
+    법령 하나의 조문을 배치 단위로 적재 (commit() 전까지 한 트랜잭션).
+    1) 기존 (law_id_fk, article_no) -> (id, content_hash) 맵을 쿼리 1회로 로드
+    2) add(batch): 신규/변경/동일을 메모리에서 구분(content_hash 비교) → 신규·변경분만
+       다중 행 INSERT ... ON CONFLICT DO UPDATE (청크 단위) + 버전 스냅샷 bulk insert
+    3) commit(): commit 1회 후 시행일 인덱스 캐시 갱신
+    """
+
+    def __init__(self, db: Session, law_row: Law):
+        self.db = db
+        self.law_row = law_row
+        self.existing: Dict[str, tuple[int, str | None]] = {
+            no: (pk, h)
+            for no, pk, h in db.execute(
+                select(LawArticle.article_no, LawArticle.id, LawArticle.content_hash)
+                .where(LawArticle.law_id_fk == law_row.id)
+            ).all()
+        }
+        self.now = datetime.utcnow()
+        self.stats = {"new": 0, "changed": 0, "unchanged": 0, "versions": 0}
+        self.articles = 0
+        self._touched: List[int] = []
+
+    def add(self, articles: List[Dict[str, Any]]) -> None:
+        db, law_row, now = self.db, self.law_row, self.now
+        new_nos: List[str] = []
+        rows = []
+        writes = []
+        for a in articles:
+            effective = _effective_date(a.get("raw"))
+            h = article_content_hash(a.get("text"), effective)
+            prev = self.existing.get(a["article_no"])
+            if prev is None:
+                new_nos.append(a["article_no"])
+            elif prev[1] != h:
+                self.stats["changed"] += 1
+            else:
+                self.stats["unchanged"] += 1
+                continue  # 본문·시행일 동일 → 쓰기/버전 생략
+            writes.append((a, effective, h))
+            rows.append({
+                "law_id_fk": law_row.id,
+                "article_no": a["article_no"],
+                "title": a.get("title"),
+                "current_text": a.get("text"),
+                "current_json": a.get("raw"),
+                "content_hash": h,
+                "updated_at": now,
+            })
+        self.articles += len(articles)
+        self.stats["new"] += len(new_nos)
+
+        insert = dialect_insert(db)
+        # 다중 VALUES 문장 하나의 바인드 변수 수(행 × 7컬럼)가 방언 한도(SQLite 999)를 넘지 않게
+        chunk = rows_per_statement(db, len(rows[0])) if rows else 1
+        for i in range(0, len(rows), chunk):
+            stmt = insert(LawArticle).values(rows[i:i + chunk])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[LawArticle.law_id_fk, LawArticle.article_no],
+                set_={
+                    "title": stmt.excluded.title,
+                    "current_text": stmt.excluded.current_text,
+                    "current_json": stmt.excluded.current_json,
+                    "content_hash": stmt.excluded.content_hash,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            )
+            db.execute(stmt)
+
+        ids: Dict[str, int] = {}
+        if new_nos:
+            # 새로 들어간 조문의 id만 한 번 더 조회
+            ids.update(
+                db.execute(
+                    select(LawArticle.article_no, LawArticle.id).where(
+                        LawArticle.law_id_fk == law_row.id,
+                        LawArticle.article_no.in_(new_nos),
+                    )
+                ).all()
+            )
+        # 다음 배치에 같은 조문이 또 오면 방금 쓴 해시와 비교
+        for a, _effective, h in writes:
+            no = a["article_no"]
+            self.existing[no] = (ids[no] if no in ids else self.existing[no][0], h)
+
+        versions = [
+            {
+                "article_id_fk": self.existing[a["article_no"]][0],
+                "effective_date": effective,
+                "text": a.get("text"),
+                "raw_json": a.get("raw"),
+                "created_at": now,
+            }
+            for a, effective, _h in writes
+        ]
+        if versions:
+            db.execute(dialect_insert(db)(LawArticleVersion), versions)
+        self.stats["versions"] += len(versions)
+        self._touched.extend(v["article_id_fk"] for v in versions)
+
+    def commit(self) -> Dict[str, int]:
+        self.db.commit()
+        # 같은 프로세스의 시행일 인덱스 캐시 갱신 (다른 프로세스는 TTL로 반영)
+        law_timeline.invalidate(self._touched)
+        return dict(self.stats)
+
+def upsert_articles(db: Session, law_row: Law, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+    """법령 하나의 조문 목록을 한 트랜잭션으로 적재 (ArticleWriter, commit 1회)"""
+    writer = ArticleWriter(db, law_row)
+    writer.add(articles)
+    return writer.commit()
+
+def _begin_law(db: Session, name: str) -> ArticleWriter:
+    return ArticleWriter(db, upsert_law(db, name))
+
+async def _store_articles(db: Session, name: str, batches: "asyncio.Queue") -> tuple[int, Dict[str, int], float] | None:
+    """
+    법령 하나의 조문 배치를 받는 대로 적재(DB 작업은 스레드). 법령 단위 한 트랜잭션 → 끝(DONE)에서 commit 1회.
+    RESTART면 지금까지 적재분을 롤백하고 처음부터, 실패(None)면 롤백 후 None.
+    반환: (조문 수, upsert 통계, 적재 소요 초)
+    """
+    writer: ArticleWriter | None = None
+    elapsed = 0.0
+
+    async def run(fn, *args):
+        nonlocal elapsed
+        t0 = time.perf_counter()
+        try:
+            return await asyncio.to_thread(fn, *args)
+        finally:
+            elapsed += time.perf_counter() - t0
+
+    try:
+        while True:
+            batch = await batches.get()
+            if batch is DONE:
                 break
+            if batch is None or batch is RESTART:
+                if writer is not None:
+                    await run(db.rollback)
+                    writer = None
+                if batch is None:
+                    return None
+                continue
+            if writer is None:
+                writer = await run(_begin_law, db, name)
+            await run(writer.add, batch)
+        if writer is None:
+            writer = await run(_begin_law, db, name)  # 조문 없는 법령도 법령 행은 남김
+        stats = await run(writer.commit)
+    except BaseException:
+        db.rollback()
+        raise
+    return writer.articles, stats, elapsed
 
-        ver = LawArticleVersion(
-            article_id_fk=art.id,
-            effective_date=effective,
-            text=a.get("text"),
-            raw_json=a.get("raw"),
-        )
-        db.add(ver)
-        db.commit()
+async def ingest_async(
+    oc: str,
+    names: List[str],
+    db: Session,
+    concurrency: int = 4,
+    rate: float = 2.0,
+    transport=None,
+) -> Dict[str, Any]:
+    """
+    수집+스트리밍 파싱(비동기, 동시 요청) → 큐 → 적재(스레드, 순차) 파이프라인.
+    적재는 DB 세션 하나를 쓰므로 법령 순서대로 돌리고, 그동안 다음 법령 수집은 계속 진행된다.
+    조문은 법령 전체가 아니라 BATCH_SIZE개 배치로 넘어오므로 큰 법령도 메모리에 한꺼번에 쌓이지 않는다.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, concurrency))
+    producer = asyncio.create_task(
+        fetch_laws_to_queue(oc, names, queue, concurrency=concurrency, rate=rate, transport=transport)
+    )
+    total_rows, total_sec = 0, 0.0
+    summary = {"new": 0, "changed": 0, "unchanged": 0, "versions": 0}
+    failed: List[str] = []
+    try:
+        while True:
+            item = await queue.get()
+            if item is DONE:
+                break
+            name, batches = item
+            stored = await _store_articles(db, name, batches)
+            if stored is None:
+                print(f"⚠ {name} 응답 없음")
+                failed.append(name)
+                continue
+            n, stats, elapsed = stored
+            total_rows += n
+            total_sec += elapsed
+            for k in summary:
+                summary[k] += stats[k]
+            print(
+                f"✅ {name}: {n}개 조문 저장 "
+                f"(신규 {stats['new']}, 변경 {stats['changed']}, 동일 {stats['unchanged']}, "
+                f"{n / elapsed if elapsed else 0:.0f} rows/s)"
+            )
+    finally:
+        if not producer.done():
+            producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+    # 법령별 오류는 이미 failed에 들어감. 수집 단계 자체가 실패했으면(클라이언트 생성 등) 삼키지 않고 올림
+    if not producer.cancelled() and producer.exception() is not None:
+        raise producer.exception()
+    return {"rows": total_rows, "seconds": total_sec, "summary": summary, "failed": failed}
 
 def ingest():
     oc = os.getenv("LAW_OC")
     if not oc:
         raise RuntimeError("환경변수 LAW_OC가 설정되어야 합니다. (예: setx LAW_OC yourid)")
 
+    # 동시 요청 수 / 초당 호출 수 (API 쿼터에 맞게 조정)
+    concurrency = int(os.getenv("LAW_FETCH_CONCURRENCY", "4"))
+    rate = float(os.getenv("LAW_FETCH_RATE", "2.0"))
+
     Base.metadata.create_all(bind=engine)
     db: Session = SessionLocal()
     try:
-        for name in TARGET_LAWS:
-            print(f"▶ {name} 가져오는 중...")
-            payload = fetch_law_json_by_name(oc, name)
-            if not payload:
-                print(f"⚠ {name} 응답 없음")
-                continue
-            articles = extract_articles_from_payload(payload)
-            law_row = upsert_law(db, name)
-            upsert_articles(db, law_row, articles)
-            print(f"✅ {name}: {len(articles)}개 조문 저장")
-            time.sleep(0.6)  # 매너 타임 & 과도 호출 방지
+        result = asyncio.run(ingest_async(oc, TARGET_LAWS, db, concurrency=concurrency, rate=rate))
     finally:
         db.close()
+    total_rows, total_sec, summary = result["rows"], result["seconds"], result["summary"]
+    if total_sec:
+        print(f"📊 적재 합계: {total_rows} rows / {total_sec:.2f}s = {total_rows / total_sec:.0f} rows/s")
+    print(
+        f"📊 변경 요약: 신규 {summary['new']}, 변경 {summary['changed']}, "
+        f"동일 {summary['unchanged']} → 버전 {summary['versions']}건 추가"
+    )
+    if result["failed"]:
+        print(f"⚠ 수집 실패: {', '.join(result['failed'])}")
 
 if __name__ == "__main__":
     ingest()
-+
\ No newline at end of file
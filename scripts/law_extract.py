@@ -0,0 +1,178 @@
+# worklaw-backend/scripts/law_extract.py
+"""
+법령 응답 JSON → 조문 레코드 추출기 (ingest_labor_laws.py에서 사용)
+
+- deque 기반 너비 우선 순회(기존 list.pop(0)의 O(n²) 제거), 조문을 찾는 즉시 yield
+- 본문 평탄화는 버퍼(list) 하나에 조각을 쓰고 마지막에 한 번만 join
+  (단계마다 중간 문자열을 만들던 재귀 join 제거, 결과 문자열은 기존과 동일)
+- 조문 원본(raw)은 응답 트리의 dict를 그대로 참조(복사 없음)
+- ArticleStreamParser: 응답 바이트 스트림을 증분 파싱해(ijson) 조문 객체가 닫히는 즉시
+  레코드를 내보냄. 응답 전체 텍스트/dict 트리를 만들지 않으므로 메모리는 조문 하나 크기에 비례
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import ijson  # 선택 의존성: 스트리밍 파싱 (없으면 전체 파싱 경로 사용)
+except Exception:  # pragma: no cover
+    ijson = None
+
+# 조문 목록이 들어 있을 수 있는 최상위 키
+ROOT_KEYS = ("조문", "조문목록", "장", "편", "항목")
+
+def _write_text(node: Any, buf: List[str]) -> bool:
+    """
+    node의 텍스트를 buf에 이어 쓴다. 반환: 빈 문자열이 아닌 내용을 썼는지.
+    규칙(기존 flatten_text와 동일):
+      - list: 모든 원소를 '\\n'으로 연결(빈 원소 포함)
+      - dict: 비어 있지 않은 값만 '\\n'으로 연결
+    """
+    if node is None:
+        return False
+    if isinstance(node, str):
+        if node:
+            buf.append(node)
+            return True
+        return False
+    if isinstance(node, list):
+        wrote = False
+        for i, x in enumerate(node):
+            if i:
+                buf.append("\n")
+                wrote = True
+            if _write_text(x, buf):
+                wrote = True
+        return wrote
+    if isinstance(node, dict):
+        wrote = False
+        for v in node.values():
+            mark = len(buf)
+            if wrote:
+                buf.append("\n")
+            if _write_text(v, buf):
+                wrote = True
+            else:
+                del buf[mark:]  # 빈 값이면 방금 넣은 구분자까지 되돌림
+        return wrote
+    s = str(node)
+    if s:
+        buf.append(s)
+        return True
+    return False
+
+def flatten_text(node: Any) -> str:
+    buf: List[str] = []
+    _write_text(node, buf)
+    return "".join(buf)
+
+def article_record(node: Dict[str, Any]) -> Dict[str, Any] | None:
+    """조문번호가 있는 dict면 조문 레코드, 아니면 None"""
+    article_no = node.get("조문번호") or node.get("조") or node.get("조문")
+    if not article_no:
+        return None
+    content = node.get("조문내용") or node.get("내용") or node.get("본문")
+    title = node.get("조문제목") or node.get("제목")
+    return {
+        "article_no": str(article_no),
+        "title": str(title) if title else None,
+        "text": flatten_text(content),
+        "raw": node,
+    }
+
+def iter_articles(payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    조문 레코드를 스트림으로 생성 (조문번호 기준 첫 등장만, 순서는 기존 BFS와 동일)
+    """
+    root = payload.get("eflaw") or payload.get("law") or payload
+    if not isinstance(root, dict):
+        return
+    queue: deque = deque(v for v in (root.get(k) for k in ROOT_KEYS) if v)
+    seen: set[str] = set()
+    while queue:
+        cur = queue.popleft()
+        if isinstance(cur, list):
+            queue.extend(cur)
+        elif isinstance(cur, dict):
+            rec = article_record(cur)
+            if rec is None:
+                queue.extend(cur.values())
+            elif rec["article_no"] not in seen:
+                seen.add(rec["article_no"])
+                yield rec
+
+
+# --- 스트리밍 파싱 ---------------------------------------------------------------
+WRAPPER_KEYS = ("eflaw", "law")
+
+def _in_scope(prefix: str) -> bool:
+    """ijson prefix('law.조문.item')가 조문 탐색 범위(ROOT_KEYS 하위)인지"""
+    parts = prefix.split(".") if prefix else []
+    if parts and parts[0] in WRAPPER_KEYS:
+        parts = parts[1:]
+    return bool(parts) and parts[0] in ROOT_KEYS
+
+class ArticleStreamParser:
+    """
+    feed(bytes)로 응답 조각을 밀어 넣으면 그 사이 완성된 조문 레코드 목록을 돌려준다.
+    - 범위 밖(기본정보, 부칙 등) 이벤트는 객체로 만들지 않고 버림
+    - 조문 dict가 닫히면 레코드로 내보내고 부모 컨테이너에는 붙이지 않음
+      → 장/편 같은 상위 컨테이너가 조문을 쌓아 두지 않음
+    - 순서는 문서 순서(기존 BFS와 다를 수 있음), 조문번호 중복은 첫 등장만
+    """
+
+    def __init__(self):
+        if ijson is None:
+            raise RuntimeError("ijson is not installed (pip install ijson)")
+        self._events = ijson.sendable_list()
+        self._coro = ijson.parse_coro(self._events, use_float=True)
+        self._stack: List[list] = []  # [컨테이너, 다음 map key]
+        self._seen: set[str] = set()
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._coro.send(chunk)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._coro.close()
+        return self._drain()
+
+    def _attach(self, value: Any) -> None:
+        top = self._stack[-1]
+        if isinstance(top[0], list):
+            top[0].append(value)
+        else:
+            top[0][top[1]] = value
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        out: List[Dict[str, Any]] = []
+        stack = self._stack
+        for prefix, event, value in self._events:
+            if event in ("start_map", "start_array"):
+                if stack or _in_scope(prefix):
+                    stack.append([{} if event == "start_map" else [], None])
+            elif not stack:
+                continue
+            elif event == "map_key":
+                stack[-1][1] = value
+            elif event in ("end_map", "end_array"):
+                obj = stack.pop()[0]
+                rec = article_record(obj) if event == "end_map" else None
+                if rec is not None:
+                    if rec["article_no"] not in self._seen:
+                        self._seen.add(rec["article_no"])
+                        out.append(rec)
+                elif stack:
+                    self._attach(obj)
+            else:
+                self._attach(value)
+        del self._events[:]
+        return out
+
+def iter_articles_from_stream(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """bytes 조각 이터러블(예: requests의 iter_content) → 조문 레코드 스트림"""
+    parser = ArticleStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
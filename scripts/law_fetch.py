@@ -0,0 +1,292 @@
+# worklaw-backend/scripts/law_fetch.py
+"""
+법령 본문 비동기 수집 단계 (ingest_labor_laws.py에서 사용)
+
+- httpx.AsyncClient 하나를 공유(커넥션 풀 재사용)
+- 토큰 버킷으로 초당 호출 수 제한(API 쿼터 기준), 세마포어로 동시 요청 수 제한
+- 429/5xx/네트워크 오류는 지수 백오프 + 지터로 재시도 (429는 Retry-After 우선)
+- 응답 본문은 스트리밍으로 받아 증분 파싱(scripts/law_extract.ArticleStreamParser)
+- 결과(조문 레코드)는 법령마다 작은 배치 큐(BATCH_SIZE개씩)로 흘려보내 적재 단계가 수집과 겹쳐 돌게 함
+  → 메모리에 동시에 있는 조문은 (동시 요청 수 × 배치 큐 크기 × BATCH_SIZE) 정도로 제한(법령 크기와 무관)
+- transport 인자로 httpx.MockTransport 등을 넣으면 네트워크 없이 테스트 가능
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from scripts.law_extract import ArticleStreamParser, ijson, iter_articles
+
+OPENAPI_BASE = "https://www.law.go.kr/DRF/lawService.do"
+
+# 큐 종료 표시
+DONE = object()
+# 재시도로 응답을 처음부터 다시 받는 중 → 받는 쪽은 그 법령에서 받은 배치를 버림
+RESTART = object()
+
+# 법령 하나의 조문 배치 크기 / 적재 쪽이 따라올 때까지 미리 받아 둘 배치 수
+BATCH_SIZE = 200
+BATCH_QUEUE_SIZE = 2
+
+class TokenBucket:
+    """rate개/초로 채워지고 최대 capacity개까지 쌓이는 토큰 버킷 (asyncio용)"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        # 락을 잡은 채로 기다려 토큰을 선착순으로 배분
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await self._sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    # full jitter: [0.5, 1.5) × base × 2^attempt, 상한 cap
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    v = resp.headers.get("Retry-After")
+    try:
+        return float(v) if v is not None else None
+    except ValueError:
+        return None
+
+async def _read_json(r: httpx.Response, law_name: str) -> Dict[str, Any] | None:
+    body = await r.aread()
+    try:
+        return json.loads(body)
+    except Exception as e:
+        print(f"❌ JSON parse error for {law_name}: {e}")
+        return None
+
+async def _read_articles(r: httpx.Response, law_name: str) -> List[Dict[str, Any]] | None:
+    # 바이트 조각이 도착하는 대로 증분 파싱 → 조문이 닫히는 즉시 레코드로
+    parser = ArticleStreamParser()
+    articles: List[Dict[str, Any]] = []
+    try:
+        async for chunk in r.aiter_bytes():
+            articles.extend(parser.feed(chunk))
+        articles.extend(parser.close())
+    except ijson.JSONError as e:
+        print(f"❌ JSON parse error for {law_name}: {e}")
+        return None
+    return articles
+
+def _batch_reader(out: "asyncio.Queue", batch_size: int) -> Callable[[httpx.Response, str], Awaitable[Any]]:
+    """
+    응답을 증분 파싱하면서 조문이 batch_size개 모일 때마다 out에 넣는 reader (전체 목록을 만들지 않음).
+    재시도로 다시 불리면 이미 보낸 배치가 있을 때 RESTART를 먼저 보낸다. 성공 시 True.
+    """
+    sent = False
+
+    async def put(batch: List[Dict[str, Any]]) -> None:
+        nonlocal sent
+        await out.put(batch)
+        sent = True
+
+    async def read(r: httpx.Response, law_name: str) -> bool | None:
+        nonlocal sent
+        if sent:
+            await out.put(RESTART)
+            sent = False
+        parser = ArticleStreamParser()
+        batch: List[Dict[str, Any]] = []
+        try:
+            async for chunk in r.aiter_bytes():
+                batch.extend(parser.feed(chunk))
+                while len(batch) >= batch_size:
+                    await put(batch[:batch_size])
+                    batch = batch[batch_size:]
+            batch.extend(parser.close())
+        except ijson.JSONError as e:
+            print(f"❌ JSON parse error for {law_name}: {e}")
+            return None
+        if batch:
+            await put(batch)
+        return True
+
+    return read
+
+async def _get_with_retry(
+    client: httpx.AsyncClient,
+    oc: str,
+    law_name: str,
+    bucket: TokenBucket,
+    reader: Callable[[httpx.Response, str], Awaitable[Any]],
+    retries: int,
+    backoff_base: float,
+    backoff_cap: float,
+    sleep: Callable[[float], Awaitable[None]],
+) -> Any:
+    """현행법령(target=eflaw) 요청 + 재시도. 200이면 reader(response)로 본문을 스트리밍해 읽음."""
+    params = {"OC": oc, "target": "eflaw", "LM": law_name, "type": "JSON"}
+    for attempt in range(retries + 1):
+        await bucket.acquire()
+        delay: Optional[float] = None
+        try:
+            async with client.stream("GET", OPENAPI_BASE, params=params) as r:
+                if r.status_code == 200:
+                    return await reader(r, law_name)
+                if r.status_code != 429 and r.status_code < 500:
+                    print(f"❌ HTTP {r.status_code} for {law_name}")
+                    return None
+                if attempt >= retries:
+                    print(f"❌ HTTP {r.status_code} for {law_name} (retries exhausted)")
+                    return None
+                if r.status_code == 429:
+                    delay = _retry_after(r)
+        except httpx.TransportError as e:
+            if attempt >= retries:
+                print(f"❌ network error for {law_name}: {e!r}")
+                return None
+        await sleep(delay if delay is not None else _backoff_delay(attempt, backoff_base, backoff_cap))
+    return None
+
+async def fetch_law_json(
+    client: httpx.AsyncClient,
+    oc: str,
+    law_name: str,
+    bucket: TokenBucket,
+    retries: int = 3,
+    backoff_base: float = 0.5,
+    backoff_cap: float = 10.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> Dict[str, Any] | None:
+    """현행법령 JSON 전체(dict) 1건. 재시도 소진 또는 파싱 실패 시 None."""
+    return await _get_with_retry(client, oc, law_name, bucket, _read_json, retries, backoff_base, backoff_cap, sleep)
+
+async def fetch_law_articles(
+    client: httpx.AsyncClient,
+    oc: str,
+    law_name: str,
+    bucket: TokenBucket,
+    retries: int = 3,
+    backoff_base: float = 0.5,
+    backoff_cap: float = 10.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> List[Dict[str, Any]] | None:
+    """
+    현행법령 조문 레코드 목록. ijson이 있으면 응답을 스트리밍 파싱(전체 dict를 만들지 않음),
+    없으면 전체 JSON 파싱 후 추출.
+    """
+    if ijson is None:
+        payload = await fetch_law_json(client, oc, law_name, bucket, retries, backoff_base, backoff_cap, sleep)
+        return list(iter_articles(payload)) if payload else None
+    return await _get_with_retry(client, oc, law_name, bucket, _read_articles, retries, backoff_base, backoff_cap, sleep)
+
+async def stream_law_articles(
+    client: httpx.AsyncClient,
+    oc: str,
+    law_name: str,
+    bucket: TokenBucket,
+    out: "asyncio.Queue",
+    batch_size: int = BATCH_SIZE,
+    retries: int = 3,
+    backoff_base: float = 0.5,
+    backoff_cap: float = 10.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> bool:
+    """
+    현행법령 조문을 batch_size개씩 out에 넣음 (재시도 시 RESTART 후 처음부터). 성공 여부 반환.
+    ijson이 없으면 전체 JSON 파싱 후 나눠서 넣음.
+    """
+    if ijson is None:
+        payload = await fetch_law_json(client, oc, law_name, bucket, retries, backoff_base, backoff_cap, sleep)
+        if not payload:
+            return False
+        batch: List[Dict[str, Any]] = []
+        for a in iter_articles(payload):
+            batch.append(a)
+            if len(batch) >= batch_size:
+                await out.put(batch)
+                batch = []
+        if batch:
+            await out.put(batch)
+        return True
+    reader = _batch_reader(out, batch_size)
+    ok = await _get_with_retry(client, oc, law_name, bucket, reader, retries, backoff_base, backoff_cap, sleep)
+    return bool(ok)
+
+async def read_law_batches(batches: "asyncio.Queue") -> List[Dict[str, Any]] | None:
+    """법령 배치 큐 → 조문 전체 목록 (실패면 None). 테스트/소규모 용"""
+    articles: List[Dict[str, Any]] = []
+    while True:
+        item = await batches.get()
+        if item is DONE:
+            return articles
+        if item is None:
+            return None
+        if item is RESTART:
+            articles = []
+            continue
+        articles.extend(item)
+
+async def fetch_laws_to_queue(
+    oc: str,
+    names: Iterable[str],
+    queue: "asyncio.Queue",
+    concurrency: int = 4,
+    rate: float = 2.0,
+    retries: int = 3,
+    transport: httpx.AsyncBaseTransport | None = None,
+    timeout: float = 20.0,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    names를 동시에(최대 concurrency) 가져온다. 법령마다 수집을 시작할 때 (name, 배치 큐)를 queue에 넣고,
+    모두 끝나면(예외로 끝나도) DONE을 넣는다. 법령별 오류는 그 법령의 실패(None)로 처리.
+    배치 큐에는 조문 배치(list, batch_size개 이하)가 차례로 들어오고 끝은 DONE(성공) 또는 None(실패),
+    재시도로 처음부터 다시 받을 때는 중간에 RESTART가 온다.
+    배치 큐는 BATCH_QUEUE_SIZE로 제한 → 적재가 밀리면 해당 응답 읽기도 멈춤(backpressure).
+    """
+    bucket = TokenBucket(rate=rate, capacity=max(1, concurrency))
+    sem = asyncio.Semaphore(max(1, concurrency))
+    limits = httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency))
+
+    async def one(client: httpx.AsyncClient, name: str) -> None:
+        async with sem:
+            batches: asyncio.Queue = asyncio.Queue(maxsize=BATCH_QUEUE_SIZE)
+            await queue.put((name, batches))
+            ok = False
+            try:
+                ok = await stream_law_articles(client, oc, name, bucket, batches, batch_size, retries=retries)
+            except Exception as e:
+                # 예상 못 한 오류도 그 법령만 실패로 (나머지 법령 수집은 계속)
+                print(f"❌ fetch error for {name}: {e!r}")
+            finally:
+                # 받는 쪽이 영원히 기다리지 않게 끝/실패 표시
+                await batches.put(DONE if ok else None)
+
+    try:
+        async with httpx.AsyncClient(transport=transport, timeout=timeout, limits=limits) as client:
+            await asyncio.gather(*(one(client, n) for n in names))
+    finally:
+        # 클라이언트 생성 실패 등으로 끝나도 DONE → 받는 쪽 루프 종료 (예외는 태스크에 남음)
+        await queue.put(DONE)
@@ -0,0 +1,61 @@
+# worklaw-backend/scripts/train_json_dict.py
+import argparse
+import random
+from typing import Any, List
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from database.connection import SessionLocal
+from database.types import JSONCodec, dict_id, train_dictionary
+from models.knowledge_core import StagingRaw
+from models.law import LawArticle, LawArticleVersion
+
+"""
+압축 JSON 공유 사전 학습 (database/types.py 참고)
+- law_article_version.raw_json / law_article.current_json / staging_raw.payload 에서 무작위 표본 추출
+- 사전 파일을 쓰고, 같은 표본으로 사전 없음/있음 압축 크기를 비교해 출력
+- 적용: JSON_COMPRESSION_DICT=<파일> 설정 후 재시작. 이미 저장된 값은 기록된 사전 id로 읽으므로
+  사전을 바꾸면 이전 사전으로 압축된 행은 읽을 수 없다 → 바꾸기 전 마이그레이션을 downgrade/upgrade 하거나
+  처음 한 번만 학습해 고정해서 쓴다
+
+실행:
+  python -m scripts.train_json_dict --out data/json.dict --samples 2000 --size 16384
+"""
+
+def _sample(db: Session, column, n: int) -> List[Any]:
+    rows = db.execute(select(column).where(column.is_not(None)).order_by(func.random()).limit(n)).scalars()
+    return [v for v in rows if v is not None]
+
+def train(out: str, samples: int, size: int) -> None:
+    db: Session = SessionLocal()
+    try:
+        values = (
+            _sample(db, LawArticleVersion.raw_json, samples)
+            + _sample(db, LawArticle.current_json, samples // 2)
+            + _sample(db, StagingRaw.payload, samples // 2)
+        )
+    finally:
+        db.close()
+    if not values:
+        raise SystemExit("표본이 없습니다. 먼저 법령/ETL 데이터를 적재하세요.")
+    random.shuffle(values)
+
+    data = train_dictionary(values, size=size)
+    with open(out, "wb") as f:
+        f.write(data)
+
+    plain = JSONCodec(method="zlib", min_bytes=0)
+    with_dict = JSONCodec(method="zlib", dictionary=data, min_bytes=0)
+    raw = sum(len(plain.encode(v)) for v in values)
+    dicted = sum(len(with_dict.encode(v)) for v in values)
+    print(f"사전 {out}: {len(data)} bytes, id={dict_id(data).hex()}, 표본 {len(values)}개")
+    print(f"zlib {raw} bytes → zlib+사전 {dicted} bytes ({dicted / raw:.1%})")
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description="압축 JSON 공유 사전 학습")
+    p.add_argument("--out", default="json.dict")
+    p.add_argument("--samples", type=int, default=2000)
+    p.add_argument("--size", type=int, default=16 * 1024, help="사전 크기 (zlib은 32KB 이하)")
+    args = p.parse_args()
+    train(args.out, args.samples, args.size)
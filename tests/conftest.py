@@ -31,7 +31,7 @@ os.environ["JWT_SECRET"] = "test-secret"
 os.environ["JWT_EXPIRE_MIN"] = "60"
 
 # ---- 3) 이제 애플리케이션 모듈들을 import ----
-from database.connection import Base, engine, SessionLocal  # noqa: E402
+from database.connection import Base, engine, read_engine, SessionLocal  # noqa: E402
 from fastapi import FastAPI  # noqa: E402
 from main import app as fastapi_app  # noqa: E402
 
@@ -48,14 +48,20 @@ def event_loop():
     loop.close()
 
 
+def _remove_test_db():
+    # WAL 모드의 -wal/-shm 파일까지 함께 제거
+    for path in ("test_worklaw.db", "test_worklaw.db-wal", "test_worklaw.db-shm"):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except Exception:
+            pass
+
+
 @pytest.fixture(scope="session", autouse=True)
 def _prepare_db():
     """테스트 세션 시작 시 깨끗한 테스트 DB를 만들고, 끝에 제거."""
-    try:
-        if os.path.exists("test_worklaw.db"):
-            os.remove("test_worklaw.db")
-    except Exception:
-        pass
+    _remove_test_db()
 
     # ORM 스키마 생성
     Base.metadata.create_all(bind=engine)
@@ -63,11 +69,9 @@ def _prepare_db():
     yield
 
     # 종료 시 테스트 DB 제거
-    try:
-        if os.path.exists("test_worklaw.db"):
-            os.remove("test_worklaw.db")
-    except Exception:
-        pass
+    read_engine.dispose()
+    engine.dispose()
+    _remove_test_db()
 
 
 @pytest.fixture
@@ -84,3 +88,25 @@ def db():
         yield _db
     finally:
         _db.close()
+
+
+@pytest.fixture
+def admin_headers() -> dict:
+    """관리자 JWT (role=admin) Authorization 헤더"""
+    from utils.security import create_access_token
+    return {"Authorization": f"Bearer {create_access_token(sub='admin', role='admin')}"}
+
+
+@pytest.fixture
+def wait_sync_job(admin_headers):
+    """/admin/sync/* 로 등록한 백그라운드 작업이 끝날 때까지 폴링"""
+    async def _wait(ac, job_id: str, timeout: float = 10.0) -> dict:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            res = await ac.get(f"/admin/sync/jobs/{job_id}", headers=admin_headers)
+            job = res.json()
+            if job["status"] in ("success", "fail") or loop.time() > deadline:
+                return job
+            await asyncio.sleep(0.05)
+    return _wait
@@ -0,0 +1,39 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from database import async_db
+from models.knowledge_core import PolicyBulletin
+
+
+def test_async_url_maps_drivers():
+    assert async_db.async_url("sqlite:///./x.db") == "sqlite+aiosqlite:///./x.db"
+    assert async_db.async_url("postgresql://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert async_db.async_url("postgresql+psycopg://u@h/db") == "postgresql+psycopg://u@h/db"
+
+
+@pytest.mark.asyncio
+async def test_public_reads_through_async_session(app, db, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setenv("DB_ASYNC", "true")
+    db.add(PolicyBulletin(id="ASYNC-1", title="비동기 조회"))
+    db.commit()
+
+    used = []
+    original = async_db.AsyncReadDB.run
+
+    async def spy(self, fn, *args, **kw):
+        used.append(fn.__name__)
+        return await original(self, fn, *args, **kw)
+
+    monkeypatch.setattr(async_db.AsyncReadDB, "run", spy)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/knowledge/policy_bulletins/ASYNC-1")
+        assert res.status_code == 200
+        assert res.json()["title"] == "비동기 조회"
+        laws = await ac.get("/law/list")
+        assert laws.status_code == 200
+
+    assert used == ["_detail", "_list_laws"]
+    assert async_db.get_async_read_engine().dialect.driver == "aiosqlite"
+    await async_db.dispose_async_engine()
@@ -0,0 +1,41 @@
+from sqlalchemy import event
+
+from database.bulk import bulk_upsert
+from database.connection import engine
+from models.knowledge_core import Holiday, LawVersion
+
+
+def test_bulk_upsert_counts_and_updates(db):
+    rows = [{"date": f"2050-01-{d:02d}", "name": f"휴일{d}", "type": "public", "is_public": True} for d in range(1, 6)]
+    assert bulk_upsert(db, Holiday, rows) == {"inserted": 5, "updated": 0}
+    db.commit()
+
+    rows[0]["name"] = "바뀐휴일"
+    rows.append({"date": "2050-02-01", "name": "새휴일", "type": "public", "is_public": True})
+    assert bulk_upsert(db, Holiday, rows) == {"inserted": 1, "updated": 5}
+    db.commit()
+    db.expire_all()
+    assert db.get(Holiday, "2050-01-01").name == "바뀐휴일"
+
+
+def test_bulk_upsert_chunks_into_few_statements(db):
+    rows = [
+        {"id": f"BULK_{i}", "law_id": "BULK", "version_no": str(i), "effective_from": None, "effective_to": None, "source_ref": None}
+        for i in range(1000)
+    ]
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        counts = bulk_upsert(db, LawVersion, rows)
+        db.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert counts == {"inserted": 1000, "updated": 0}
+    # 6컬럼 → 청크당 166행 → 7청크 (청크당 SELECT 1 + INSERT 1)
+    assert statements.count("INSERT") == 7
+    assert db.query(LawVersion).filter(LawVersion.law_id == "BULK").count() == 1000
@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from models.knowledge_core import Holiday
+from utils import business_calendar
+from utils.business_calendar import BusinessCalendar
+
+# 2025년 실제 공휴일 일부 (대체공휴일 행 없음 → 규칙으로 계산)
+ROWS_2025 = [
+    ("2025-01-28", "설날 전날", True), ("2025-01-29", "설날", True), ("2025-01-30", "설날 다음날", True),
+    ("2025-03-01", "삼일절", True), ("2025-05-05", "어린이날", True),
+    ("2025-10-05", "추석 전날", True), ("2025-10-06", "추석", True), ("2025-10-07", "추석 다음날", True),
+    ("2025-10-03", "개천절", True), ("2025-10-09", "한글날", True), ("2025-02-28", "예시 휴일", False),
+]
+
+
+def test_substitute_holidays_and_weekends():
+    cal = BusinessCalendar(ROWS_2025, 0)
+    # 삼일절(토) → 3/3(월), 추석 전날(일) → 10/8(수)
+    assert cal.describe(date(2025, 3, 3))["holiday_name"] == "대체공휴일(삼일절)"
+    assert cal.describe(date(2025, 10, 8))["is_substitute"] is True
+    assert cal.is_business_day(date(2025, 2, 28))  # is_public=False 는 근무일
+    assert not cal.is_business_day(date(2025, 3, 8))  # 토요일
+    # 10월: 평일 23 - (3,6,7,8,9) = 18
+    assert cal.count_business_days(date(2025, 10, 1), date(2025, 10, 31)) == 18
+
+
+def test_bitmap_matches_day_by_day_scan():
+    cal = BusinessCalendar(ROWS_2025, 0)
+    start = date(2024, 11, 1)
+    days = [start + timedelta(days=k) for k in range(500)]
+    flags = [cal.is_business_day(d) for d in days]
+    for a in range(0, 500, 37):
+        for b in range(a, 500, 53):
+            assert cal.count_business_days(days[a], days[b]) == sum(flags[a:b + 1])
+    for n in (1, 5, 64, 130, -1, -64, -200):
+        r = cal.add_business_days(date(2025, 6, 15), n)
+        assert cal.is_business_day(r)
+        lo, hi = (date(2025, 6, 16), r) if n > 0 else (r, date(2025, 6, 14))
+        assert cal.count_business_days(lo, hi) == abs(n)
+    # 0: 근무일이면 그대로, 아니면 다음 근무일
+    assert cal.add_business_days(date(2025, 1, 27), 0) == date(2025, 1, 27)
+    assert cal.add_business_days(date(2025, 1, 25), 0) == date(2025, 1, 27)
+    assert cal.add_business_days(date(2025, 1, 27), 1) == date(2025, 1, 31)
+
+
+@pytest.mark.asyncio
+async def test_calendar_endpoints(app, db):
+    db.add_all([Holiday(date=d, name=n, type="public", is_public=p) for d, n, p in ROWS_2025 if d.startswith("2025-10")])
+    db.commit()
+    business_calendar.reload(db)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            count = await ac.get("/calendar/business-days", params={"start": "2025-10-01", "end": "2025-10-31"})
+            shift = await ac.get("/calendar/add-business-days", params={"start": "2025-10-02", "days": 1})
+            day = await ac.get("/calendar/days/2025-10-08")
+            bad = await ac.get("/calendar/business-days", params={"start": "2025-10-31", "end": "2025-10-01"})
+    finally:
+        db.query(Holiday).filter(Holiday.date.like("2025-10-%")).delete(synchronize_session=False)
+        db.commit()
+        business_calendar.invalidate()
+
+    body = count.json()
+    assert body["business_days"] == 18 and body["non_working_days"] == 13
+    assert body["missing_holiday_years"] == []
+    assert shift.json()["result"] == "2025-10-10"
+    assert day.json()["is_substitute"] is True and day.json()["is_business_day"] is False
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_request_uses_single_calendar_snapshot(monkeypatch):
+    import threading
+
+    from routers import business_days
+
+    loop_thread = threading.get_ident()
+    built = BusinessCalendar([], 0.0)
+    calls = []
+
+    def _reload():
+        calls.append(threading.get_ident())
+        return built
+
+    monkeypatch.setattr(business_calendar, "reload", _reload)
+    business_calendar.invalidate()
+    # 없거나 오래되면 스레드풀에서 빌드하고, 빌드한 그 객체를 반환
+    assert business_calendar.current() is None
+    assert await business_days._calendar() is built
+    assert calls and calls[0] != loop_thread
+
+    # 최신 달력이면 한 번 읽은 객체 그대로 (다시 빌드하지 않음)
+    fresh = BusinessCalendar([], 1e18)
+    monkeypatch.setattr(business_calendar, "_calendar", fresh)
+    assert await business_days._calendar() is fresh
+    assert business_calendar.get_calendar(max_age=0) is fresh
+    assert len(calls) == 1
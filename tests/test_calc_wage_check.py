@@ -0,0 +1,110 @@
+import json
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from models.wage import MinimumWage
+from utils import wage_table
+
+
+@pytest.fixture
+def wage_2071(db):
+    db.add(MinimumWage(year=2071, amount=10000, unit="KRW/hour"))
+    db.commit()
+    wage_table.reload(db)
+    yield
+    db.query(MinimumWage).filter(MinimumWage.year == 2071).delete()
+    db.commit()
+    wage_table.reload(db)
+
+
+@pytest.mark.asyncio
+async def test_json_batch_flags_violations(app, wage_2071):
+    rows = [
+        {"year": 2071, "monthly_pay": 2_090_000},                                   # 정확히 최저 (209h)
+        {"year": 2071, "monthly_pay": 1_800_000, "allowances": 100_000},            # 미달
+        {"year": 2071, "monthly_pay": 1_000_000, "contracted_hours": 100},          # 시간 짧음 → 준수
+        {"year": 1990, "monthly_pay": 1_000_000},                                   # 없는 연도
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post("/calc/minimum-wage-check", json={"rows": rows})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert res.headers["x-violations"] == "1" and res.headers["x-errors"] == "1"
+
+    out = [json.loads(line) for line in res.text.splitlines()]
+    assert [o["violation"] for o in out] == [False, True, False, None]
+    assert out[0]["monthly_209h"] == 2_090_000
+    assert out[1]["hourly_equivalent"] == pytest.approx(9090.91)
+    assert out[1]["shortfall"] == 190_000
+    assert out[2]["required_monthly"] == 1_000_000
+    assert out[3]["error"] == "unknown year"
+
+
+@pytest.mark.asyncio
+async def test_csv_upload_returns_csv(app, wage_2071):
+    csv_body = "year,monthly_pay,contracted_hours,allowances\n2071,2000000,209,0\n2071,2200000,,\n"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post(
+            "/calc/minimum-wage-check",
+            params={"format": "csv"},
+            files={"file": ("rows.csv", csv_body, "text/csv")},
+        )
+        bad = await ac.post("/calc/minimum-wage-check", json={"rows": [{"monthly_pay": 1}]})
+    assert res.status_code == 200
+    lines = res.text.strip().splitlines()
+    assert lines[0].startswith("index,year,monthly_pay")
+    assert len(lines) == 3
+    assert res.headers["x-violations"] == "1"
+    assert bad.status_code == 422
+
+
+@pytest.fixture
+def wage_2072(db):
+    db.add(MinimumWage(year=2072, amount=10030, unit="KRW/hour"))
+    db.commit()
+    wage_table.reload(db)
+    yield
+    db.query(MinimumWage).filter(MinimumWage.year == 2072).delete()
+    db.commit()
+    wage_table.reload(db)
+
+
+@pytest.mark.asyncio
+async def test_violation_matches_shortfall_and_input_validation(app, wage_2072):
+    rows = [
+        {"year": 2072, "monthly_pay": 2_096_269},                    # 시급 10029.995 → 반올림 10030 이지만 1원 미달
+        {"year": 2072, "monthly_pay": 2_096_270},
+        {"year": 2072, "monthly_pay": 2_096_270, "contracted_hours": 0},
+    ]
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post("/calc/minimum-wage-check", json=rows)
+        frac_year = await ac.post("/calc/minimum-wage-check", json=[{"year": 2072.5, "monthly_pay": 1}])
+    out = [json.loads(line) for line in res.text.splitlines()]
+    assert (out[0]["shortfall"], out[0]["violation"]) == (1, True)
+    assert (out[1]["shortfall"], out[1]["violation"]) == (0, False)
+    # 0 시간은 209h로 바뀌지 않고 CSV와 같은 오류
+    assert out[2]["error"] == "contracted_hours must be > 0" and out[2]["contracted_hours"] == 0
+    assert frac_year.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_csv_non_finite_rows_and_cp949(app, wage_2072):
+    csv_body = "year,monthly_pay,contracted_hours\n2072,nan,209\n2072,2096270,inf\n2072,2096270,209\n"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post("/calc/minimum-wage-check", content=csv_body, headers={"Content-Type": "text/csv"})
+        cp949 = await ac.post(
+            "/calc/minimum-wage-check",
+            files={"file": ("급여.csv", "year,monthly_pay,비고\n2072,2096270,정상\n".encode("cp949"), "text/csv")},
+        )
+    assert res.status_code == 200
+    out = [json.loads(line) for line in res.text.splitlines()]  # NaN 없이 유효한 JSON
+    assert res.headers["x-errors"] == "2"
+    assert out[0]["monthly_pay"] is None and out[0]["violation"] is None and "finite" in out[0]["error"]
+    assert out[1]["contracted_hours"] is None and out[1]["error"]
+    assert out[2]["violation"] is False
+    assert cp949.status_code == 200 and cp949.headers["x-rows"] == "1"
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import text
+
+from database import types
+from database.types import MAGIC, JSONCodec, train_dictionary
+from models.knowledge_core import StagingRaw
+from models.law import LawArticle, LawArticleVersion
+from scripts.etl.staging import stage_records
+from scripts.ingest_labor_laws import upsert_law, upsert_articles
+
+DOC = {"조문번호": "1", "조문내용": "제1조(목적) 이 법은 근로조건의 기준을 정함으로써 " * 5, "항": [{"항번호": "①"}]}
+
+
+def test_codec_round_trip_and_small_values_uncompressed():
+    codec = JSONCodec(method="zlib")
+    blob = codec.encode(DOC)
+    assert blob[:3] == MAGIC + b"Z"
+    assert len(blob) < len(str(DOC).encode("utf-8"))
+    assert codec.decode(blob) == DOC
+
+    small = codec.encode({"a": 1})
+    assert small == MAGIC + b'N{"a":1}'
+    assert codec.decode(small) == {"a": 1}
+    assert codec.decode(None) is None
+
+
+def test_codec_reads_legacy_plain_json():
+    codec = JSONCodec()
+    assert codec.decode('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert codec.decode(b'{"a": "\xea\xb0\x80"}') == {"a": "가"}
+    assert codec.decode("null") is None
+
+
+def test_dictionary_round_trip_and_mismatch():
+    samples = [dict(DOC, 조문번호=str(i)) for i in range(50)]
+    data = train_dictionary(samples, size=4096)
+    assert 0 < len(data) <= 4096
+
+    plain, with_dict = JSONCodec(min_bytes=0), JSONCodec(dictionary=data, min_bytes=0)
+    blob = with_dict.encode(samples[7])
+    assert blob[:3] == MAGIC + b"z"
+    assert len(blob) < len(plain.encode(samples[7]))
+    assert with_dict.decode(blob) == samples[7]
+    # 사전 없이(또는 다른 사전으로) 읽으면 조용히 깨지지 않고 오류
+    with pytest.raises(ValueError, match="dictionary"):
+        plain.decode(blob)
+    with pytest.raises(ValueError, match="dictionary"):
+        JSONCodec(dictionary=b"other" * 10).decode(blob)
+
+
+def test_orm_columns_store_compressed_and_read_legacy_rows(db):
+    law = upsert_law(db, "압축저장테스트법")
+    upsert_articles(db, law, [{"article_no": "제1조", "title": "(목적)", "text": "본문", "raw": DOC}])
+    article = db.query(LawArticle).filter(LawArticle.law_id_fk == law.id).one()
+    version = db.query(LawArticleVersion).filter(LawArticleVersion.article_id_fk == article.id).one()
+    assert article.current_json == DOC and version.raw_json == DOC
+
+    stored = db.execute(text("SELECT current_json FROM law_article WHERE id = :i"), {"i": article.id}).scalar()
+    assert stored[:3] == MAGIC + b"Z"
+
+    # 마이그레이션 전 평문 JSON 행도 그대로 읽힘
+    db.execute(text("UPDATE law_article_version SET raw_json = :v WHERE id = :i"),
+               {"v": '{"legacy": true}', "i": version.id})
+    db.commit()
+    db.expire_all()
+    assert db.get(LawArticleVersion, version.id).raw_json == {"legacy": True}
+
+    db.delete(db.get(LawArticleVersion, version.id))
+    db.delete(article)
+    db.delete(law)
+    db.commit()
+
+
+def test_staging_payload_compressed(db):
+    rows = [{"id": "x", "body": "근로기준법 시행령 " * 20}]
+    changed, _skipped, _sum = stage_records(db, "compress_test", rows, lambda r: r["id"])
+    db.commit()
+    assert changed == rows
+    db.expire_all()
+    row = db.query(StagingRaw).filter(StagingRaw.source_key == "compress_test").one()
+    assert row.payload == rows[0]
+    stored = db.execute(text("SELECT payload FROM staging_raw WHERE id = :i"), {"i": row.id}).scalar()
+    assert stored[:3] == MAGIC + b"Z"
+
+
+def test_zstd_setting_falls_back_without_zstandard(monkeypatch):
+    monkeypatch.setattr(types, "zstandard", None)
+    codec = JSONCodec(method="zstd")
+    assert codec.method == "zlib"
+    assert codec.decode(codec.encode(DOC)) == DOC
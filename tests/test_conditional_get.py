@@ -0,0 +1,87 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from utils.cache import knowledge_cache
+from models.knowledge_core import PolicyBulletin
+from models.law import Law, LawArticle
+
+
+@pytest.mark.asyncio
+async def test_knowledge_etag_304_and_change(app, db, wait_sync_job, admin_headers):
+    knowledge_cache.clear()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/knowledge/policy_bulletins")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('"')
+
+        again = await ac.get("/knowledge/policy_bulletins", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+
+        # 다른 연도 URL은 다른 ETag
+        h1 = await ac.get("/knowledge/holidays/2040")
+        h2 = await ac.get("/knowledge/holidays/2041")
+        assert h1.headers["etag"] != h2.headers["etag"]
+
+        # 동기화(무효화) 후 내용이 바뀌면 ETag도 바뀜
+        db.add(PolicyBulletin(id="PB-ETAG-1", title="ETag 테스트"))
+        db.commit()
+        sync = await ac.post("/admin/sync/moel_notice", headers=admin_headers)
+        await wait_sync_job(ac, sync.json()["job_id"])
+        changed = await ac.get("/knowledge/policy_bulletins", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_law_articles_if_modified_since(app, db):
+    law = Law(name="조건부GET테스트법")
+    db.add(law)
+    db.commit()
+    db.add(LawArticle(law_id_fk=law.id, article_no="제1조", current_text="목적"))
+    db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get(
+            "/law/articles",
+            params={"law_name": "조건부GET테스트법"},
+            headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"},
+        )
+        assert res.status_code == 304
+        assert "last-modified" in res.headers
+
+    db.delete(law)
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_knowledge_etag_changes_on_in_place_update(app, db):
+    from sqlalchemy import text
+    from email.utils import format_datetime
+    from datetime import datetime, timezone
+
+    db.add(PolicyBulletin(id="PB-INPLACE-1", title="수정 전"))
+    db.commit()
+    knowledge_cache.clear()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/knowledge/policy_bulletins")
+        etag = first.headers["etag"]
+
+        # /admin/sync 밖의 제자리 UPDATE: 행 수/동기화 기록은 그대로
+        db.execute(text("UPDATE policy_bulletins SET title = '수정 후' WHERE id = 'PB-INPLACE-1'"))
+        db.commit()
+        knowledge_cache.clear()  # TTL 만료와 같은 상황
+
+        after = await ac.get("/knowledge/policy_bulletins", headers={"If-None-Match": etag})
+        assert after.status_code == 200
+        assert after.headers["etag"] != etag
+        assert "수정 후" in after.text
+        # If-Modified-Since만 보내는 클라이언트도 변경을 받음
+        since = format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc), usegmt=True)
+        ims = await ac.get("/knowledge/policy_bulletins", headers={"If-Modified-Since": since})
+        assert ims.status_code == 200 and "last-modified" in ims.headers
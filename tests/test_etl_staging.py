@@ -0,0 +1,31 @@
+from models.knowledge_core import StagingRaw
+from scripts.etl import holiday_api
+from scripts.etl.staging import stage_records
+
+
+def test_stage_records_returns_only_new_or_changed(db):
+    rows = [{"id": "a", "v": 1}, {"id": "b", "v": 2}]
+    changed, skipped, first_sum = stage_records(db, "staging_test", rows, lambda r: r["id"])
+    db.commit()
+    assert [r["id"] for r in changed] == ["a", "b"] and skipped == 0
+
+    changed, skipped, same_sum = stage_records(db, "staging_test", rows, lambda r: r["id"])
+    db.commit()
+    assert changed == [] and skipped == 2
+    assert same_sum == first_sum
+
+    rows2 = [{"id": "a", "v": 1}, {"id": "b", "v": 3}, {"id": "c", "v": 4}]
+    changed, skipped, new_sum = stage_records(db, "staging_test", rows2, lambda r: r["id"])
+    db.commit()
+    assert sorted(r["id"] for r in changed) == ["b", "c"] and skipped == 1
+    assert new_sum != first_sum
+    staged = db.query(StagingRaw).filter(StagingRaw.source_key == "staging_test").count()
+    assert staged == 3
+
+
+def test_repeat_holiday_sync_skips_everything(db):
+    holiday_api.run(db)
+    upserted, skipped, checksum, log = holiday_api.run(db)
+    assert upserted == 0
+    assert skipped > 0
+    assert "skipped=" in log
@@ -0,0 +1,158 @@
+from sqlalchemy import event
+
+from models.law import LawArticle, LawArticleVersion
+from scripts.ingest_labor_laws import upsert_law, upsert_articles
+
+
+def _articles(texts):
+    return [
+        {"article_no": f"제{i}조", "title": f"(조문{i})", "text": t, "raw": {"조문번호": i, "시행일자": "20250101"}}
+        for i, t in enumerate(texts, start=1)
+    ]
+
+
+def test_upsert_articles_batched_single_transaction(db):
+    from database.connection import engine
+
+    commits = []
+
+    def _on_commit(conn):
+        commits.append(1)
+
+    event.listen(engine, "commit", _on_commit)
+    try:
+        law = upsert_law(db, "배치적재테스트법")
+        stats = upsert_articles(db, law, _articles(["가", "나", "다"]))
+    finally:
+        event.remove(engine, "commit", _on_commit)
+    assert (stats["new"], stats["changed"], stats["unchanged"]) == (3, 0, 0)
+    assert len(commits) == 1  # 법령 + 조문 + 버전이 한 트랜잭션
+
+    ids = {a.article_no: a.id for a in db.query(LawArticle).filter(LawArticle.law_id_fk == law.id)}
+    stats = upsert_articles(db, law, _articles(["가", "나(개정)", "다", "라"]))
+    assert (stats["new"], stats["changed"], stats["unchanged"]) == (1, 1, 2)
+    assert stats["versions"] == 2  # 동일 조문은 버전 행을 만들지 않음
+
+    db.expire_all()
+    rows = {a.article_no: a for a in db.query(LawArticle).filter(LawArticle.law_id_fk == law.id)}
+    assert rows["제2조"].current_text == "나(개정)"
+    assert rows["제1조"].id == ids["제1조"]  # ON CONFLICT 갱신은 id 유지
+    version_counts = {
+        no: db.query(LawArticleVersion).filter(LawArticleVersion.article_id_fk == a.id).count()
+        for no, a in rows.items()
+    }
+    assert version_counts == {"제1조": 1, "제2조": 2, "제3조": 1, "제4조": 1}
+
+    # 공백만 다른 재적재 → 변경 없음
+    stats = upsert_articles(db, law, _articles(["가 ", "나(개정)", "다", "라"]))
+    assert (stats["new"], stats["changed"], stats["unchanged"]) == (0, 0, 4)
+
+
+def test_ingest_async_pipeline_with_stub_transport(db):
+    import asyncio
+    import httpx
+    from models.law import Law
+    from scripts.ingest_labor_laws import ingest_async
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.params["LM"]
+        if name == "없는법":
+            return httpx.Response(404)
+        body = {"law": {"조문": [{"조문번호": str(i), "조문내용": f"{name} {i}"} for i in range(1, 4)]}}
+        return httpx.Response(200, json=body)
+
+    result = asyncio.run(ingest_async(
+        "oc", ["파이프라인법A", "파이프라인법B", "없는법"], db,
+        concurrency=2, rate=1000.0, transport=httpx.MockTransport(handler),
+    ))
+    assert result["rows"] == 6
+    assert result["summary"]["new"] == 6
+    assert result["failed"] == ["없는법"]
+    assert db.query(Law).filter(Law.name.in_(["파이프라인법A", "파이프라인법B"])).count() == 2
+
+
+def test_store_articles_applies_batches_in_one_transaction(db):
+    import asyncio
+    from models.law import Law
+    from scripts.ingest_labor_laws import _store_articles
+    from scripts.law_fetch import DONE, RESTART
+
+    def batch(nos, tag=""):
+        return [{"article_no": n, "title": None, "text": f"{n}{tag}", "raw": {"조문번호": n}} for n in nos]
+
+    async def feed(items):
+        q: asyncio.Queue = asyncio.Queue()
+        for it in items:
+            q.put_nowait(it)
+        return await _store_articles(db, "배치법", q)
+
+    engine = db.get_bind()
+    commits = []
+
+    def _on_commit(conn):
+        commits.append(1)
+
+    event.listen(engine, "commit", _on_commit)
+    try:
+        # 재시도(RESTART) 전에 받은 배치는 버리고, 이후 배치들만 한 트랜잭션으로
+        n, stats, _ = asyncio.run(feed([
+            batch(["1", "2"], "(끊김)"), RESTART, batch(["1", "2"]), batch(["3", "4"]), batch(["5"]), DONE,
+        ]))
+        failed = asyncio.run(feed([batch(["1"], "(실패)"), None]))
+    finally:
+        event.remove(engine, "commit", _on_commit)
+
+    assert len(commits) == 1
+    assert n == 5 and stats == {"new": 5, "changed": 0, "unchanged": 0, "versions": 5}
+    assert failed is None
+    law = db.query(Law).filter(Law.name == "배치법").one()
+    texts = {a.article_no: a.current_text for a in db.query(LawArticle).filter(LawArticle.law_id_fk == law.id)}
+    assert texts == {"1": "1", "2": "2", "3": "3", "4": "4", "5": "5"}
+
+
+def test_ingest_async_surfaces_fetch_errors(db, monkeypatch):
+    import asyncio
+    import httpx
+    import pytest
+    from scripts import law_fetch
+    from scripts.ingest_labor_laws import ingest_async
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.params["LM"]
+        if name == "오류법":
+            raise RuntimeError("boom")  # 전송 오류가 아닌 예외 → 그 법령만 실패
+        return httpx.Response(200, json={"law": {"조문": [{"조문번호": "1", "조문내용": name}]}})
+
+    result = asyncio.run(ingest_async(
+        "oc", ["오류법", "정상법"], db, concurrency=2, rate=1000.0, transport=httpx.MockTransport(handler),
+    ))
+    assert result["failed"] == ["오류법"]
+    assert result["rows"] == 1
+
+    # 수집 단계 자체가 실패하면 삼키지 않고 올림
+    def broken_client(*a, **kw):
+        raise ValueError("bad client config")
+
+    monkeypatch.setattr(law_fetch.httpx, "AsyncClient", broken_client)
+    with pytest.raises(ValueError, match="bad client config"):
+        asyncio.run(ingest_async("oc", ["정상법"], db, transport=httpx.MockTransport(handler)))
+
+
+def test_upsert_articles_stays_under_sqlite_bind_limit(db):
+    law = upsert_law(db, "바인드한도법")
+    engine = db.get_bind()
+    params = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO LAW_ARTICLE ") and not executemany:
+            params.append(len(parameters))
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        stats = upsert_articles(db, law, _articles([f"본문 {i}" for i in range(300)]))
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert stats["new"] == 300
+    # 7컬럼 → 문장당 142행(994개) 이하 → 3문장
+    assert len(params) == 3 and max(params) <= 999
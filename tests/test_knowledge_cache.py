@@ -0,0 +1,70 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from utils.cache import TTLCache, knowledge_cache
+from models.knowledge_core import Holiday
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expiry_and_lru():
+    clock = _Clock()
+    c = TTLCache(maxsize=2, ttl=10, clock=clock)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1          # a가 최근 사용으로 이동
+    c.set("c", 3)                   # b 축출
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+
+    clock.now = 11
+    assert c.get("a") is None       # TTL 만료
+
+    c.set("holidays:2025", [1])
+    c.set("holidays:2026", [2])
+    assert c.invalidate_prefix("holidays:") == 2
+    assert len(c) == 0
+
+
+@pytest.mark.asyncio
+async def test_holidays_cached_until_sync_invalidates(app, db, wait_sync_job, admin_headers):
+    knowledge_cache.clear()
+    db.add(Holiday(date="2031-01-01", name="신정", type="public", is_public=True))
+    db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/knowledge/holidays/2031")
+        assert first.status_code == 200
+        assert [h["date"] for h in first.json()] == ["2031-01-01"]
+
+        # DB가 바뀌어도 무효화 전까지는 캐시 응답
+        db.add(Holiday(date="2031-03-01", name="삼일절", type="public", is_public=True))
+        db.commit()
+        cached = await ac.get("/knowledge/holidays/2031")
+        assert [h["date"] for h in cached.json()] == ["2031-01-01"]
+
+        sync = await ac.post("/admin/sync/holiday_api", headers=admin_headers)
+        assert sync.status_code == 202
+        job = await wait_sync_job(ac, sync.json()["job_id"])
+        assert job["status"] == "success"
+
+        fresh = await ac.get("/knowledge/holidays/2031")
+        assert [h["date"] for h in fresh.json()] == ["2031-01-01", "2031-03-01"]
+
+
+def test_schema_resolved_once_to_single_statement():
+    from database.connection import engine
+    from routers import knowledge_public
+
+    plans = knowledge_public.resolve_schema(engine)
+    assert plans["holidays"]["table"] == "holidays"
+    assert plans["minimum_wage"]["sql"].count("SELECT") == 1
+    summary = knowledge_public.schema_summary()
+    assert summary["interpretations"] == "admin_interpretations"
@@ -0,0 +1,84 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
+
+from database.bulk import bulk_upsert
+from database.connection import engine
+from models.knowledge_core import Holiday, PolicyBulletin
+from routers import knowledge_public
+from utils.cache import knowledge_cache
+from utils.dates import iso_date
+
+
+def _plan_details(sql: str, params: dict) -> str:
+    with engine.connect() as conn:
+        rows = conn.execute(text("EXPLAIN QUERY PLAN " + sql), params).all()
+    return " | ".join(r[-1] for r in rows)
+
+
+def test_iso_date_normalizes_free_form_strings():
+    assert iso_date("2025-1-5") == "2025-01-05"
+    assert iso_date("2025.10.03") == "2025-10-03"
+    assert iso_date("20250301") == "2025-03-01"
+    assert iso_date("2025-03-01T09:00:00") == "2025-03-01"
+    assert iso_date(None) == "" and iso_date("미정") == ""
+
+
+def test_iso_columns_filled_on_orm_and_bulk_writes(db):
+    db.add(Holiday(date="2044.5.5", name="어린이날"))
+    db.commit()
+    bulk_upsert(db, PolicyBulletin, [{"id": "ISO-1", "title": "t", "effective_date": "20440101"}])
+    db.commit()
+    try:
+        assert db.get(Holiday, "2044.5.5").date_iso == "2044-05-05"
+        assert db.get(PolicyBulletin, "ISO-1").effective_date_iso == "2044-01-01"
+        # 원본이 바뀌면 파생 컬럼도 따라감
+        bulk_upsert(db, PolicyBulletin, [{"id": "ISO-1", "title": "t", "effective_date": None}])
+        db.commit()
+        db.expire_all()
+        assert db.get(PolicyBulletin, "ISO-1").effective_date_iso == ""
+    finally:
+        db.query(Holiday).filter(Holiday.date == "2044.5.5").delete()
+        db.query(PolicyBulletin).filter(PolicyBulletin.id == "ISO-1").delete()
+        db.commit()
+
+
+def test_queries_use_iso_indexes():
+    plans = knowledge_public.resolve_schema(engine)
+
+    holidays = _plan_details(plans["holidays"]["sql"], {"start": "2025-01-01", "end": "2026-01-01", "prefix": "2025-%"})
+    assert "USING INDEX ix_holidays_date_iso" in holidays
+    assert "TEMP B-TREE" not in holidays  # ORDER BY도 인덱스 순서로
+
+    for name, index in (
+        ("policy_bulletins", "ix_policy_bulletins_effective_date_iso"),
+        ("interpretations", "ix_admin_interpretations_answered_at_iso"),
+    ):
+        spec = knowledge_public._RESOURCES[name]
+        fields = tuple(spec["columns"])
+        for with_cursor in (False, True):
+            stmt = knowledge_public._page_stmt(plans[name], spec, fields, with_cursor)
+            detail = _plan_details(stmt.text, {"c_sort": "2030-01-01", "c_key": "x", "limit": 10})
+            assert f"INDEX {index}" in detail, detail
+            assert "TEMP B-TREE" not in detail, detail
+
+
+@pytest.mark.asyncio
+async def test_holidays_by_year_matches_non_iso_rows(app, db):
+    knowledge_cache.clear()
+    db.add_all([
+        Holiday(date="2045.1.1", name="신정"),
+        Holiday(date="2045-03-01", name="삼일절"),
+        Holiday(date="2046-01-01", name="다음해"),
+    ])
+    db.commit()
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            res = await ac.get("/knowledge/holidays/2045")
+    finally:
+        db.query(Holiday).filter(Holiday.date.in_(["2045.1.1", "2045-03-01", "2046-01-01"])).delete()
+        db.commit()
+        knowledge_cache.clear()
+
+    assert [h["name"] for h in res.json()] == ["신정", "삼일절"]
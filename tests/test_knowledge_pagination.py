@@ -0,0 +1,59 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from utils.cache import knowledge_cache
+from models.knowledge_core import AdminInterpretation
+
+
+@pytest.mark.asyncio
+async def test_interpretations_keyset_pages_and_projection(app, db):
+    knowledge_cache.clear()
+    for i in range(5):
+        db.add(AdminInterpretation(
+            interp_id=f"PAGE-{i}",
+            title=f"질의 {i}",
+            answered_at=f"2030-01-0{i + 1}",
+            question="Q" * 1000,
+            answer="A" * 1000,
+        ))
+    db.add(AdminInterpretation(interp_id="PAGE-NULL", title="미회신", answered_at=None))
+    db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2, "fields": "answered_at"}
+            if cursor:
+                params["cursor"] = cursor
+            res = await ac.get("/knowledge/interpretations", params=params)
+            assert res.status_code == 200
+            for item in res.json():
+                assert set(item) == {"interp_id", "title", "answered_at"}  # 본문 컬럼 제외
+            seen += [i["interp_id"] for i in res.json() if i["interp_id"].startswith("PAGE-")]
+            cursor = res.headers.get("x-next-cursor")
+            if not cursor:
+                break
+
+        assert seen == ["PAGE-4", "PAGE-3", "PAGE-2", "PAGE-1", "PAGE-0", "PAGE-NULL"]
+
+        detail = await ac.get("/knowledge/interpretations/PAGE-2")
+        assert detail.status_code == 200
+        assert detail.json()["answer"] == "A" * 1000
+
+        assert (await ac.get("/knowledge/interpretations/NOPE")).status_code == 404
+        assert (await ac.get("/knowledge/interpretations", params={"cursor": "@@"})).status_code == 400
+        assert (await ac.get("/knowledge/interpretations", params={"fields": "nope"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_cors_exposes_cursor_and_summary_headers(app):
+    from utils.config import settings
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/knowledge/interpretations", params={"limit": 1}, headers={"Origin": settings.CORS_ORIGINS[0]})
+    assert res.status_code == 200
+    exposed = {h.strip().lower() for h in res.headers["access-control-expose-headers"].split(",")}
+    assert {"x-next-cursor", "x-rows", "x-violations", "x-errors"} <= exposed
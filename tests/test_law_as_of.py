@@ -0,0 +1,86 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from database.connection import engine, read_engine
+from utils import law_timeline
+from utils.law_timeline import ArticleTimeline
+
+
+def test_timeline_resolves_interval_by_bisect():
+    tl = ArticleTimeline(1, [(10, "20200101"), (12, "2023-07-01"), (11, "20200101"), (13, None)])
+    assert len(tl) == 3  # 시행일 없는 버전 제외
+    assert tl.resolve("2019-12-31") is None
+    # 같은 시행일이면 나중(id 큰) 버전
+    assert tl.resolve("2020-01-01") == {"version_id": 11, "effective_from": "2020-01-01", "effective_to": "2023-07-01"}
+    assert tl.resolve("2023-06-30")["version_id"] == 11
+    assert tl.resolve("2030-01-01") == {"version_id": 12, "effective_from": "2023-07-01", "effective_to": None}
+
+
+@pytest.fixture
+def articles(db):
+    from models.law import Law, LawArticle, LawArticleVersion
+
+    law = Law(name="시점조회테스트법")
+    db.add(law)
+    db.commit()
+    a1 = LawArticle(law_id_fk=law.id, article_no="제1조", current_text="현행")
+    a2 = LawArticle(law_id_fk=law.id, article_no="제2조", current_text="신설")
+    db.add_all([a1, a2])
+    db.commit()
+    db.add_all([
+        LawArticleVersion(article_id_fk=a1.id, effective_date="20100101", text="제정"),
+        LawArticleVersion(article_id_fk=a1.id, effective_date="20180701", text="개정"),
+        LawArticleVersion(article_id_fk=a1.id, effective_date="20250101", text="현행"),
+        LawArticleVersion(article_id_fk=a2.id, effective_date="20240101", text="신설"),
+    ])
+    db.commit()
+    law_timeline.invalidate()
+    yield a1.id, a2.id
+    db.delete(law)
+    db.commit()
+    law_timeline.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_article_as_of(app, articles):
+    a1, a2 = articles
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        mid = await ac.get(f"/law/articles/{a1}/as-of", params={"date": "2019-03-01"})
+        before = await ac.get(f"/law/articles/{a2}/as-of", params={"date": "2019-03-01"})
+        missing = await ac.get("/law/articles/999999/as-of", params={"date": "2019-03-01"})
+
+    body = mid.json()
+    assert body["content"] == "개정"
+    assert (body["effective_from"], body["effective_to"]) == ("2018-07-01", "2025-01-01")
+    assert before.status_code == 404 and "No version" in before.json()["detail"]
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_as_of_uses_cached_index(app, articles):
+    a1, a2 = articles
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.post("/law/articles/as-of", json={"date": "2024-06-30", "article_ids": [a1, a2, 999999]})
+
+        statements = []
+
+        def _log(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        for eng in {engine, read_engine}:
+            event.listen(eng, "before_cursor_execute", _log)
+        try:
+            again = await ac.post("/law/articles/as-of", json={"date": "2011-01-01", "article_ids": [a1, a2]})
+        finally:
+            for eng in {engine, read_engine}:
+                event.remove(eng, "before_cursor_execute", _log)
+
+    items = first.json()
+    assert [i.get("content") for i in items[:2]] == ["개정", "신설"]
+    assert items[2]["error"] == "article not found"
+    assert [i["content"] for i in again.json()] == ["제정", None]
+    # 두 번째 요청은 버전 목록을 다시 읽지 않음 (조문 메타 + 고른 버전 본문만)
+    assert not any("effective_date" in s for s in statements)
@@ -0,0 +1,90 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from database.connection import engine, read_engine
+from utils import law_diff, law_timeline
+
+
+def test_diff_texts_lines_and_words():
+    d = law_diff.diff_texts("① 사용자는 근로자에게\n주 1회 유급휴일을 주어야 한다.",
+                            "① 사용자는 근로자에게\n1주에 평균 1회 이상의 유급휴일을 보장하여야 한다.")
+    assert d["changed"] is True
+    assert d["stats"]["lines_added"] == 1 and d["stats"]["lines_removed"] == 1
+    assert "-주 1회 유급휴일을 주어야 한다." in d["unified"]
+    assert {"op": "replace", "at": 3, "from": "주", "to": "1주에 평균"} in d["words"]
+    assert law_diff.diff_texts("같음", "같음")["changed"] is False
+
+
+@pytest.fixture
+def law(db):
+    from models.law import Law, LawArticle, LawArticleVersion
+
+    law = Law(name="비교테스트법")
+    db.add(law)
+    db.commit()
+    a1 = LawArticle(law_id_fk=law.id, article_no="제1조")
+    a2 = LawArticle(law_id_fk=law.id, article_no="제2조")
+    a3 = LawArticle(law_id_fk=law.id, article_no="제3조")
+    db.add_all([a1, a2, a3])
+    db.commit()
+    v = {
+        "a1_old": LawArticleVersion(article_id_fk=a1.id, effective_date="20200101", text="목적은 근로조건의 기준"),
+        "a1_new": LawArticleVersion(article_id_fk=a1.id, effective_date="20240101", text="목적은 근로조건의 최저기준"),
+        "a2_old": LawArticleVersion(article_id_fk=a2.id, effective_date="20200101", text="정의"),
+        "a2_re": LawArticleVersion(article_id_fk=a2.id, effective_date="20240101", text="정의"),
+        "a3_new": LawArticleVersion(article_id_fk=a3.id, effective_date="20240101", text="신설 조문"),
+    }
+    db.add_all(v.values())
+    db.commit()
+    law_timeline.invalidate()
+    law_diff.diff_cache.clear()
+    yield {k: x.id for k, x in v.items()}
+    db.delete(law)
+    db.commit()
+    law_timeline.invalidate()
+
+
+@pytest.mark.asyncio
+async def test_version_diff_endpoint_is_memoized(app, law):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        first = await ac.get("/law/article-versions/diff", params={"from": law["a1_old"], "to": law["a1_new"]})
+
+        statements = []
+
+        def _log(*args):
+            statements.append(1)
+
+        for eng in {engine, read_engine}:
+            event.listen(eng, "before_cursor_execute", _log)
+        try:
+            second = await ac.get("/law/article-versions/diff", params={"from": law["a1_old"], "to": law["a1_new"]})
+        finally:
+            for eng in {engine, read_engine}:
+                event.remove(eng, "before_cursor_execute", _log)
+        missing = await ac.get("/law/article-versions/diff", params={"from": law["a1_old"], "to": 999999})
+
+    assert first.status_code == 200
+    assert first.json()["words"] == [{"op": "replace", "at": 2, "from": "기준", "to": "최저기준"}]
+    assert second.json() == first.json()
+    assert statements == []  # 두 번째는 캐시
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_law_changes_report(app, law):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/law/changes", params={"law_name": "비교테스트법", "from": "2021-01-01", "to": "2024-06-01"})
+        full = await ac.get("/law/changes", params={
+            "law_name": "비교테스트법", "from": "2021-01-01", "to": "2024-06-01", "include_diff": "true",
+        })
+        nolaw = await ac.get("/law/changes", params={"law_name": "없는법", "from": "2021-01-01", "to": "2024-06-01"})
+
+    body = res.json()
+    assert body["summary"] == {"added": 1, "changed": 1, "removed": 0, "same_text": 1}
+    assert [(c["article_no"], c["status"]) for c in body["changes"]] == [("제1조", "changed"), ("제3조", "added")]
+    assert "unified" not in body["changes"][0]
+    assert full.json()["changes"][0]["words"][0]["to"] == "최저기준"
+    assert nolaw.status_code == 404
@@ -29,3 +29,33 @@ async def test_law_list_and_articles(app):
         if arts:
             a0 = arts[0]
             assert "article_no" in a0 and "content" in a0
+
+
+@pytest.mark.asyncio
+async def test_law_articles_text_and_version_count(app, db):
+    from models.law import Law, LawArticle, LawArticleVersion
+
+    law = Law(name="버전카운트테스트법")
+    db.add(law)
+    db.commit()
+    a1 = LawArticle(law_id_fk=law.id, article_no="제1조", title="(목적)", current_text="이 법은 ...")
+    a2 = LawArticle(law_id_fk=law.id, article_no="제2조", title="(정의)", current_text="이 법에서 ...")
+    db.add_all([a1, a2])
+    db.commit()
+    db.add_all([
+        LawArticleVersion(article_id_fk=a1.id, effective_date="20240101", text="구 조문"),
+        LawArticleVersion(article_id_fk=a1.id, effective_date="20250101", text="이 법은 ..."),
+    ])
+    db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/law/articles", params={"law_name": "버전카운트테스트법"})
+        assert res.status_code == 200
+        arts = res.json()
+        assert [(a["article_no"], a["version_count"]) for a in arts] == [("제1조", 2), ("제2조", 0)]
+        assert arts[0]["current_text"] == arts[0]["content"] == "이 법은 ..."
+
+        vers = await ac.get("/law/article-versions", params={"article_id": a1.id})
+        assert [v["effective_date"] for v in vers.json()] == ["20250101", "20240101"]
+        assert vers.json()[1]["content"] == "구 조문"
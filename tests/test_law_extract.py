@@ -0,0 +1,49 @@
+from scripts.law_extract import flatten_text, iter_articles
+
+
+def test_flatten_text_matches_legacy_join_rules():
+    # list는 빈 원소도 구분자로 잇고, dict는 빈 값을 건너뜀
+    assert flatten_text(["a", "", "b"]) == "a\n\nb"
+    assert flatten_text({"x": "a", "y": "", "z": [], "w": {"k": None}, "v": "b"}) == "a\nb"
+    assert flatten_text({"x": ["", ""], "y": "b"}) == "\n\nb"
+    assert flatten_text({"n": 0, "m": [{"t": "항"}, {"t": "호"}]}) == "0\n항\n호"
+    assert flatten_text(None) == ""
+
+
+def test_iter_articles_bfs_order_and_dedup():
+    payload = {
+        "eflaw": {
+            "편": [{"장": [{"조문단위": [{"조문번호": "3", "조문내용": "셋"}]}]}],
+            "조문": [
+                {"조문번호": "1", "조문제목": "목적", "조문내용": [{"항": "①"}, {"항": "②"}]},
+                {"조문번호": "2", "조문내용": "둘"},
+                {"조문번호": "1", "조문내용": "중복"},
+            ],
+        }
+    }
+    arts = list(iter_articles(payload))
+    assert [a["article_no"] for a in arts] == ["1", "2", "3"]
+    assert arts[0]["title"] == "목적" and arts[0]["text"] == "①\n②"
+    assert arts[0]["raw"] is payload["eflaw"]["조문"][0]  # 원본 dict 참조(복사 없음)
+
+
+def test_stream_parser_matches_full_parse_bytewise():
+    import json
+    from scripts.law_extract import iter_articles_from_stream
+
+    payload = {
+        "law": {
+            "기본정보": {"법령명": "테스트법", "조문번호": "무시"},  # 범위 밖
+            "장": [
+                {"장번호": 1, "조문단위": [
+                    {"조문번호": "1", "조문제목": "목적", "조문내용": [{"항": "①"}, {"항": "②"}], "시행일자": 20250101},
+                    {"조문번호": "2", "조문내용": {"본문": "둘", "비고": ""}},
+                ]},
+            ],
+        }
+    }
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    streamed = list(iter_articles_from_stream(body[i:i + 1] for i in range(len(body))))
+    full = list(iter_articles(payload))
+    assert [(a["article_no"], a["title"], a["text"], a["raw"]) for a in streamed] == \
+        [(a["article_no"], a["title"], a["text"], a["raw"]) for a in full]
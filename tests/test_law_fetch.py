@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+import pytest
+
+from scripts import law_fetch
+from scripts.law_fetch import DONE, RESTART, TokenBucket, fetch_laws_to_queue, read_law_batches
+
+
+class _FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def clock(self):
+        return self.now
+
+    async def sleep(self, sec):
+        self.slept.append(sec)
+        self.now += sec
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_calls():
+    t = _FakeTime()
+    bucket = TokenBucket(rate=2.0, capacity=1, clock=t.clock, sleep=t.sleep)
+    for _ in range(5):
+        await bucket.acquire()
+    # 첫 토큰은 즉시, 이후 4번은 0.5초 간격
+    assert t.now == pytest.approx(2.0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_retries_and_bounded_concurrency(monkeypatch):
+    monkeypatch.setattr(law_fetch, "_backoff_delay", lambda *a: 0.0)
+    calls: dict[str, int] = {}
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.params["LM"]
+        calls[name] = calls.get(name, 0) + 1
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if name == "flaky" and calls[name] < 3:
+            return httpx.Response(503)
+        if name == "limited" and calls[name] == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if name == "missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"law": {"조문": [{"조문번호": "1", "조문내용": name}]}})
+
+    names = ["a", "b", "c", "flaky", "limited", "missing"]
+    queue: asyncio.Queue = asyncio.Queue()
+    producer = asyncio.create_task(fetch_laws_to_queue(
+        "oc", names, queue, concurrency=2, rate=1000.0, transport=httpx.MockTransport(handler)
+    ))
+
+    results = {}
+    while True:
+        item = await queue.get()
+        if item is DONE:
+            break
+        results[item[0]] = await read_law_batches(item[1])
+    await producer
+
+    assert set(results) == set(names)
+    assert results["flaky"] is not None and calls["flaky"] == 3
+    assert results["limited"] is not None and calls["limited"] == 2
+    assert results["missing"] is None and calls["missing"] == 1
+    assert in_flight["max"] <= 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_streams_fixed_size_batches_and_restarts_on_retry(monkeypatch):
+    monkeypatch.setattr(law_fetch, "_backoff_delay", lambda *a: 0.0)
+    calls = {"n": 0}
+    body = {"law": {"조문": [{"조문번호": str(i), "조문내용": f"본문 {i}"} for i in range(1, 8)]}}
+    raw = httpx.Response(200, json=body).content
+
+    class _Cut(httpx.AsyncByteStream):
+        # 첫 응답은 조문 몇 개를 보낸 뒤 연결이 끊김 → 재시도
+        async def __aiter__(self):
+            yield raw[: len(raw) // 2]
+            raise httpx.ReadError("cut")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(200, stream=_Cut())
+        return httpx.Response(200, content=raw)
+
+    queue: asyncio.Queue = asyncio.Queue()
+    producer = asyncio.create_task(fetch_laws_to_queue(
+        "oc", ["큰법"], queue, rate=1000.0, transport=httpx.MockTransport(handler), batch_size=2
+    ))
+    name, batches = await queue.get()
+    items = []
+    while True:
+        item = await batches.get()
+        items.append(item)
+        if item is DONE or item is None:
+            break
+    assert await queue.get() is DONE
+    await producer
+
+    assert name == "큰법" and calls["n"] == 2
+    restart = items.index(RESTART)
+    assert restart > 0  # 끊기기 전에 받은 배치가 먼저 흘러감
+    after = items[restart + 1:-1]
+    assert [len(b) for b in after] == [2, 2, 2, 1]
+    assert [a["article_no"] for b in after for a in b] == [str(i) for i in range(1, 8)]
+    assert items[-1] is DONE
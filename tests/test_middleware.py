@@ -0,0 +1,103 @@
+import asyncio
+import logging.handlers
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient, ASGITransport
+
+from main import SecurityHeadersMiddleware, access_logger
+
+
+@pytest.mark.asyncio
+async def test_security_headers_on_health(app):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.get("/health")
+    assert res.status_code == 200
+    assert res.headers["x-content-type-options"] == "nosniff"
+    assert res.headers["x-frame-options"] == "DENY"
+    assert res.headers["referrer-policy"] == "no-referrer"
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through_unbuffered():
+    sent = []
+
+    async def chunks():
+        for i in range(3):
+            sent.append(i)
+            yield f"chunk{i}\n".encode()
+
+    inner = FastAPI()
+
+    @inner.get("/stream")
+    def stream():
+        return StreamingResponse(chunks(), media_type="text/plain", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    messages = []
+
+    received = []
+
+    async def receive():
+        if not received:
+            received.append(1)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # 연결 유지 (끊김 없음)
+
+    async def send(message):
+        # 본문 조각이 도착할 때마다 지금까지 생성된 조각 수 기록
+        messages.append((message["type"], len(sent)))
+        if message["type"] == "http.response.start":
+            messages.append(("headers", dict(message["headers"])))
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/stream", "raw_path": b"/stream", "query_string": b"",
+        "root_path": "", "headers": [], "server": ("test", 80), "client": ("test", 1),
+    }
+    await SecurityHeadersMiddleware(inner)(scope, receive, send)
+
+    headers = next(m[1] for m in messages if m[0] == "headers")
+    assert headers[b"x-frame-options"] == b"DENY"  # 기존 헤더는 덮어씀
+    bodies = [n for t, n in messages if t == "http.response.body"]
+    # 조각마다 바로 전달 (한꺼번에 모아 보내지 않음)
+    assert bodies[:3] == [1, 2, 3]
+
+
+def test_access_log_goes_through_queue():
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in access_logger.handlers)
+    assert access_logger.propagate is False
+
+
+def test_access_log_listener_survives_repeated_lifespans():
+    import main
+
+    class _Collect(logging.Handler):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    collect = _Collect()
+    main.stop_access_log()
+    saved = main.access_listener.handlers
+    main.access_listener.handlers = (collect,)
+    try:
+        for i in range(2):
+            main._start_access_log()
+            main._start_access_log()  # 중복 시작 무시
+            assert main._access_log_started
+            access_logger.warning("cycle %d", i)
+            main._stop_access_log()
+            main._stop_access_log()   # 중복 종료도 안전 (AttributeError 없음)
+            assert not main._access_log_started
+        access_logger.warning("between")  # 멈춘 동안 기록 → 다음 시작 때 출력
+        main.start_access_log()
+        main.stop_access_log()
+    finally:
+        main.access_listener.handlers = saved
+    # 앞서 리스너 없이 쌓인 요청 로그도 잃지 않고 먼저 출력됨
+    assert collect.messages[-3:] == ["cycle 0", "cycle 1", "between"]
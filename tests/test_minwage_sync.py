@@ -0,0 +1,62 @@
+import json
+import os
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from scripts.etl import minwage_seed
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 배포된 worklaw.db 의 minimum_wage_history (models.wage 이력 스키마, id PK, hourly 없음)
+AUDIT_SCHEMA = """
+CREATE TABLE minimum_wage_history (
+    id INTEGER NOT NULL, year INTEGER NOT NULL, old_amount INTEGER, new_amount INTEGER,
+    old_unit VARCHAR(20), new_unit VARCHAR(20), action VARCHAR(20) NOT NULL,
+    changed_by VARCHAR(100) NOT NULL, changed_at DATETIME NOT NULL,
+    monthly_209h INTEGER, notice_no TEXT, notice_date TEXT, source_url TEXT,
+    PRIMARY KEY (id)
+)
+"""
+
+
+def _migrated_session(tmp_path, monkeypatch, pre_sql=None):
+    url = f"sqlite:///{tmp_path / 'migrated.db'}"
+    engine = create_engine(url)
+    if pre_sql:
+        with engine.begin() as conn:
+            conn.execute(text(pre_sql))
+    # alembic.ini 없이 구성 (fileConfig 로 테스트 로거를 건드리지 않게), env.py 는 DATABASE_URL 을 따름
+    monkeypatch.setenv("DATABASE_URL", url)
+    cfg = Config()
+    cfg.set_main_option("script_location", os.path.join(BASE_DIR, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", url)
+    command.upgrade(cfg, "head")
+    return engine, sessionmaker(bind=engine)()
+
+
+@pytest.mark.parametrize("pre_sql", [None, AUDIT_SCHEMA], ids=["fresh", "shipped-audit-schema"])
+def test_minwage_sync_on_migrated_schema(tmp_path, monkeypatch, pre_sql):
+    engine, db = _migrated_session(tmp_path, monkeypatch, pre_sql)
+    try:
+        upserted, skipped, checksum, log = minwage_seed.run(db)
+        assert upserted > 0 and skipped == 0 and checksum
+
+        with open(minwage_seed.DATA_PATH, encoding="utf-8") as f:
+            n = len(json.load(f))
+        rows = db.execute(text("SELECT year, hourly FROM minimum_wage_history ORDER BY year")).all()
+        assert len(rows) == n and all(h for _y, h in rows)
+
+        # 다시 돌리면 전부 건너뜀, 원천이 바뀌면 같은 연도 행이 갱신(중복 행 없음)
+        assert minwage_seed.run(db)[0:2] == (0, n)
+        db.execute(text("DELETE FROM staging_raw WHERE source_key = 'minwage'"))
+        db.commit()
+        upserted, _skipped, _c, log = minwage_seed.run(db)
+        assert upserted == n and f"updated={n}" in log
+        assert db.execute(text("SELECT COUNT(*) FROM minimum_wage_history")).scalar() == n
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from database.connection import READ_DATABASE_URL, ReadSessionLocal, read_engine, engine
+from models.knowledge_core import PolicyBulletin
+
+
+def test_read_engine_is_separate_and_read_only():
+    assert read_engine is not engine
+    assert "mode=ro" in READ_DATABASE_URL
+
+    rdb = ReadSessionLocal()
+    try:
+        with pytest.raises(OperationalError):
+            rdb.execute(text("INSERT INTO policy_bulletins (id, title) VALUES ('RO-1', 'x')"))
+    finally:
+        rdb.close()
+
+
+def test_read_session_sees_committed_writes(db):
+    db.add(PolicyBulletin(id="RW-SPLIT-1", title="읽기/쓰기 분리"))
+    db.commit()
+
+    rdb = ReadSessionLocal()
+    try:
+        assert rdb.get(PolicyBulletin, "RW-SPLIT-1").title == "읽기/쓰기 분리"
+    finally:
+        rdb.close()
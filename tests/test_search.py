@@ -0,0 +1,78 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from models.knowledge_core import AdminInterpretation
+
+
+@pytest.mark.asyncio
+async def test_search_trigram_and_short_terms_follow_triggers(app, db):
+    row = AdminInterpretation(
+        interp_id="FTS-1",
+        title="연차사용계획 통지 방식",
+        question="연차유급휴가 사용촉진 시 통지는 어떻게 하나요?",
+        answer="서면으로 개별 통지해야 합니다.",
+    )
+    db.add(row)
+    db.commit()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        # 3글자 이상: FTS MATCH(trigram) + bm25 + snippet
+        res = await ac.get("/search", params={"q": "유급휴가"})
+        assert res.status_code == 200
+        hits = [h for h in res.json() if h["id"] == "FTS-1"]
+        assert hits and hits[0]["kind"] == "interpretation"
+        assert "<b>유급휴가</b>" in hits[0]["snippet"]
+
+        # 2글자(trigram 미만): LIKE 경로
+        res = await ac.get("/search", params={"q": "연차", "kind": "interpretation"})
+        assert "FTS-1" in [h["id"] for h in res.json()]
+
+        # UPDATE/DELETE 트리거 반영
+        row.title = "변경된 제목"
+        db.commit()
+        res = await ac.get("/search", params={"q": "변경된"})
+        assert "FTS-1" in [h["id"] for h in res.json()]
+
+        db.delete(row)
+        db.commit()
+        res = await ac.get("/search", params={"q": "유급휴가"})
+        assert "FTS-1" not in [h["id"] for h in res.json()]
+
+        assert (await ac.get("/search", params={"q": "x", "kind": "nope"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_snippets_are_escaped_and_short_scan_is_capped(app, db, monkeypatch):
+    from database import search_index
+
+    rows = [
+        AdminInterpretation(
+            interp_id=f"FTS-XSS-{i}",
+            title=f"스크립트 질의 {i}",
+            question="<i>중간정산</i> & 기타",
+            answer="답변",
+        )
+        for i in range(3)
+    ]
+    db.add_all(rows)
+    db.commit()
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            for q in ("중간정산", "정산"):  # FTS snippet() 경로 / LIKE 경로
+                res = await ac.get("/search", params={"q": q, "kind": "interpretation"})
+                hits = [h for h in res.json() if h["id"].startswith("FTS-XSS-")]
+                assert hits, q
+                snip = hits[0]["snippet"]
+                assert "<i>" not in snip and "&lt;i&gt;" in snip and "&amp;" in snip
+                assert "<b>" + q + "</b>" in snip
+
+            # 2글자 검색어만 있으면 일치 행 SHORT_TERM_SCAN_LIMIT건까지만 후보
+            monkeypatch.setattr(search_index, "SHORT_TERM_SCAN_LIMIT", 2)
+            res = await ac.get("/search", params={"q": "정산", "kind": "interpretation", "limit": 10})
+            assert len(res.json()) == 2
+    finally:
+        for r in rows:
+            db.delete(r)
+        db.commit()
@@ -0,0 +1,25 @@
+from sqlalchemy import text
+
+from database.connection import engine, make_engine, sqlite_pragmas
+
+
+def test_engine_applies_tuned_pragmas():
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().lower() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+
+def test_profile_can_be_disabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("SQLITE_PROFILE", "off")
+    assert sqlite_pragmas("sqlite:///x.db") == {}
+    eng = make_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+    with eng.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar().lower() == "delete"
+    eng.dispose()
+
+
+def test_memory_db_skips_wal():
+    pragmas = sqlite_pragmas("sqlite://")
+    assert "journal_mode" not in pragmas and "mmap_size" not in pragmas
@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from models.knowledge_core import SyncJob
+from utils import sync_jobs
+from utils.sync_jobs import SyncJobRunner
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_job_id_and_reports_progress(app, wait_sync_job, admin_headers):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        res = await ac.post("/admin/sync/holiday_api", headers=admin_headers)
+        assert res.status_code == 202
+        body = res.json()
+        assert body["job_id"] and body["poll"] == f"/admin/sync/jobs/{body['job_id']}"
+
+        job = await wait_sync_job(ac, body["job_id"])
+        assert job["status"] == "success"
+        assert job["source_key"] == "holiday_api"
+        assert job["items_upserted"] + job["items_skipped"] > 0
+        assert job["checksum"]
+        assert job["finished_at"]
+
+        missing = await ac.get("/admin/sync/jobs/nope", headers=admin_headers)
+        assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_sync_requires_admin_token(app):
+    from utils.security import create_access_token
+
+    user_token = create_access_token(sub="someone", role="user")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        for headers in ({}, {"Authorization": "Bearer x"}, {"Authorization": f"Bearer {user_token}"}):
+            post = await ac.post("/admin/sync/holiday_api", headers=headers)
+            get = await ac.get("/admin/sync/jobs/nope", headers=headers)
+            assert post.status_code == 401 and get.status_code == 401
+
+
+def test_same_source_is_deduplicated(db, monkeypatch):
+    from database.connection import SessionLocal
+
+    gate = threading.Event()
+
+    class _SlowEtl:
+        @staticmethod
+        def run(session):
+            gate.wait(5)
+            return 3, 0, "abc", "slow: upserted=3"
+
+    monkeypatch.setitem(sync_jobs.ETL_MODULES, "slow_test", "slow_test")
+    monkeypatch.setattr(sync_jobs.importlib, "import_module", lambda name: _SlowEtl)
+
+    runner = SyncJobRunner(SessionLocal, max_workers=2)
+    try:
+        first, created1 = runner.submit("slow_test")
+        second, created2 = runner.submit("slow_test")
+        assert created1 and not created2
+        assert first == second
+        gate.set()
+    finally:
+        runner.shutdown(wait=True)
+
+    db.expire_all()
+    job = db.get(SyncJob, first)
+    assert job.status == "success"
+    assert job.items_upserted == 3
+    assert db.query(SyncJob).filter(SyncJob.source_key == "slow_test").count() == 1
+    # 끝난 작업의 진행 정보는 메모리에서 제거, 조회는 DB 행으로
+    assert first not in runner._progress
+    assert runner.status(db, first)["stage"] == "success"
+
+
+def test_failed_job_records_log(db, monkeypatch):
+    from database.connection import SessionLocal
+
+    class _BrokenEtl:
+        @staticmethod
+        def run(session):
+            raise RuntimeError("upstream down")
+
+    monkeypatch.setitem(sync_jobs.ETL_MODULES, "broken_test", "broken_test")
+    monkeypatch.setattr(sync_jobs.importlib, "import_module", lambda name: _BrokenEtl)
+
+    runner = SyncJobRunner(SessionLocal, max_workers=1)
+    job_id, _ = runner.submit("broken_test")
+    runner.shutdown(wait=True)
+
+    job = runner.status(db, job_id)
+    assert job["status"] == "fail"
+    assert "upstream down" in job["log"]
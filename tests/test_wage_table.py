@@ -0,0 +1,85 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+
+from database.connection import engine, read_engine
+from models.wage import MinimumWage
+from utils import wage_table
+
+
+@pytest.fixture
+def wages(db):
+    db.add_all([MinimumWage(year=2061, amount=20000, unit="KRW/hour"), MinimumWage(year=2062, amount=21000, unit="KRW/hour")])
+    db.commit()
+    wage_table.reload(db)
+    yield
+    db.query(MinimumWage).filter(MinimumWage.year.in_([2061, 2062])).delete()
+    db.commit()
+    wage_table.reload(db)
+
+
+@pytest.mark.asyncio
+async def test_lookup_never_touches_db(app, wages):
+    statements = []
+
+    def _count(*args):
+        statements.append(1)
+
+    for eng in (engine, read_engine):
+        event.listen(eng, "before_cursor_execute", _count)
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            exact = await ac.get("/metadata/minimum-wage", params={"year": 2061})
+            missing = await ac.get("/metadata/minimum-wage", params={"year": 2099})
+    finally:
+        for eng in (engine, read_engine):
+            event.remove(eng, "before_cursor_execute", _count)
+
+    assert exact.json() == {"year": 2061, "minimum_wage": 20000, "unit": "KRW/hour"}
+    # 없는 연도 → 최신 연도
+    assert missing.json()["year"] == 2062
+    assert statements == []
+
+
+def test_reload_swaps_whole_table(db, wages):
+    before = wage_table.get_table()
+    row = db.query(MinimumWage).filter(MinimumWage.year == 2062).one()
+    row.amount = 22000
+    db.commit()
+    after = wage_table.reload(db)
+
+    assert before is not after
+    assert before.get(2062)[1] == 21000  # 이전 테이블은 그대로
+    assert wage_table.get_table().get(2062)[1] == 22000
+
+
+def test_staging_override_reads_table(wages):
+    from app.routers.metadata_staging import _read_min_wage
+
+    table = wage_table.get_table()
+    assert _read_min_wage(table, 2061)["hourly"] == 20000
+    assert _read_min_wage(table, 1999)["source"] == "staging-fallback"
+
+
+@pytest.mark.asyncio
+async def test_get_table_async_reads_once_and_reloads_off_loop(wages, monkeypatch):
+    import threading
+
+    table = wage_table.current()
+    assert table is not None and await wage_table.get_table_async() is table
+
+    loop_thread = threading.get_ident()
+    reload_threads = []
+    real_reload = wage_table.reload
+
+    def _reload(*a, **kw):
+        reload_threads.append(threading.get_ident())
+        return real_reload(*a, **kw)
+
+    monkeypatch.setattr(wage_table, "reload", _reload)
+    monkeypatch.setattr(wage_table, "_table", None)
+    assert wage_table.current() is None
+    fresh = await wage_table.get_table_async()
+    assert fresh.get(2061)[1] == 20000
+    assert reload_threads and reload_threads[0] != loop_thread
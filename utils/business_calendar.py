@@ -0,0 +1,265 @@
+# utils/business_calendar.py
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.knowledge_core import Holiday
+
+"""
+영업일(근무일) 달력 엔진
+- holidays 테이블 전체(연 수십 행)를 읽어 연도별 비트맵을 미리 계산 (비트 i = 1월 1일부터 i번째 날이 근무일)
+- 휴무일 = 토·일 + 공휴일(is_public) + 대체공휴일
+  · 데이터에 '대체' 행이 있는 연도는 그대로 신뢰, 없으면 SUBSTITUTE_RULES로 직접 계산
+- 연도별 누적 근무일 수(year_prefix)와 64일 블록 누적 수(blocks)를 함께 보관
+  → 두 날짜 사이 근무일 수: O(1) (연도 경계를 넘어도 누적값 차이)
+  → N 근무일 더하기: 연도/블록 이분 탐색 후 64비트 워드 안에서 선택
+- 불변 객체를 통째로 교체 (wage_table과 같은 방식), holiday_api 동기화 후 invalidate()
+"""
+
+MIN_YEAR = 1950
+MAX_YEAR = 2100
+WEEKEND = (5, 6)                       # date.weekday(): 토, 일
+_WORD = 64
+_WORD_MASK = (1 << _WORD) - 1
+
+# (이름 키워드, 시행 연도, 대체 사유가 되는 요일)
+# 같은 날 두 공휴일이 겹치는 경우는 holidays.date가 PK라 한 행만 남으므로 판단하지 않음
+SUBSTITUTE_RULES: Tuple[Tuple[Tuple[str, ...], int, Tuple[int, ...]], ...] = (
+    (("설날", "추석"), 2014, (6,)),
+    (("어린이날",), 2014, (5, 6)),
+    (("삼일절", "3·1절", "3.1절", "광복절", "개천절", "한글날"), 2021, (5, 6)),
+    (("부처님오신날", "석가탄신일", "기독탄신일", "성탄절"), 2023, (5, 6)),
+)
+SUBSTITUTE_NAME = "대체공휴일"
+
+class CalendarRangeError(ValueError):
+    pass
+
+# 7일 주기 주말 패턴을 한 해 길이로 펼칠 때 쓰는 반복 계수 (1 + 2^7 + 2^14 + ...)
+_REPEAT7 = sum(1 << (7 * k) for k in range(54))
+
+def _weekend_bits(jan1: date, ndays: int) -> int:
+    w0 = jan1.weekday()
+    week = sum(1 << i for i in range(7) if (w0 + i) % 7 in WEEKEND)
+    return (week * _REPEAT7) & ((1 << ndays) - 1)
+
+def _substitutes(year: int, public: Dict[date, str], off: Callable[[date], bool]) -> Dict[date, str]:
+    """SUBSTITUTE_RULES에 따른 대체공휴일 (연속된 같은 명절은 한 묶음으로 판단)"""
+    out: Dict[date, str] = {}
+    for keywords, since, days in SUBSTITUTE_RULES:
+        if year < since:
+            continue
+        hits = sorted(
+            d for d, name in public.items()
+            if SUBSTITUTE_NAME not in name and any(k in name for k in keywords)
+        )
+        runs: List[List[date]] = []
+        for d in hits:
+            if runs and (d - runs[-1][-1]).days == 1:
+                runs[-1].append(d)
+            else:
+                runs.append([d])
+        for run in runs:
+            need = sum(1 for d in run if d.weekday() in days)
+            d = run[-1]
+            while need:
+                d += timedelta(days=1)
+                if not off(d) and d not in out:
+                    out[d] = f"{SUBSTITUTE_NAME}({public[run[0]]})"
+                    need -= 1
+    return out
+
+class YearMask:
+    """한 해의 근무일 비트맵 + 64일 블록 누적 근무일 수"""
+    __slots__ = ("year", "ordinal0", "ndays", "work", "blocks", "total")
+
+    def __init__(self, year: int, off_days: List[date]):
+        jan1 = date(year, 1, 1)
+        self.year = year
+        self.ordinal0 = jan1.toordinal()
+        self.ndays = date(year + 1, 1, 1).toordinal() - self.ordinal0
+        off = _weekend_bits(jan1, self.ndays)
+        for d in off_days:
+            off |= 1 << (d.toordinal() - self.ordinal0)
+        self.work = ~off & ((1 << self.ndays) - 1)
+        cum = [0]
+        for j in range(0, self.ndays, _WORD):
+            cum.append(cum[-1] + ((self.work >> j) & _WORD_MASK).bit_count())
+        self.blocks = tuple(cum)
+        self.total = cum[-1]
+
+    def is_workday(self, i: int) -> bool:
+        return (self.work >> i) & 1 == 1
+
+    def rank(self, i: int) -> int:
+        """인덱스 i(0=1월 1일) 이전의 근무일 수"""
+        j, r = divmod(i, _WORD)
+        if r == 0:
+            return self.blocks[j]
+        return self.blocks[j] + ((self.work >> (j * _WORD)) & ((1 << r) - 1)).bit_count()
+
+    def select(self, k: int) -> int:
+        """k번째(0부터) 근무일의 인덱스"""
+        j = bisect_right(self.blocks, k) - 1
+        word = (self.work >> (j * _WORD)) & _WORD_MASK
+        for _ in range(k - self.blocks[j]):
+            word &= word - 1                    # 가장 낮은 1비트 제거
+        return j * _WORD + (word & -word).bit_length() - 1
+
+class BusinessCalendar:
+    __slots__ = ("_years", "_prefix", "_names", "data_years", "loaded_at")
+
+    def __init__(self, rows: List[Tuple[str, str, bool]], loaded_at: float):
+        # rows: (YYYY-MM-DD, name, is_public)
+        names: Dict[date, Tuple[str, bool, bool]] = {}      # date → (이름, 휴무 여부, 대체공휴일 여부)
+        public_by_year: Dict[int, Dict[date, str]] = {}
+        explicit_subst: set[int] = set()
+        for ds, name, is_public in rows:
+            try:
+                d = date.fromisoformat((ds or "")[:10])
+            except ValueError:
+                continue
+            if not MIN_YEAR <= d.year <= MAX_YEAR:
+                continue
+            name = name or ""
+            is_public = is_public is None or bool(is_public)
+            subst = SUBSTITUTE_NAME in name or name.startswith("대체")
+            names[d] = (name, is_public, subst)
+            if is_public:
+                public_by_year.setdefault(d.year, {})[d] = name
+                if subst:
+                    explicit_subst.add(d.year)
+
+        years: List[YearMask] = []
+        prefix = [0]
+        for y in range(MIN_YEAR, MAX_YEAR + 1):
+            public = public_by_year.get(y, {})
+            if public and y not in explicit_subst:
+                def off(d: date, _p=public) -> bool:
+                    return d.weekday() in WEEKEND or d in _p
+                for d, name in _substitutes(y, public, off).items():
+                    if d.year == y:
+                        names[d] = (name, True, True)
+                        public[d] = name
+                    elif d.year <= MAX_YEAR:   # 12월 말 → 다음 해로 넘어가는 대체일
+                        public_by_year.setdefault(d.year, {})[d] = name
+                        names[d] = (name, True, True)
+            ym = YearMask(y, list(public))
+            years.append(ym)
+            prefix.append(prefix[-1] + ym.total)
+        self._years = tuple(years)
+        self._prefix = tuple(prefix)
+        self._names = names
+        self.data_years = frozenset(public_by_year)
+        self.loaded_at = loaded_at
+
+    def _locate(self, d: date) -> Tuple[YearMask, int]:
+        if not MIN_YEAR <= d.year <= MAX_YEAR:
+            raise CalendarRangeError(f"date out of supported range {MIN_YEAR}..{MAX_YEAR}: {d.isoformat()}")
+        ym = self._years[d.year - MIN_YEAR]
+        return ym, d.toordinal() - ym.ordinal0
+
+    def _global_rank(self, d: date) -> int:
+        """d 이전(d 미포함)의 근무일 수, MIN_YEAR-01-01 기준"""
+        ym, i = self._locate(d)
+        return self._prefix[d.year - MIN_YEAR] + ym.rank(i)
+
+    def is_business_day(self, d: date) -> bool:
+        ym, i = self._locate(d)
+        return ym.is_workday(i)
+
+    def describe(self, d: date) -> Dict:
+        ym, i = self._locate(d)
+        name, is_public, subst = self._names.get(d, (None, False, False))
+        return {
+            "date": d.isoformat(),
+            "is_business_day": ym.is_workday(i),
+            "is_weekend": d.weekday() in WEEKEND,
+            "is_holiday": is_public,
+            "is_substitute": subst,
+            "holiday_name": name,
+        }
+
+    def count_business_days(self, start: date, end: date) -> int:
+        """start ~ end (양끝 포함) 근무일 수"""
+        if end < start:
+            raise CalendarRangeError("end must be on or after start")
+        last = self._global_rank(end) + (1 if self.is_business_day(end) else 0)
+        return last - self._global_rank(start)
+
+    def add_business_days(self, start: date, n: int) -> date:
+        """
+        n > 0: start 이후 n번째 근무일, n < 0: start 이전 |n|번째 근무일
+        n = 0: start가 근무일이면 그대로, 아니면 다음 근무일
+        """
+        r = self._global_rank(start)
+        if n > 0:
+            t = r + (1 if self.is_business_day(start) else 0) + n - 1
+        else:
+            t = r + n
+        if not 0 <= t < self._prefix[-1]:
+            raise CalendarRangeError(f"result out of supported range {MIN_YEAR}..{MAX_YEAR}")
+        yi = bisect_right(self._prefix, t) - 1
+        ym = self._years[yi]
+        return date.fromordinal(ym.ordinal0 + ym.select(t - self._prefix[yi]))
+
+    def missing_years(self, start: date, end: date) -> List[int]:
+        """holidays 데이터가 없는(주말만 반영된) 연도"""
+        return [y for y in range(start.year, end.year + 1) if y not in self.data_years]
+
+def build_calendar(db: Session) -> BusinessCalendar:
+    rows = db.execute(select(Holiday.date_iso, Holiday.name, Holiday.is_public)).all()
+    return BusinessCalendar([tuple(r) for r in rows], time.monotonic())
+
+_calendar: Optional[BusinessCalendar] = None
+_reload_lock = threading.Lock()
+
+def reload(db: Session | None = None, session_factory: Callable[[], Session] | None = None) -> BusinessCalendar:
+    """DB에서 새 달력을 만들어 원자적으로 교체"""
+    global _calendar
+    with _reload_lock:
+        if db is not None:
+            cal = build_calendar(db)
+        else:
+            if session_factory is None:
+                from database.connection import ReadSessionLocal as session_factory
+            s = session_factory()
+            try:
+                cal = build_calendar(s)
+            finally:
+                s.close()
+        _calendar = cal
+    return cal
+
+def invalidate() -> None:
+    """다음 조회 때 다시 빌드 (holiday_api 동기화 후 호출)"""
+    global _calendar
+    _calendar = None
+
+def _default_max_age() -> float:
+    from utils.config import settings
+    return settings.BUSINESS_CALENDAR_MAX_AGE
+
+def current(max_age: float | None = None) -> Optional[BusinessCalendar]:
+    """빌드 없이 현재 달력 한 번 읽기 (없거나 max_age 초과면 None). 요청은 이 객체 하나만 계속 사용"""
+    cal = _calendar
+    if max_age is None:
+        max_age = _default_max_age()
+    if cal is None or (max_age > 0 and time.monotonic() - cal.loaded_at > max_age):
+        return None
+    return cal
+
+def needs_reload(max_age: float | None = None) -> bool:
+    return current(max_age) is None
+
+def get_calendar(max_age: float | None = None) -> BusinessCalendar:
+    """현재 달력 (없거나 max_age 초과면 다시 빌드). 확인과 반환이 같은 객체"""
+    cal = current(max_age)
+    return cal if cal is not None else reload()
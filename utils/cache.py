@@ -0,0 +1,106 @@
+# utils/cache.py
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from utils.config import settings
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL + 크기 제한(LRU) 캐시.
+    - 값은 직렬화가 끝난 응답(예: list[dict])을 그대로 보관
+    - ttl 이 None 이면 만료 없이 LRU 축출만 수행
+    - 쓰기 경로(관리자 동기화/ETL)는 invalidate()/invalidate_prefix()로 명시적 무효화
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float | None = 300.0, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float | None, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expires_at, value = item
+            if expires_at is not None and expires_at <= self._clock():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = (self._clock() + self.ttl) if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        _missing = object()
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """문자열 키 중 prefix로 시작하는 항목 제거 (예: 'holidays:')"""
+        with self._lock:
+            keys = [k for k in self._data if isinstance(k, str) and k.startswith(prefix)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "maxsize": self.maxsize, "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+# ─────────────────────────────────────────────────────────────
+# /knowledge 읽기 엔드포인트 공용 캐시
+knowledge_cache = TTLCache(
+    maxsize=settings.KNOWLEDGE_CACHE_MAXSIZE,
+    ttl=settings.KNOWLEDGE_CACHE_TTL,
+)
+
+# ETL source_key → 무효화할 캐시 키 prefix
+SOURCE_CACHE_PREFIXES: dict[str, tuple[str, ...]] = {
+    "minwage": ("minimum_wage",),
+    "holiday_api": ("holidays:",),
+    "moel_notice": ("policy_bulletins",),
+    "interpretation_api": ("interpretations",),
+    "law_api": ("law:",),
+}
+
+def invalidate_source(source_key: str) -> int:
+    """source_key에 해당하는 캐시 항목 제거. 알 수 없는 키면 전체 비움."""
+    prefixes = SOURCE_CACHE_PREFIXES.get(source_key)
+    if prefixes is None:
+        n = len(knowledge_cache)
+        knowledge_cache.clear()
+        return n
+    return sum(knowledge_cache.invalidate_prefix(p) for p in prefixes)
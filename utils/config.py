@@ -43,6 +43,14 @@ class Settings:
     JWT_EXPIRE_MIN: int
     CORS_ORIGINS: List[str]
     ENABLE_HSTS: bool
+    KNOWLEDGE_CACHE_TTL: float
+    KNOWLEDGE_CACHE_MAXSIZE: int
+    SYNC_MAX_WORKERS: int
+    MINIMUM_WAGE_TABLE_MAX_AGE: float
+    BUSINESS_CALENDAR_MAX_AGE: float
+    LAW_TIMELINE_CACHE_MAXSIZE: int
+    LAW_TIMELINE_CACHE_TTL: float
+    LAW_DIFF_CACHE_MAXSIZE: int
 
     def __init__(self) -> None:
         # Railway Variables가 있으면 그것을 신뢰(로컬 기본: dev)
@@ -69,4 +77,24 @@ class Settings:
         # prod 에서만 true 권장
         self.ENABLE_HSTS = os.getenv("ENABLE_HSTS", "false").lower() == "true"
 
+        # /knowledge 읽기 캐시 (초 단위 TTL, 최대 키 수)
+        self.KNOWLEDGE_CACHE_TTL     = float(os.getenv("KNOWLEDGE_CACHE_TTL", "300"))
+        self.KNOWLEDGE_CACHE_MAXSIZE = int(os.getenv("KNOWLEDGE_CACHE_MAXSIZE", "256"))
+
+        # /admin/sync/* 백그라운드 작업 스레드 수
+        self.SYNC_MAX_WORKERS = int(os.getenv("SYNC_MAX_WORKERS", "2"))
+
+        # /metadata/minimum-wage 메모리 조회 테이블 재로드 주기(초, 다른 워커의 변경 반영용; 0이면 끔)
+        self.MINIMUM_WAGE_TABLE_MAX_AGE = float(os.getenv("MINIMUM_WAGE_TABLE_MAX_AGE", "300"))
+
+        # /calendar 영업일 비트맵 재빌드 주기(초, 0이면 holiday_api 동기화 때만)
+        self.BUSINESS_CALENDAR_MAX_AGE = float(os.getenv("BUSINESS_CALENDAR_MAX_AGE", "300"))
+
+        # /law/articles/*/as-of 조문별 시행일 인덱스 캐시 (LRU 최대 조문 수, TTL 초)
+        self.LAW_TIMELINE_CACHE_MAXSIZE = int(os.getenv("LAW_TIMELINE_CACHE_MAXSIZE", "4096"))
+        self.LAW_TIMELINE_CACHE_TTL     = float(os.getenv("LAW_TIMELINE_CACHE_TTL", "300"))
+
+        # /law/article-versions/diff, /law/changes 버전 쌍별 diff 캐시 (LRU 최대 쌍 수, 만료 없음)
+        self.LAW_DIFF_CACHE_MAXSIZE = int(os.getenv("LAW_DIFF_CACHE_MAXSIZE", "2048"))
+
 settings = Settings()
@@ -0,0 +1,37 @@
+# utils/dates.py
+from __future__ import annotations
+
+import re
+from typing import Any, Dict
+
+"""
+자유 형식 날짜 문자열 → 정렬 가능한 ISO(YYYY-MM-DD) 문자열
+- holidays.date / policy_bulletins.effective_date 등 원본 컬럼은 그대로 두고,
+  *_iso 파생 컬럼(인덱스 대상)을 쓰기 시점에 채운다
+- 파생 컬럼은 Column.info["iso_from"]에 원본 컬럼 이름을 적어 표시
+  (ORM 쓰기: models 의 before_insert/before_update, 일괄 upsert: database.bulk)
+"""
+
+# 2025-01-01, 2025.1.1, 2025/01/01, 2025-01-01T09:00:00, 2025-01-01 09:00
+_YMD = re.compile(r"^\s*(\d{4})[-./](\d{1,2})[-./](\d{1,2})")
+# 20250101
+_COMPACT = re.compile(r"^\s*(\d{4})(\d{2})(\d{2})(?!\d)")
+
+def iso_date(value: Any) -> str:
+    """정규화된 YYYY-MM-DD, 해석할 수 없거나 비어 있으면 '' (정렬 시 가장 뒤/앞)"""
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()[:10]
+    s = str(value)
+    m = _YMD.match(s) or _COMPACT.match(s)
+    if not m:
+        return ""
+    y, mo, d = (int(g) for g in m.groups())
+    if not (1 <= mo <= 12 and 1 <= d <= 31):
+        return ""
+    return f"{y:04d}-{mo:02d}-{d:02d}"
+
+def iso_columns(table) -> Dict[str, str]:
+    """파생 컬럼 → 원본 컬럼"""
+    return {c.name: c.info["iso_from"] for c in table.columns if "iso_from" in c.info}
@@ -0,0 +1,78 @@
+# utils/http_cache.py
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+"""
+조건부 GET(ETag / Last-Modified / 304) 헬퍼.
+- ETag는 테이블 단위 콘텐츠 버전(행 수, 동기화 checksum, 최종 갱신 시각 등)에서 파생
+- 304 판단은 버전 정보만으로 하므로 본문 행(ORM row)을 읽지 않는다
+"""
+
+def make_etag(*parts: Any) -> str:
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+def _as_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)  # DB의 naive datetime은 UTC(utcnow)로 저장됨
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+def parse_datetime(value: Any) -> datetime | None:
+    """DB에서 온 DateTime/ISO 문자열을 datetime으로 (실패 시 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+def latest_datetime(*values: datetime | None) -> datetime | None:
+    """None을 뺀 가장 늦은 시각 (naive는 UTC로 간주해 비교)"""
+    stamps = [v for v in values if v is not None]
+    return max(stamps, key=_as_utc) if stamps else None
+
+def http_date(dt: datetime) -> str:
+    return format_datetime(_as_utc(dt), usegmt=True)
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    # RFC 9110: If-None-Match가 있으면 If-Modified-Since는 무시
+    inm = request.headers.get("if-none-match")
+    if inm is not None:
+        tags = [t.strip() for t in inm.split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+    ims = request.headers.get("if-modified-since")
+    if ims and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(ims)
+        except (TypeError, ValueError):
+            return False
+        if since is None:
+            return False
+        return _as_utc(last_modified) <= _as_utc(since)
+    return False
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """
+    조건이 맞으면 304 응답을 돌려주고, 아니면 response에 검증자 헤더만 붙인 뒤 None.
+    사용: `nm = conditional_response(...); if nm: return nm`
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,107 @@
+# utils/law_diff.py
+from __future__ import annotations
+
+import difflib
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.law import LawArticleVersion
+from utils.cache import TTLCache
+from utils.config import settings
+
+"""
+조문 버전 간 diff (difflib)
+- 줄 단위: unified diff 줄 목록
+- 단어 단위: 공백 기준 토큰의 SequenceMatcher opcode (equal 구간은 생략하고 위치만)
+- 버전 스냅샷(LawArticleVersion.text)은 적재 후 바뀌지 않으므로 (from_id, to_id) 키로
+  만료 없이 LRU 캐시에 보관 → 수백 조문 개정도 두 번째 요청부터는 계산 없이 응답
+"""
+
+LOAD_CHUNK = 500
+# 단어 diff는 O(n·m)까지 갈 수 있어 너무 긴 본문은 줄 단위만
+MAX_WORD_TOKENS = 20_000
+
+diff_cache = TTLCache(maxsize=settings.LAW_DIFF_CACHE_MAXSIZE, ttl=None)
+
+_TOKEN = re.compile(r"\S+")
+
+def diff_texts(old: str, new: str) -> Dict:
+    """두 본문의 줄/단어 diff + 통계"""
+    old, new = old or "", new or ""
+    unified = list(difflib.unified_diff(old.splitlines(), new.splitlines(), "from", "to", lineterm="", n=1))
+
+    a, b = _TOKEN.findall(old), _TOKEN.findall(new)
+    words: Optional[List[Dict]] = None
+    added = removed = 0
+    if len(a) + len(b) <= MAX_WORD_TOKENS:
+        sm = difflib.SequenceMatcher(None, a, b, autojunk=False)
+        words = []
+        for op, i1, i2, j1, j2 in sm.get_opcodes():
+            if op == "equal":
+                continue
+            removed += i2 - i1
+            added += j2 - j1
+            words.append({"op": op, "at": i1, "from": " ".join(a[i1:i2]), "to": " ".join(b[j1:j2])})
+        similarity = sm.ratio()
+    else:
+        similarity = difflib.SequenceMatcher(None, old.splitlines(), new.splitlines()).ratio()
+    return {
+        "changed": old != new,
+        "stats": {
+            "lines_added": sum(1 for l in unified if l.startswith("+") and not l.startswith("+++")),
+            "lines_removed": sum(1 for l in unified if l.startswith("-") and not l.startswith("---")),
+            "words_added": added if words is not None else None,
+            "words_removed": removed if words is not None else None,
+            "similarity": round(similarity, 4),
+        },
+        "unified": unified,
+        "words": words,
+    }
+
+def _load_texts(db: Session, version_ids: Iterable[int]) -> Dict[int, Tuple[int, Optional[str], Optional[str]]]:
+    """version id → (article_id, effective_date, text)"""
+    ids = list(dict.fromkeys(version_ids))
+    out: Dict[int, Tuple[int, Optional[str], Optional[str]]] = {}
+    for i in range(0, len(ids), LOAD_CHUNK):
+        chunk = ids[i:i + LOAD_CHUNK]
+        for vid, aid, eff, text in db.execute(
+            select(
+                LawArticleVersion.id, LawArticleVersion.article_id_fk,
+                LawArticleVersion.effective_date, LawArticleVersion.text,
+            ).where(LawArticleVersion.id.in_(chunk))
+        ):
+            out[vid] = (aid, eff, text)
+    return out
+
+def version_diffs(db: Session, pairs: Iterable[Tuple[int, int]]) -> Dict[Tuple[int, int], Optional[Dict]]:
+    """
+    (from_id, to_id) 쌍들 → diff dict (없는 버전이 있으면 None)
+    캐시에 없는 쌍의 본문만 IN 조회로 한 번에 읽어 계산
+    """
+    _missing = object()
+    out: Dict[Tuple[int, int], Optional[Dict]] = {}
+    todo: List[Tuple[int, int]] = []
+    for pair in dict.fromkeys(pairs):
+        hit = diff_cache.get(pair, _missing)
+        if hit is _missing:
+            todo.append(pair)
+        else:
+            out[pair] = hit
+    if todo:
+        texts = _load_texts(db, (v for pair in todo for v in pair))
+        for f, t in todo:
+            if f not in texts or t not in texts:
+                out[(f, t)] = None  # 캐시하지 않음 (이후 적재될 수 있음)
+                continue
+            (fa, fe, ftext), (ta, te, ttext) = texts[f], texts[t]
+            result = {
+                "from": {"version_id": f, "article_id": fa, "effective_date": fe},
+                "to": {"version_id": t, "article_id": ta, "effective_date": te},
+                **diff_texts(ftext, ttext),
+            }
+            diff_cache.set((f, t), result)
+            out[(f, t)] = result
+    return out
@@ -0,0 +1,112 @@
+# utils/law_timeline.py
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.law import LawArticle, LawArticleVersion
+from utils.cache import TTLCache
+from utils.config import settings
+from utils.dates import iso_date
+
+"""
+조문별 시행일 구간 인덱스 ("D일 기준 조문")
+- 조문 하나의 버전들을 (시행일, id) 오름차순으로 정렬한 튜플로 보관
+- D일 기준 버전 = 시행일 <= D 인 마지막 버전 (bisect_right 한 번), 구간 끝 = 다음 버전 시행일
+- 시행일이 없거나 해석할 수 없는 버전은 구간을 정할 수 없으므로 인덱스에서 제외
+- 조문 메타(법령 id, 조문 번호, 표제)도 함께 보관 → 캐시 적중 시 DB는 고른 버전 본문 PK 조회 1회뿐
+- 조문 id → 타임라인을 LRU(+TTL) 캐시에 보관, 적재 스크립트가 커밋 후 invalidate()
+"""
+
+# 여러 조문 한 번에 로드할 때 IN 절 크기
+LOAD_CHUNK = 500
+
+class ArticleTimeline:
+    __slots__ = ("article_id", "law_id", "article_no", "title", "dates", "version_ids")
+
+    def __init__(
+        self,
+        article_id: int,
+        rows: Iterable[Tuple[int, Optional[str]]],
+        law_id: Optional[int] = None,
+        article_no: Optional[str] = None,
+        title: Optional[str] = None,
+    ):
+        # rows: (version_id, effective_date)
+        keyed = sorted((iso_date(d), vid) for vid, d in rows if iso_date(d))
+        self.article_id = article_id
+        self.law_id = law_id
+        self.article_no = article_no
+        self.title = title
+        self.dates: Tuple[str, ...] = tuple(d for d, _ in keyed)
+        self.version_ids: Tuple[int, ...] = tuple(v for _, v in keyed)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def resolve(self, on: str) -> Optional[Dict]:
+        """on(YYYY-MM-DD)에 시행 중인 버전 → {version_id, effective_from, effective_to}, 없으면 None"""
+        i = bisect_right(self.dates, on) - 1
+        if i < 0:
+            return None
+        # 같은 시행일 버전이 여럿이면 id가 가장 큰 것(마지막 적재분)이 i에 온다
+        j = bisect_right(self.dates, self.dates[i])
+        return {
+            "version_id": self.version_ids[i],
+            "effective_from": self.dates[i],
+            "effective_to": self.dates[j] if j < len(self.dates) else None,  # 미포함
+        }
+
+timeline_cache = TTLCache(maxsize=settings.LAW_TIMELINE_CACHE_MAXSIZE, ttl=settings.LAW_TIMELINE_CACHE_TTL)
+
+def _load(db: Session, article_ids: List[int]) -> Dict[int, ArticleTimeline]:
+    """조문 메타 + 버전 (id, 시행일)을 LEFT JOIN 한 번(청크)으로 로드. 없는 조문은 결과에서 빠짐"""
+    meta: Dict[int, Tuple] = {}
+    rows: Dict[int, List[Tuple[int, Optional[str]]]] = {}
+    for i in range(0, len(article_ids), LOAD_CHUNK):
+        chunk = article_ids[i:i + LOAD_CHUNK]
+        stmt = (
+            select(
+                LawArticle.id, LawArticle.law_id_fk, LawArticle.article_no, LawArticle.title,
+                LawArticleVersion.id, LawArticleVersion.effective_date,
+            )
+            .outerjoin(LawArticleVersion, LawArticleVersion.article_id_fk == LawArticle.id)
+            .where(LawArticle.id.in_(chunk))
+        )
+        for aid, law_id, no, title, vid, eff in db.execute(stmt):
+            meta[aid] = (law_id, no, title)
+            versions = rows.setdefault(aid, [])
+            if vid is not None:
+                versions.append((vid, eff))
+    return {aid: ArticleTimeline(aid, rows[aid], *meta[aid]) for aid in meta}
+
+def get_timelines(db: Session, article_ids: Iterable[int]) -> Dict[int, ArticleTimeline]:
+    """캐시에 없는 조문만 모아 한 번(청크)에 로드. 없는 조문 id는 결과에 없음"""
+    _missing = object()
+    out: Dict[int, ArticleTimeline] = {}
+    misses: List[int] = []
+    for aid in dict.fromkeys(article_ids):
+        tl = timeline_cache.get(aid, _missing)
+        if tl is _missing:
+            misses.append(aid)
+        else:
+            out[aid] = tl
+    if misses:
+        for aid, tl in _load(db, misses).items():
+            timeline_cache.set(aid, tl)
+            out[aid] = tl
+    return out
+
+def get_timeline(db: Session, article_id: int) -> Optional[ArticleTimeline]:
+    return get_timelines(db, [article_id]).get(article_id)
+
+def invalidate(article_ids: Iterable[int] | None = None) -> None:
+    """버전이 추가/변경된 조문만 (None이면 전체) 캐시에서 제거"""
+    if article_ids is None:
+        timeline_cache.clear()
+        return
+    for aid in article_ids:
+        timeline_cache.invalidate(aid)
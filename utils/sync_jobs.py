@@ -0,0 +1,184 @@
+# utils/sync_jobs.py
+from __future__ import annotations
+
+import importlib
+import logging
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from database.connection import SessionLocal
+from models.knowledge_core import SyncJob
+from utils.cache import invalidate_source
+from utils.config import settings
+
+"""
+/admin/sync/* 백그라운드 실행기
+- POST는 SyncJob 행(status=queued)만 만들고 job_id를 즉시 반환
+- 스레드 풀 워커가 scripts/etl/<모듈>.run(db)을 요청 경로 밖에서 실행
+- 같은 source_key가 대기/실행 중이면 새 작업을 만들지 않고 기존 job_id를 돌려줌(중복 제거)
+- 진행 상황은 SyncJob 행(status/items_upserted/items_skipped/checksum/log) + 프로세스 내 단계 정보로 조회
+"""
+
+logger = logging.getLogger("worklaw.sync")
+
+# source_key → ETL 모듈 (모듈마다 run(db) -> (upserted, skipped, checksum, log))
+ETL_MODULES: dict[str, str] = {
+    "minwage": "scripts.etl.minwage_seed",
+    "holiday_api": "scripts.etl.holiday_api",
+    "law_api": "scripts.etl.law_api",
+    "interpretation_api": "scripts.etl.interpretation_api",
+    "moel_notice": "scripts.etl.moel_notice",
+}
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# 워커가 죽어 running으로 남은 행이 영구히 중복 제거에 걸리지 않도록
+STALE_AFTER = timedelta(hours=1)
+
+class SyncJobRunner:
+    def __init__(self, session_factory: Callable[[], Session], max_workers: int = 2):
+        self._session_factory = session_factory
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._active: dict[str, str] = {}          # source_key → job_id
+        self._progress: dict[str, dict] = {}       # job_id → {stage, t0, ...} (대기/실행 중인 작업만)
+        self.on_finished: list[Callable[[str], None]] = []
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="sync-job")
+        return self._executor
+
+    def submit(self, source_key: str) -> tuple[str, bool]:
+        """작업 등록. 반환: (job_id, 새로 만들었는지)"""
+        if source_key not in ETL_MODULES:
+            raise KeyError(source_key)
+        with self._lock:
+            job_id = self._active.get(source_key)
+            if job_id:
+                return job_id, False
+            db = self._session_factory()
+            try:
+                # 다른 워커 프로세스가 이미 돌리고 있는 작업도 DB에서 확인
+                existing = (
+                    db.query(SyncJob.job_id)
+                    .filter(
+                        SyncJob.source_key == source_key,
+                        SyncJob.status.in_(ACTIVE_STATUSES),
+                        SyncJob.started_at >= datetime.utcnow() - STALE_AFTER,
+                    )
+                    .order_by(SyncJob.started_at.desc())
+                    .first()
+                )
+                if existing:
+                    return existing.job_id, False
+                job_id = uuid.uuid4().hex
+                db.add(SyncJob(job_id=job_id, source_key=source_key, status="queued", started_at=datetime.utcnow()))
+                db.commit()
+            finally:
+                db.close()
+            self._active[source_key] = job_id
+            self._progress[job_id] = {"stage": "queued", "t0": time.monotonic()}
+        try:
+            self._pool().submit(self._run, job_id, source_key)
+        except RuntimeError:
+            # 종료 중인 풀 → 워커가 돌지 않으므로 진행 정보/중복 제거 항목을 남기지 않음
+            with self._lock:
+                self._active.pop(source_key, None)
+                self._progress.pop(job_id, None)
+            raise
+        return job_id, True
+
+    def _set_stage(self, job_id: str, stage: str) -> None:
+        p = self._progress.get(job_id)
+        if p is not None:
+            p["stage"] = stage
+
+    def _run(self, job_id: str, source_key: str) -> None:
+        db = self._session_factory()
+        try:
+            job = db.get(SyncJob, job_id)
+            job.status = "running"
+            job.started_at = datetime.utcnow()
+            db.commit()
+            self._set_stage(job_id, "running")
+
+            module = importlib.import_module(ETL_MODULES[source_key])
+            upserted, skipped, checksum, log = module.run(db)
+
+            job = db.get(SyncJob, job_id)
+            job.status = "success"
+            job.items_upserted = int(upserted or 0)
+            job.items_skipped = int(skipped or 0)
+            job.checksum = checksum
+            job.log = log
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            self._set_stage(job_id, "success")
+            logger.info("sync job %s (%s) success: %s", job_id, source_key, log)
+        except Exception:
+            db.rollback()
+            tb = traceback.format_exc()
+            logger.error("sync job %s (%s) failed:\n%s", job_id, source_key, tb)
+            job = db.get(SyncJob, job_id)
+            if job is not None:
+                job.status = "fail"
+                job.log = tb[-4000:]
+                job.finished_at = datetime.utcnow()
+                db.commit()
+            self._set_stage(job_id, "fail")
+        finally:
+            db.close()
+            with self._lock:
+                if self._active.get(source_key) == job_id:
+                    del self._active[source_key]
+                # 종료 상태는 sync_jobs 행에 기록됨 → 프로세스 내 진행 정보는 버림 (오래 도는 프로세스에서 쌓이지 않게)
+                self._progress.pop(job_id, None)
+            # 쓰기 완료 → 읽기 캐시/버전 무효화 (SyncJob checksum이 ETag 재료이므로 상태 갱신 후)
+            invalidate_source(source_key)
+            for cb in self.on_finished:
+                try:
+                    cb(source_key)
+                except Exception:
+                    logger.exception("sync job finish hook failed")
+
+    def status(self, db: Session, job_id: str) -> dict | None:
+        job = db.get(SyncJob, job_id)
+        if job is None:
+            return None
+        p = self._progress.get(job_id)
+        if job.finished_at and job.started_at:
+            elapsed = (job.finished_at - job.started_at).total_seconds()
+        elif p is not None:
+            elapsed = time.monotonic() - p["t0"]
+        else:
+            elapsed = None
+        return {
+            "job_id": job.job_id,
+            "source_key": job.source_key,
+            "status": job.status,
+            "stage": p["stage"] if p else job.status,
+            "started_at": job.started_at.isoformat() + "Z" if job.started_at else None,
+            "finished_at": job.finished_at.isoformat() + "Z" if job.finished_at else None,
+            "elapsed_sec": round(elapsed, 3) if elapsed is not None else None,
+            "items_upserted": job.items_upserted,
+            "items_skipped": job.items_skipped,
+            "checksum": job.checksum,
+            "log": job.log,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+# 앱 전역 실행기 (스레드 풀은 첫 작업 때 생성)
+sync_runner = SyncJobRunner(SessionLocal, max_workers=settings.SYNC_MAX_WORKERS)
@@ -0,0 +1,205 @@
+# utils/wage_check.py
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from utils.wage_table import MinimumWageTable
+
+"""
+최저임금 준수 일괄 계산 (NumPy 벡터 연산)
+- 입력: 행마다 (year, monthly_pay, contracted_hours, allowances)
+  · contracted_hours: 월 소정근로시간(+유급주휴 포함), 생략 시 209
+  · allowances: 최저임금 산입 수당(월), 생략 시 0
+- 계산: 시간급 환산 = (월급 + 산입수당) / 월 시간, 해당 연도 최저 시급과 비교
+  · required_monthly = 최저시급 × 월 시간, monthly_209h = 최저시급 × 209 (MinimumWageHistory.monthly_209h와 같은 환산)
+  · shortfall = max(0, required_monthly − (월급 + 산입수당))
+- 연도 → 최저시급은 utils.wage_table(메모리 테이블)을 연도 인덱스 배열로 펼쳐 한 번에 조회
+"""
+
+HOURS_209 = 209
+MAX_ROWS = 200_000
+COLUMNS = ("year", "monthly_pay", "contracted_hours", "allowances")
+OUT_COLUMNS = (
+    "index", "year", "monthly_pay", "allowances", "contracted_hours", "hourly_equivalent",
+    "minimum_hourly", "required_monthly", "monthly_209h", "shortfall", "violation", "error",
+)
+
+class InputError(ValueError):
+    pass
+
+def _to_arrays(years, pay, hours, allowances) -> Dict[str, np.ndarray]:
+    n = len(years)
+    if n > MAX_ROWS:
+        raise InputError(f"too many rows: {n} > {MAX_ROWS}")
+    try:
+        year_f = np.asarray(years, dtype=np.float64)
+        arr = {
+            "monthly_pay": np.asarray(pay, dtype=np.float64),
+            "contracted_hours": np.asarray(hours, dtype=np.float64),
+            "allowances": np.asarray(allowances, dtype=np.float64),
+        }
+    except (TypeError, ValueError) as e:
+        raise InputError(f"invalid number: {e}") from e
+    # 연도는 정수만 (2024.5 를 2024로 자르지 않음)
+    if not np.all(np.isfinite(year_f) & (year_f == np.floor(year_f))):
+        raise InputError("year must be an integer")
+    arr["year"] = year_f.astype(np.int64)
+    # NaN/inf 는 행 단위 오류로 (compute), 음수는 요청 전체 오류
+    for c in ("monthly_pay", "allowances"):
+        v = arr[c]
+        if np.any(np.isfinite(v) & (v < 0)):
+            raise InputError("monthly_pay/allowances must be >= 0")
+    return arr
+
+def arrays_from_rows(rows: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """JSON 행 목록 → 열 배열"""
+    try:
+        years = [r["year"] for r in rows]
+        pay = [r["monthly_pay"] for r in rows]
+    except (KeyError, TypeError) as e:
+        raise InputError(f"each row needs year and monthly_pay: missing {e}") from e
+    # 생략(None)일 때만 기본값. 0 은 그대로 두어 CSV 경로와 같이 검증
+    hours = [HOURS_209 if r.get("contracted_hours") is None else r["contracted_hours"] for r in rows]
+    allowances = [0 if r.get("allowances") is None else r["allowances"] for r in rows]
+    return _to_arrays(years, pay, hours, allowances)
+
+def _decode_csv(data: bytes) -> str:
+    # 한글 Excel 기본 저장 형식(CP949/EUC-KR)도 받음
+    for enc in ("utf-8-sig", "cp949"):
+        try:
+            return data.decode(enc)
+        except UnicodeDecodeError:
+            continue
+    raise InputError("CSV must be UTF-8 or CP949 (EUC-KR) encoded")
+
+def arrays_from_csv(data: bytes) -> Dict[str, np.ndarray]:
+    """헤더가 있는 CSV(year,monthly_pay[,contracted_hours][,allowances]) → 열 배열 (UTF-8, 안 되면 CP949)"""
+    text = _decode_csv(data)
+    reader = csv.reader(io.StringIO(text))
+    try:
+        header = [h.strip().lower() for h in next(reader)]
+    except StopIteration:
+        raise InputError("empty CSV")
+    if "year" not in header or "monthly_pay" not in header:
+        raise InputError("CSV header must include year and monthly_pay")
+    idx = {c: header.index(c) for c in COLUMNS if c in header}
+    cols: Dict[str, List[str]] = {c: [] for c in idx}
+    for row in reader:
+        if not row:
+            continue
+        for c, i in idx.items():
+            cols[c].append(row[i] if i < len(row) else "")
+    n = len(cols["year"])
+    hours = [v or HOURS_209 for v in cols["contracted_hours"]] if "contracted_hours" in cols else [HOURS_209] * n
+    allowances = [v or 0 for v in cols["allowances"]] if "allowances" in cols else [0] * n
+    return _to_arrays(cols["year"], cols["monthly_pay"], hours, allowances)
+
+def compute(table: MinimumWageTable, arr: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """벡터 계산. 연도가 테이블에 없거나 시간이 0 이하거나 NaN/inf 값이면 error 표시(위반 판단 안 함)"""
+    years = arr["year"]
+    hours = arr["contracted_hours"]
+    total = arr["monthly_pay"] + arr["allowances"]
+
+    # 연도 → 최저시급: [최소연도..최대연도] 밀집 배열로 펼쳐 인덱싱 (없는 연도 0)
+    lo, hi = (int(years.min()), int(years.max())) if len(years) else (0, -1)
+    known = [y for y in table.years() if lo <= y <= hi]
+    if known:
+        base = known[0]
+        lut = np.zeros(known[-1] - base + 1, dtype=np.float64)
+        for y in known:
+            lut[y - base] = table.get(y)[1]
+        pos = years - base
+        in_range = (pos >= 0) & (pos < len(lut))
+        min_hourly = np.where(in_range, lut[np.clip(pos, 0, len(lut) - 1)], 0.0)
+    else:
+        min_hourly = np.zeros(len(years), dtype=np.float64)
+
+    not_finite = ~(np.isfinite(arr["monthly_pay"]) & np.isfinite(arr["allowances"]) & np.isfinite(hours))
+    unknown_year = min_hourly <= 0
+    bad_hours = hours <= 0
+    ok = ~(unknown_year | bad_hours | not_finite)
+
+    safe_hours = np.where(bad_hours | not_finite, 1.0, hours)
+    hourly = np.round(total / safe_hours, 2)
+    required = np.round(min_hourly * hours)
+    shortfall = np.where(ok, np.maximum(0.0, required - total), 0.0)
+
+    error = np.full(len(years), "", dtype=object)
+    error[unknown_year] = "unknown year"
+    error[bad_hours] = "contracted_hours must be > 0"
+    error[not_finite] = "monthly_pay/contracted_hours/allowances must be finite numbers"
+    return {
+        **arr,
+        "hourly_equivalent": hourly,
+        "minimum_hourly": min_hourly,
+        "required_monthly": required,
+        "monthly_209h": min_hourly * HOURS_209,
+        "shortfall": shortfall,
+        # 반올림한 hourly 가 아니라 shortfall(원 단위)로 판단 → 두 값이 항상 일치
+        "violation": ok & (shortfall > 0),
+        "ok": ok,
+        "error": error,
+    }
+
+def summary(result: Dict[str, np.ndarray]) -> Dict[str, int]:
+    return {
+        "rows": int(len(result["year"])),
+        "violations": int(result["violation"].sum()),
+        "errors": int((~result["ok"]).sum()),
+    }
+
+def _num(v: float):
+    # 정수면 정수로 (JSON/CSV 모두 보기 좋게), NaN/inf 는 None (JSON에 NaN을 내보내지 않음)
+    v = float(v)
+    if not np.isfinite(v):
+        return None
+    return int(v) if v.is_integer() else v
+
+def _records(result: Dict[str, np.ndarray], start: int, stop: int) -> Iterator[Dict[str, Any]]:
+    cols = {k: result[k][start:stop].tolist() for k in OUT_COLUMNS if k in result}
+    ok = result["ok"][start:stop].tolist()
+    for j in range(stop - start):
+        good = ok[j]
+        yield {
+            "index": start + j,
+            "year": cols["year"][j],
+            "monthly_pay": _num(cols["monthly_pay"][j]),
+            "allowances": _num(cols["allowances"][j]),
+            "contracted_hours": _num(cols["contracted_hours"][j]),
+            "hourly_equivalent": cols["hourly_equivalent"][j] if good else None,
+            "minimum_hourly": _num(cols["minimum_hourly"][j]) if good else None,
+            "required_monthly": _num(cols["required_monthly"][j]) if good else None,
+            "monthly_209h": _num(cols["monthly_209h"][j]) if good else None,
+            "shortfall": _num(cols["shortfall"][j]) if good else None,
+            "violation": cols["violation"][j] if good else None,
+            "error": cols["error"][j] or None,
+        }
+
+def iter_ndjson(result: Dict[str, np.ndarray], chunk: int = 2000) -> Iterator[bytes]:
+    """한 줄에 한 행(JSON). chunk 행씩 묶어 전송"""
+    n = len(result["year"])
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        yield "".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in _records(result, start, stop)
+        ).encode("utf-8")
+
+def iter_csv(result: Dict[str, np.ndarray], chunk: int = 2000) -> Iterator[bytes]:
+    n = len(result["year"])
+    buf = io.StringIO()
+    w = csv.writer(buf)
+    w.writerow(OUT_COLUMNS)
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        for r in _records(result, start, stop):
+            w.writerow(["" if r[c] is None else r[c] for c in OUT_COLUMNS])
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if n == 0:
+        yield buf.getvalue().encode("utf-8")
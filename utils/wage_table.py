@@ -0,0 +1,98 @@
+# utils/wage_table.py
+from __future__ import annotations
+
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from models.wage import MinimumWage
+
+"""
+연도 → 최저임금 조회 테이블 (메모리, 불변)
+- 행이 수십 개뿐이므로 통째로 메모리에 올려 조회 시 DB를 타지 않음
+- 새 테이블을 만든 뒤 전역 참조 한 번 교체 → 읽는 쪽은 락 없이 항상 완전한 테이블을 봄
+- 앱 시작 시 로드, /admin/metadata/minimum-wage 커밋 후 재빌드
+- 다른 워커 프로세스의 변경은 max_age(초)가 지나면 다음 조회에서 다시 읽어 반영 (0이면 끔)
+"""
+
+Entry = Tuple[int, int, str]  # (year, amount, unit)
+
+class MinimumWageTable:
+    __slots__ = ("_by_year", "latest", "loaded_at")
+
+    def __init__(self, rows: Dict[int, Entry], loaded_at: float):
+        self._by_year = MappingProxyType(dict(rows))  # 읽기 전용 뷰
+        self.latest: Optional[Entry] = rows[max(rows)] if rows else None
+        self.loaded_at = loaded_at
+
+    def __len__(self) -> int:
+        return len(self._by_year)
+
+    def years(self) -> Tuple[int, ...]:
+        return tuple(sorted(self._by_year))
+
+    def get(self, year: int) -> Optional[Entry]:
+        """정확히 그 연도만"""
+        return self._by_year.get(year)
+
+    def resolve(self, year: int) -> Optional[Entry]:
+        """그 연도, 없으면 최신 연도"""
+        return self._by_year.get(year) or self.latest
+
+def build_table(db: Session) -> MinimumWageTable:
+    rows = db.execute(select(MinimumWage.year, MinimumWage.amount, MinimumWage.unit)).all()
+    return MinimumWageTable(
+        {int(y): (int(y), int(a), u or "KRW/hour") for y, a, u in rows},
+        time.monotonic(),
+    )
+
+_table: Optional[MinimumWageTable] = None
+_reload_lock = threading.Lock()
+
+def reload(db: Session | None = None, session_factory: Callable[[], Session] | None = None) -> MinimumWageTable:
+    """DB에서 새 테이블을 만들어 원자적으로 교체"""
+    global _table
+    with _reload_lock:
+        if db is not None:
+            table = build_table(db)
+        else:
+            if session_factory is None:
+                from database.connection import ReadSessionLocal as session_factory
+            s = session_factory()
+            try:
+                table = build_table(s)
+            finally:
+                s.close()
+        _table = table
+    return table
+
+def _default_max_age() -> float:
+    from utils.config import settings
+    return settings.MINIMUM_WAGE_TABLE_MAX_AGE
+
+def current(max_age: float | None = None) -> Optional[MinimumWageTable]:
+    """로드 없이 현재 테이블 한 번 읽기 (없거나 max_age 초과면 None). 요청은 이 객체 하나만 계속 사용"""
+    table = _table
+    if max_age is None:
+        max_age = _default_max_age()
+    if table is None or (max_age > 0 and time.monotonic() - table.loaded_at > max_age):
+        return None
+    return table
+
+def needs_reload(max_age: float | None = None) -> bool:
+    return current(max_age) is None
+
+def get_table(max_age: float | None = None) -> MinimumWageTable:
+    """현재 테이블 (없거나 max_age 초과면 다시 로드). 확인과 반환이 같은 객체"""
+    table = current(max_age)
+    return table if table is not None else reload()
+
+async def get_table_async(max_age: float | None = None) -> MinimumWageTable:
+    """요청 경로용 get_table: 다시 로드해야 하면 항상 스레드풀에서 (이벤트 루프에서 DB를 읽지 않음)"""
+    table = current(max_age)
+    return table if table is not None else await run_in_threadpool(reload)